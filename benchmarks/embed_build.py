@@ -0,0 +1,109 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+# Times EmbedConstructor.build against the build it replaced, on a six field group overview for a member with eight
+# roles. Run from the repository root with `python -m benchmarks.embed_build`.
+
+import timeit
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import hikari
+
+from solaris.utils import DEFAULT_EMBED_COLOUR
+from solaris.utils.embed import EmbedConstructor
+
+RUNS = 20_000
+REPEATS = 5
+ROLES = 8
+FIELDS = 6
+
+
+def previous_build(bot, **kwargs):
+    # EmbedConstructor.build before the top role was only looked up once, and the timestamp taken in UTC.
+    ctx = kwargs.get("ctx")
+
+    embed = hikari.Embed(
+        title=kwargs.get("title"),
+        description=kwargs.get("description"),
+        colour=(
+            kwargs.get("colour")
+            or (ctx.member.get_top_role().color if ctx and ctx.member.get_top_role().color else None)
+            or DEFAULT_EMBED_COLOUR
+        ),
+        timestamp=datetime.now().astimezone(),
+    )
+
+    embed.set_author(name=kwargs.get("header", "Solaris"))
+    embed.set_footer(
+        text=kwargs.get("footer", f"Invoked by {ctx.author.username}" if ctx else r"\o/"),
+        icon=ctx.author.avatar_url if ctx else bot.get_me().avatar_url,
+    )
+
+    if thumbnail := kwargs.get("thumbnail"):
+        embed.set_thumbnail(thumbnail)
+
+    if image := kwargs.get("image"):
+        embed.set_image(image)
+
+    for name, value, inline in kwargs.get("fields", ()):
+        embed.add_field(name=name, value=value, inline=inline)
+
+    return embed
+
+
+class Member:
+    def __init__(self, roles):
+        self.roles = roles
+
+    def get_top_role(self):
+        # Sorts on every call, the same as hikari's.
+        return sorted(self.roles, key=lambda r: r.position, reverse=True)[0]
+
+
+def main():
+    avatar = hikari.URL("https://cdn.discordapp.com/embed/avatars/0.png")
+    ctx = SimpleNamespace(
+        member=Member([SimpleNamespace(position=i, color=hikari.Color(i * 1000)) for i in range(ROLES)]),
+        author=SimpleNamespace(username="someone", avatar_url=avatar),
+    )
+    bot = SimpleNamespace(get_me=lambda: SimpleNamespace(avatar_url=avatar))
+    kwargs = dict(
+        ctx=ctx,
+        header="Tags",
+        thumbnail="https://cdn.discordapp.com/embed/avatars/1.png",
+        description="There are a few different tag methods you can use.",
+        fields=tuple(
+            (f"Command{i}", f"Description of command{i}. For more infomation, use `+help tags command{i}`", False)
+            for i in range(FIELDS)
+        ),
+    )
+    current = EmbedConstructor(bot)
+
+    for label, build in (
+        ("previous", lambda: previous_build(bot, **kwargs)),
+        ("current", lambda: current.build(**kwargs)),
+    ):
+        best = min(timeit.repeat(build, number=RUNS, repeat=REPEATS)) / RUNS
+        print(f"{label:>8}: {best * 1e6:.1f} us per embed")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,12 +30,18 @@ import hikari
 import lightbulb
 import datetime as dt
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from pytz import utc
 
 from solaris import Config, utils
 from solaris.db import Database
 
 EMOJI_GUILD = None
+# The application rarely changes, so it's fetched at startup and only refreshed this often.
+APPLICATION_REFRESH_INTERVAL = dt.timedelta(hours=6)
+# Until it's been fetched at least once, it's retried much sooner than that.
+APPLICATION_RETRY_INTERVAL = dt.timedelta(minutes=1)
 
 class Bot(lightbulb.BotApp):
     
@@ -48,12 +54,18 @@ class Bot(lightbulb.BotApp):
         self.scheduler = AsyncIOScheduler()
         self.scheduler.configure(timezone=utc)
         self.db = Database(self)
+        self.jobs = utils.ModerationJobs(self)
+        self.modlog = utils.ActionLog(self)
 
         self.embed = utils.EmbedConstructor(self)
         #self.emoji = utils.EmojiGetter(self) Note: emoji.py or EmojiGetter() class is not rewritten
         self.loc = utils.CodeCounter()
+        self.menus = utils.MenuRouter(self)
         self.presence = utils.PresenceSetter(self)
         self.ready = utils.Ready(self)
+        self._application = None
+        # Bumped whenever extensions are (un)loaded, so anything derived from the command tree knows to rebuild.
+        self.command_tree_version = 0
 
         self.loc.count()
 
@@ -73,6 +85,8 @@ class Bot(lightbulb.BotApp):
         self.event_manager.subscribe(hikari.StoppingEvent, self.on_stopping)
         self.event_manager.subscribe(hikari.ShardConnectedEvent, self.on_shard_connected)
         self.event_manager.subscribe(hikari.ShardDisconnectedEvent, self.on_shard_disconnected)
+        self.event_manager.subscribe(hikari.InteractionCreateEvent, self.menus.on_interaction)
+        self.event_manager.subscribe(hikari.ReactionAddEvent, self.menus.on_reaction)
         
         super().run(
             activity=hikari.Activity(
@@ -82,6 +96,16 @@ class Bot(lightbulb.BotApp):
         )
 
 
+    def load_extensions(self, *extensions: str) -> None:
+        super().load_extensions(*extensions)
+        self.command_tree_version += 1
+
+
+    def unload_extensions(self, *extensions: str) -> None:
+        super().unload_extensions(*extensions)
+        self.command_tree_version += 1
+
+
     async def prefix(self, guild_id):
         if guild_id is not None:
             return await self.db.field("SELECT Prefix FROM system WHERE GuildID = ?", guild_id)
@@ -105,6 +129,9 @@ class Bot(lightbulb.BotApp):
             print(f" • {ext} extension loaded")
 
         self.emoji_guild = await self.rest.fetch_guild(Config.HUB_GUILD_ID)
+
+        await self.refresh_application()
+        self.scheduler.add_job(self.refresh_application, IntervalTrigger(seconds=APPLICATION_REFRESH_INTERVAL.total_seconds()))
         
         print("Setup complete.")
 
@@ -128,6 +155,9 @@ class Bot(lightbulb.BotApp):
             self.ready.synced = True
             print(" Synchronised database.")
 
+            missed = await self.jobs.arm()
+            print(f" Armed moderation jobs ({missed:,} missed while offline).")
+
             self.ready.booted = True
             print(" Bot booted. Don't use CTRL+C to shut the bot down!")
 
@@ -137,6 +167,26 @@ class Bot(lightbulb.BotApp):
         print("Bot Ready!")
 
 
+    async def refresh_application(self) -> None:
+        try:
+            self._application = await self.rest.fetch_application()
+        except hikari.HTTPError as error:
+            # The previous copy is still good enough until the next refresh.
+            print(f"Could not fetch the application ({error.__class__.__name__}).")
+
+            if self._application is None:
+                self.scheduler.add_job(
+                    self.refresh_application, DateTrigger(dt.datetime.now(utc) + APPLICATION_RETRY_INTERVAL)
+                )
+
+    async def ensure_application(self):
+        # For anything that can't go without it. Raises if it still can't be fetched.
+        if self._application is None:
+            self._application = await self.rest.fetch_application()
+
+        return self._application
+
+
     async def on_stopping(self, event: hikari.StoppingEvent) -> None:
 
         print("Shutting down...")
@@ -144,6 +194,9 @@ class Bot(lightbulb.BotApp):
         self.scheduler.shutdown()
         print(" Shut down scheduler.")
 
+        await self.modlog.flush()
+        print(" Flushed moderation log.")
+
         await self.db.close()
         print(" Closed database connection.")
 
@@ -179,6 +232,14 @@ class Bot(lightbulb.BotApp):
                 commands.append(cmd)
         return len(commands)
 
+    @property
+    def application(self):
+        return self._application
+
+    @property
+    def owner_id(self):
+        return self._application.owner.id if self._application is not None else None
+
     @property
     def admin_invite(self):
         return utils.oauth_url(self.client_id, permissions=hikari.Permissions.ADMINISTRATOR)
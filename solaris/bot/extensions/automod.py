@@ -0,0 +1,287 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+import time
+import datetime as dt
+from collections import namedtuple
+
+import hikari
+import lightbulb
+from lightbulb import commands
+from apscheduler.triggers.cron import CronTrigger
+
+from solaris.utils import checks, overview, ratelimit
+
+MESSAGE_WINDOW = 5
+CHANNEL_WINDOW = 5
+DUPLICATE_WINDOW = 30
+MENTION_WINDOW = 30
+# How long a member is left alone after being actioned, so one burst isn't punished once per message.
+ACTION_COOLDOWN = 60
+CHANNEL_SLOWMODE = 10
+CHANNEL_FLOOD = "Channel flood"
+
+AutomodConfig = namedtuple(
+    "AutomodConfig", ("message_limit", "channel_limit", "duplicate_limit", "mention_limit", "timeout")
+)
+
+# Setting name: (column, minimum, maximum, description)
+SETTINGS = {
+    "messages": ("MessageLimit", 3, 50, f"Messages a member may send in {MESSAGE_WINDOW} seconds"),
+    "channel": ("ChannelLimit", 5, 200, f"Messages a channel may receive in {CHANNEL_WINDOW} seconds before slowmode"),
+    "duplicates": ("DuplicateLimit", 2, 20, f"Identical messages a member may send in a row within {DUPLICATE_WINDOW} seconds"),
+    "mentions": ("MentionLimit", 3, 100, f"Mentions a member may make in {MENTION_WINDOW} seconds"),
+    "timeout": ("TimeoutMinutes", 1, 1440, "Minutes a member is timed out for when they trip a limit"),
+}
+
+
+automod = lightbulb.plugins.Plugin(
+    name="Automod",
+    description="Automatically deals with message spam, floods, and mass mentions.",
+    include_datastore=True
+)
+
+
+async def load_config(guild_id=None):
+    query = "SELECT GuildID, MessageLimit, ChannelLimit, DuplicateLimit, MentionLimit, TimeoutMinutes FROM automod"
+    if guild_id is None:
+        records = await automod.bot.db.records(query)
+    else:
+        automod.d.guilds.pop(guild_id, None)
+        records = await automod.bot.db.records(f"{query} WHERE GuildID = ?", guild_id)
+
+    for guild_id, *config in records:
+        automod.d.guilds[guild_id] = AutomodConfig(*config)
+
+
+def evict():
+    # The counters are fixed-size, so only the cooldowns ever need clearing out.
+    now = time.monotonic()
+    automod.d.actioned = {key: until for key, until in automod.d.actioned.items() if until > now}
+
+
+@automod.listener(hikari.StartedEvent)
+async def on_started(event: hikari.StartedEvent):
+    if not automod.bot.ready.booted:
+        automod.bot.ready.up(automod)
+
+    automod.d.configurable: bool = False
+    automod.d.image = "https://cdn.discordapp.com/attachments/991572493267636275/991586267630403604/siren.png"
+    automod.d.users = ratelimit.SlidingWindow(MESSAGE_WINDOW)
+    automod.d.channels = ratelimit.SlidingWindow(CHANNEL_WINDOW)
+    automod.d.repeats = ratelimit.RepeatCounter(DUPLICATE_WINDOW)
+    automod.d.mentions = ratelimit.SlidingWindow(MENTION_WINDOW)
+    automod.d.actioned = {}
+    automod.d.guilds = {}
+
+    await load_config()
+    automod.bot.scheduler.add_job(evict, CronTrigger(second=30))
+
+
+def inspect(config, message, now):
+    # This runs for every message in every guild with automod on, so it only touches the in-memory counters. Every
+    # counter is hit for every message, so none of them undercounts while another one is tripping.
+    user_key = message.guild_id << 64 | message.author.id
+    messages = automod.d.users.hit(user_key, now)
+    flooded = (
+        automod.d.channels.hit(message.channel_id, now) > config.channel_limit
+        and automod.d.actioned.get(message.channel_id, 0) <= now
+    )
+    repeats = automod.d.repeats.hit(user_key, hash(message.content), now) if message.content else 0
+    mentions = (
+        automod.d.mentions.hit(user_key, now, count)
+        if (count := len(message.user_mentions or ()) + len(message.role_mention_ids or ()))
+        else 0
+    )
+
+    if messages > config.message_limit:
+        return "Sending messages too quickly", flooded
+
+    if repeats >= config.duplicate_limit:
+        return "Repeating the same message", flooded
+
+    if mentions > config.mention_limit:
+        return "Mentioning too many members", flooded
+
+    return None, flooded
+
+
+@automod.listener(hikari.GuildMessageCreateEvent)
+async def on_guild_message_create(event: hikari.GuildMessageCreateEvent):
+    if (guilds := automod.d.get("guilds")) is None or (config := guilds.get(event.guild_id)) is None or event.is_bot:
+        return
+
+    reason, flooded = inspect(config, event.message, now := time.monotonic())
+
+    # A channel that's already slowed still has its members checked, so a raid can't hide behind the slowmode.
+    if flooded:
+        await slow_channel(event, now)
+
+    if reason is not None:
+        await punish(event, config, reason, now)
+
+
+async def slow_channel(event, now):
+    automod.d.actioned[event.channel_id] = now + ACTION_COOLDOWN
+
+    # Only text channels have a slowmode. News channels and voice channel chats are still counted, just never slowed.
+    if not isinstance(channel := event.get_channel(), hikari.GuildTextChannel):
+        return
+
+    if channel.rate_limit_per_user.total_seconds() >= CHANNEL_SLOWMODE:
+        return
+
+    try:
+        await channel.edit(rate_limit_per_user=CHANNEL_SLOWMODE, reason=f"Automod: {CHANNEL_FLOOD}")
+    except hikari.HTTPError:
+        return
+
+    automod.bot.modlog.record(event.guild_id, automod.bot.get_me().id, "slowmode", channel_id=event.channel_id, reason=f"Automod: {CHANNEL_FLOOD}")
+
+
+async def punish(event, config, reason, now):
+    member = event.member
+    key = event.guild_id << 64 | event.author_id
+
+    # Anyone who can manage messages is trusted to be spamming on purpose.
+    if member is None or lightbulb.utils.permissions_for(member) & hikari.Permissions.MANAGE_MESSAGES:
+        return
+
+    try:
+        await event.message.delete()
+    except hikari.HTTPError:
+        pass
+
+    if automod.d.actioned.get(key, 0) > now:
+        return
+
+    automod.d.actioned[key] = now + ACTION_COOLDOWN
+
+    try:
+        await member.edit(
+            communication_disabled_until=dt.datetime.now(dt.timezone.utc) + dt.timedelta(minutes=config.timeout),
+            reason=f"Automod: {reason}",
+        )
+    except hikari.HTTPError:
+        return
+
+    automod.bot.modlog.record(event.guild_id, automod.bot.get_me().id, "timeout", event.author_id, reason=f"Automod: {reason}")
+
+
+@automod.command()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.command(name="automod", description="Configures automatic spam protection. Use the command for information on available subcommands.")
+@lightbulb.implements(commands.prefix.PrefixCommandGroup)
+async def automod_group(ctx: lightbulb.context.base.Context):
+    await overview.group_overview(
+        ctx,
+        header="Automod",
+        thumbnail=automod.d.image,
+        description="Automod deletes spam and times out whoever sent it, and slows down flooded channels.",
+    )
+
+
+@automod_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(checks.author_can_configure())
+@lightbulb.add_checks(lightbulb.bot_has_guild_permissions(hikari.Permissions.MANAGE_MESSAGES, hikari.Permissions.MODERATE_MEMBERS, hikari.Permissions.MANAGE_CHANNELS))
+@lightbulb.command(name="enable", description="Turns automod on for this server.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def automod_enable_command(ctx: lightbulb.context.base.Context):
+    if ctx.guild_id in automod.d.guilds:
+        return await ctx.respond(f"{ctx.bot.info} Automod is already enabled.")
+
+    await ctx.bot.db.execute("INSERT OR IGNORE INTO automod (GuildID) VALUES (?)", ctx.guild_id)
+    await load_config(ctx.guild_id)
+    await ctx.respond(f"{ctx.bot.tick} Automod has been enabled.")
+
+
+@automod_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(checks.author_can_configure())
+@lightbulb.command(name="disable", description="Turns automod off for this server. Settings are forgotten.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def automod_disable_command(ctx: lightbulb.context.base.Context):
+    if ctx.guild_id not in automod.d.guilds:
+        return await ctx.respond(f"{ctx.bot.info} Automod is not enabled.")
+
+    await ctx.bot.db.execute("DELETE FROM automod WHERE GuildID = ?", ctx.guild_id)
+    automod.d.guilds.pop(ctx.guild_id, None)
+    await ctx.respond(f"{ctx.bot.tick} Automod has been disabled.")
+
+
+@automod_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(checks.author_can_configure())
+@lightbulb.command(name="settings", description="Shows this server's automod limits.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def automod_settings_command(ctx: lightbulb.context.base.Context):
+    if (config := automod.d.guilds.get(ctx.guild_id)) is None:
+        return await ctx.respond(f"{ctx.bot.info} Automod is not enabled.")
+
+    await ctx.respond(
+        embed=ctx.bot.embed.build(
+            ctx=ctx,
+            header="Automod",
+            thumbnail=automod.d.image,
+            description="Use `automod set <setting> <value>` to change a limit.",
+            fields=tuple(
+                (f"{name.title()}: {value:,}", description, False)
+                for (name, (_, _, _, description)), value in zip(SETTINGS.items(), config)
+            ),
+        )
+    )
+
+
+@automod_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(checks.author_can_configure())
+@lightbulb.option(name="value", description="The new limit.", type=int, required=True)
+@lightbulb.option(name="setting", description="The limit to change.", type=str, required=True)
+@lightbulb.command(name="set", description="Changes one of this server's automod limits.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def automod_set_command(ctx: lightbulb.context.base.Context):
+    if ctx.guild_id not in automod.d.guilds:
+        return await ctx.respond(f"{ctx.bot.info} Automod is not enabled.")
+
+    if (setting := SETTINGS.get(ctx.options.setting.lower())) is None:
+        return await ctx.respond(
+            f"{ctx.bot.cross} That setting does not exist. Valid settings are: {', '.join(f'`{s}`' for s in SETTINGS)}."
+        )
+
+    column, minimum, maximum, _ = setting
+    if not minimum <= ctx.options.value <= maximum:
+        return await ctx.respond(
+            f"{ctx.bot.cross} That value is outside valid bounds - it should be between `{minimum:,}` and `{maximum:,}` inclusive."
+        )
+
+    await ctx.bot.db.execute(f"UPDATE automod SET {column} = ? WHERE GuildID = ?", ctx.options.value, ctx.guild_id)
+    await load_config(ctx.guild_id)
+    await ctx.respond(f"{ctx.bot.tick} The `{ctx.options.setting.lower()}` limit has been set to `{ctx.options.value:,}`.")
+
+
+def load(bot) -> None:
+    bot.add_plugin(automod)
+
+def unload(bot) -> None:
+    bot.remove_plugin(automod)
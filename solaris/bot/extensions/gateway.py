@@ -31,7 +31,7 @@ from apscheduler.triggers.cron import CronTrigger
 from lightbulb import commands
 
 from solaris import Config
-from solaris.utils import checks, chron, string, trips
+from solaris.utils import checks, chron, overview, string, trips
 
 MODULE_NAME = "gateway"
 
@@ -514,34 +514,18 @@ async def on_raw_reaction_add(event: hikari.GuildReactionAddEvent):
 @lightbulb.command(name="synchronise", aliases=["synchronize", "sync"], description="Synchronise the gateway module. Use the command for information on available subcommands.",)
 @lightbulb.implements(commands.prefix.PrefixCommandGroup)
 async def synchronise_group(ctx: lightbulb.context.base.Context) -> None:
-    cmds = []
-    prefix = await ctx.bot.prefix(ctx.guild_id)
-    cmds_list = sorted(ctx.command.subcommands.values(), key=lambda c: c.name)
-    for cmd in cmds_list:
-        if cmd not in cmds:
-            cmds.append(cmd)
-
-    await ctx.respond(
-        embed=ctx.bot.embed.build(
-            ctx=ctx,
-            header="Synchronise",
-            description="There are a few different syncing methods you can use.",
-            fields=(
-                *(
-                    (
-                        cmd.name.title(),
-                        f"{cmd.description} For more infomation, use `{prefix}help synchronise {cmd.name}`",
-                        False,
-                    )
-                    for cmd in (*cmds[1:], cmds[0])  # Order them properly.
-                ),
-                (
-                    "Why does the module need synchronising?",
-                    "Generally speaking, it will not 99% of the time, especially as Solaris performs an automatic synchronisation on start-up. However, due to the complexity of the systems used, and measures taken to make sure there are no database conflicts, it can fall out of sync sometimes. This command is the solution to that problem.",
-                    False,
-                ),
+    await overview.group_overview(
+        ctx,
+        header="Synchronise",
+        description="There are a few different syncing methods you can use.",
+        key=lambda c: (c.name == "everything", c.name),  # Order them properly.
+        fields=(
+            (
+                "Why does the module need synchronising?",
+                "Generally speaking, it will not 99% of the time, especially as Solaris performs an automatic synchronisation on start-up. However, due to the complexity of the systems used, and measures taken to make sure there are no database conflicts, it can fall out of sync sometimes. This command is the solution to that problem.",
+                False,
             ),
-        )
+        ),
     )
 
 
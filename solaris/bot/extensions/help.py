@@ -25,10 +25,12 @@ import hikari
 import lightbulb
 from lightbulb import commands
 
+import asyncio
+import inspect
 import typing as t
 import datetime as dt
 
-from collections import defaultdict
+from collections import namedtuple
 
 from solaris.utils import checks, chron, converters, menu, modules, string
 
@@ -59,17 +61,15 @@ class ConfigHelpMenu(menu.NumberedSelectionMenu):
     async def display_help(bot_help, module):
         prefix = await bot_help.bot.prefix(bot_help.ctx.get_guild().id)
 
-        await bot_help.message.remove_all_reactions()
-        await bot_help.message.edit(
-            embed=bot_help.bot.embed.build(
-                ctx=bot_help.ctx,
-                header="Help",
-                title=f"Configuration help for {module}",
-                description=(
+        await bot_help.switch(
+            {
+                "header": "Help",
+                "title": f"Configuration help for {module}",
+                "description": (
                     bot_help.bot.get_plugin(list(filter(lambda c: bot_help.bot.get_plugin(c.title()).name.lower() == module, bot_help.bot._extensions)).pop().title()).description
                 ),
-                thumbnail=bot_help.bot.get_me().avatar_url,
-                fields=(
+                "thumbnail": bot_help.bot.get_me().avatar_url,
+                "fields": (
                     (
                         (doc := func.__doc__.split("\n", maxsplit=1))[0],
                         f"{doc[1]}\n`{prefix}config {module} {name[len(module)+2:]}`",
@@ -78,7 +78,8 @@ class ConfigHelpMenu(menu.NumberedSelectionMenu):
                     for name, func in filter(lambda f: module in f[0], modules.config.__dict__.items())
                     if not name.startswith("_")
                 ),
-            )
+            },
+            remove_all_reactions=True,
         )
 
 
@@ -96,61 +97,115 @@ async def on_started(event: hikari.StartedEvent) -> None:
 
     bot_help.d.configurable: bool = False
     bot_help.d.image = "https://cdn.discordapp.com/attachments/991572493267636275/991577135225516092/user-guide.png"
+    command_index(bot_help.bot)
 
 
-async def basic_syntax(ctx, cmd, prefix):
-    try:
-        await cmd.evaluate_checks(ctx)
-        return f"{prefix}{cmd.name}" if cmd.parent is None else f"  ↳ {cmd.name}"
-    except lightbulb.errors.CheckFailure:
-        return f"{prefix}{cmd.name} (✗)" if cmd.parent is None else f"  ↳ {cmd.name} (✗)"
+HelpEntry = namedtuple("HelpEntry", ("command", "module", "invocations", "usage"))
+HelpIndex = namedtuple("HelpIndex", ("version", "modules", "lookup"))
 
 
-def full_syntax(ctx, cmd, prefix):
+def help_entry(cmd, module):
     invokations = "|".join([cmd.name, *cmd.aliases])
+
     if (p := cmd.parent) is None:
-        return f"```{prefix}{invokations} {cmd.signature.replace(cmd.name, '')}```"
-    else:
-        p_invokations = "|".join([p.name, *p.aliases])
-        return f"```{prefix}{p_invokations} {invokations} {cmd.signature.replace(f'{p.name} {cmd.name}', '')}```"
+        return HelpEntry(
+            cmd, module, [n.lower() for n in (cmd.name, *cmd.aliases)], f"{invokations} {cmd.signature.replace(cmd.name, '')}"
+        )
+
+    p_invokations = "|".join([p.name, *p.aliases])
+    return HelpEntry(
+        cmd,
+        module,
+        [f"{pn} {n}".lower() for pn in (p.name, *p.aliases) for n in (cmd.name, *cmd.aliases)],
+        f"{p_invokations} {invokations} {cmd.signature.replace(f'{p.name} {cmd.name}', '')}",
+    )
+
+
+def build_index(bot):
+    modules_ = {}
+    lookup = {}
+
+    for extension in bot._extensions:
+        if (plugin := bot.get_plugin(extension.title())) is None:
+            continue
+
+        entries = []
+        for cmd in plugin.all_commands:
+            if isinstance(cmd, (lightbulb.commands.prefix.PrefixCommand, lightbulb.commands.prefix.PrefixCommandGroup)):
+                entries.append(help_entry(cmd, extension))
+                # Aliases map to the same subcommand, so this keeps one of each, in order.
+                entries.extend(help_entry(c, extension) for c in dict.fromkeys(getattr(cmd, "subcommands", {}).values()))
+
+        modules_[extension] = tuple(entries)
+
+        for entry in entries:
+            for invocation in entry.invocations:
+                lookup.setdefault(invocation, entry)
 
+    return HelpIndex(bot.command_tree_version, modules_, lookup)
 
-async def required_permissions(ctx, cmd):
+
+def command_index(bot):
+    # Built once the extensions are loaded, and again whenever one is loaded, unloaded, or reloaded.
+    if (index := bot_help.d.get("index")) is None or index.version != bot.command_tree_version:
+        index = bot_help.d.index = build_index(bot)
+    return index
+
+
+def command_checks(cmd):
+    parent_checks = cmd.parent.checks if cmd.inherit_checks and cmd.parent is not None else []
+    return (*cmd.app._checks, *getattr(cmd.plugin, "_checks", []), *cmd.checks, *parent_checks)
+
+
+async def run_check(ctx, check):
     try:
-        await cmd.evaluate_checks(ctx)
-        return "Yes"
-    except lightbulb.errors.MissingRequiredPermission as exc:
-        mp = string.list_of([str(str(perm).replace("_", " ")).title() for perm in exc.missing_perms])
-        return f"No - You are missing the {mp} permission(s)"
-    except lightbulb.errors.BotMissingRequiredPermission as exc:
-        mp = string.list_of([str(str(perm).replace("_", " ")).title() for perm in exc.missing_perms])
-        return f"No - Solaris is missing the {mp} permission(s)"
-    except checks.AuthorCanNotConfigure:
-        return "No - You are not able to configure Solaris"
-    except lightbulb.errors.CommandInvocationError:
-        return "No - Solaris is not configured properly"
+        if inspect.isawaitable(result := check(ctx)):
+            result = await result
+    except Exception as exc:
+        return exc
+
+    return None if result else lightbulb.errors.CheckFailure(f"Check {check.__name__} failed")
+
 
+async def check_failures(ctx, cmds, results):
+    # `results` is shared across one help render, so each distinct check - DB-backed ones included - runs once per render
+    # rather than once per command using it.
+    if pending := list(dict.fromkeys(c for cmd in cmds for c in command_checks(cmd) if c not in results)):
+        results.update(zip(pending, await asyncio.gather(*(run_check(ctx, c) for c in pending))))
 
-async def get_command_mapping(bot_help, ctx):
-    mapping = defaultdict(list)
-    plugins = []
+    failures = {}
+    for cmd in cmds:
+        if inspect.isawaitable(exempt := cmd.check_exempt(ctx)):
+            exempt = await exempt
 
-    for extension in bot_help.bot._extensions:
-        if (bot_help.bot.get_plugin(extension.title()).d.image) is not None:
-            for cmd in bot_help.bot.get_plugin(extension.title()).all_commands:
-                if (bot_help.bot.get_plugin(extension.title()).d.image) is not None:
-                    if isinstance(cmd, lightbulb.commands.prefix.PrefixCommand) or isinstance(cmd, lightbulb.commands.prefix.PrefixCommandGroup):
-                        try:
-                            for i in cmd.subcommands.values():
-                                break
-                            mapping[extension].append(cmd)
-                            for c in cmd.subcommands.values():
-                                if c not in mapping[extension]:
-                                    mapping[extension].append(c)
-                        except AttributeError:
-                            mapping[extension].append(cmd)
+        failures[cmd] = None if exempt else next((f for c in command_checks(cmd) if (f := results[c]) is not None), None)
 
-    return mapping
+    return failures
+
+
+def basic_syntax(cmd, prefix, failure):
+    syntax = f"{prefix}{cmd.name}" if cmd.parent is None else f"  ↳ {cmd.name}"
+    return syntax if failure is None else f"{syntax} (✗)"
+
+
+def full_syntax(entry, prefix):
+    return f"```{prefix}{entry.usage}```"
+
+
+def required_permissions(failure):
+    if failure is None:
+        return "Yes"
+    if isinstance(failure, lightbulb.errors.MissingRequiredPermission):
+        mp = string.list_of([str(str(perm).replace("_", " ")).title() for perm in failure.missing_perms])
+        return f"No - You are missing the {mp} permission(s)"
+    if isinstance(failure, lightbulb.errors.BotMissingRequiredPermission):
+        mp = string.list_of([str(str(perm).replace("_", " ")).title() for perm in failure.missing_perms])
+        return f"No - Solaris is missing the {mp} permission(s)"
+    if isinstance(failure, checks.AuthorCanNotConfigure):
+        return "No - You are not able to configure Solaris"
+    if isinstance(failure, checks.CustomCheckFailure):
+        return f"No - {failure.msg}"
+    return "No - Solaris is not configured properly"
 
 
 async def get_cooldown(ctx, cmd):
@@ -161,22 +216,6 @@ async def get_cooldown(ctx, cmd):
         return exc.retry_after
 
 
-async def convert(ctx, arg):
-    try:
-        for cmd in ctx.bot.get_prefix_command(arg).subcommands.values():
-            if arg == f"{cmd.parent.name} {cmd.name}":
-                return cmd
-        else:
-            if (c := ctx.bot.get_prefix_command(arg)) is not None:
-                return c
-    except AttributeError:
-        if (c := ctx.bot.get_prefix_command(arg)) is not None:
-            return c
-    else:
-        raise hikari.NotFoundError
-
-
-
 @bot_help.command()
 @lightbulb.add_checks(lightbulb.guild_only)
 @lightbulb.option(name="cmd", description="Name of the command to view.", type=str, modifier=lightbulb.commands.base.OptionModifier.CONSUME_REST, required=False)
@@ -184,6 +223,8 @@ async def convert(ctx, arg):
 @lightbulb.implements(commands.prefix.PrefixCommand)
 async def help_command(ctx: lightbulb.context.base.Context)-> None:
     prefix = await ctx.bot.prefix(ctx.get_guild().id)
+    index = command_index(ctx.bot)
+    results = {}
 
     if isinstance(ctx.options.cmd, lightbulb.commands.Command):
         await ctx.respond(f"{ctx.bot.cross} Solaris has no commands or aliases with that name.")
@@ -191,8 +232,11 @@ async def help_command(ctx: lightbulb.context.base.Context)-> None:
     elif isinstance(ctx.options.cmd, str):
         if ctx.options.cmd == "config":
             await ConfigHelpMenu(ctx).start()
+        elif (entry := index.lookup.get(" ".join(ctx.options.cmd.lower().split()))) is None:
+            await ctx.respond(f"{ctx.bot.cross} Solaris has no commands or aliases with that name.")
         else:
-            cmd = await convert(ctx, ctx.options.cmd)
+            cmd = entry.command
+            failure = (await check_failures(ctx, (cmd,), results))[cmd]
             await ctx.respond(
                 embed=ctx.bot.embed.build(
                     ctx=ctx,
@@ -200,7 +244,7 @@ async def help_command(ctx: lightbulb.context.base.Context)-> None:
                     description=f"{cmd.description}",
                     thumbnail=ctx.bot.get_me().avatar_url,
                     fields=(
-                        ("Syntax (<required> • [optional])", full_syntax(ctx, cmd, prefix), False),
+                        ("Syntax (<required> • [optional])", full_syntax(entry, prefix), False),
                         (
                             "On cooldown?",
                             f"Yes, for {chron.long_delta(dt.timedelta(seconds=s))}."
@@ -208,10 +252,10 @@ async def help_command(ctx: lightbulb.context.base.Context)-> None:
                             else "No",
                             False,
                         ),
-                        ("Can be run?", (await required_permissions(ctx, cmd)), False),
+                        ("Can be run?", required_permissions(failure), False),
                         (
                             "Parent",
-                            full_syntax(ctx, p, prefix) if (p := cmd.parent) is not None else "None",
+                            full_syntax(index.lookup[p.name.lower()], prefix) if (p := cmd.parent) is not None else "None",
                             False,
                         ),
                     ),
@@ -219,29 +263,34 @@ async def help_command(ctx: lightbulb.context.base.Context)-> None:
             )
 
     else:
-        pagemaps = []
-
-        for extension, cmds in (await get_command_mapping(bot_help, ctx)).items():
-            pagemaps.append(
-                {
-                    "header": "Help",
-                    "title": f"The `{ctx.bot.get_plugin(extension.title()).name}` module",
-                    "description": f"{ctx.bot.get_plugin(extension.title()).description}\n\nUse `{prefix}help [command]` for more detailed help on a command. You can not run commands with `(✗)` next to them.",
-                    "thumbnail": ctx.bot.get_plugin(extension.title()).d.image,
-                    "fields": (
-                            (
-                            f"{len(cmds)} command(s)",
-                            "```{}```".format(
-                                "\n".join([await basic_syntax(ctx, cmd, prefix) for cmd in cmds])
-                            ),
-                            False,
-                        ),
+        async def module_page(module):
+            extension, entries = module
+            plugin = ctx.bot.get_plugin(extension.title())
+            cmds = [e.command for e in entries]
+            failures = await check_failures(ctx, cmds, results)
+
+            return {
+                "header": "Help",
+                "title": f"The `{plugin.name}` module",
+                "description": f"{plugin.description}\n\nUse `{prefix}help [command]` for more detailed help on a command. You can not run commands with `(✗)` next to them.",
+                "thumbnail": plugin.d.image,
+                "fields": (
+                    (
+                        f"{len(cmds)} command(s)",
+                        "```{}```".format("\n".join(basic_syntax(cmd, prefix, failures[cmd]) for cmd in cmds)),
+                        False,
                     ),
-                }
-            )
+                ),
+            }
 
-        await HelpMenu(ctx, pagemaps).start()
+        # Each module's checks are only run when its page is first shown.
+        shown = [
+            (extension, entries)
+            for extension, entries in index.modules.items()
+            if entries and ctx.bot.get_plugin(extension.title()).d.get("image") is not None
+        ]
 
+        await HelpMenu(ctx, menu.PageSource(shown, module_page)).start()
 
 
 
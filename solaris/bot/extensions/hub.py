@@ -106,7 +106,7 @@ async def on_guild_message_create(event: events.GuildMessageCreateEvent) -> None
     if event.is_bot or not event.content:
         return
         
-    if server == hub.d.guild and not event.is_bot and event.author_id == (await hub.bot.rest.fetch_application()).owner.id:
+    if server == hub.d.guild and not event.is_bot and event.author_id == hub.bot.owner_id:
         if channel == hub.d.commands_channel:
             if event.content.startswith("shutdown") or event.content.startswith("sd"):
                 await event.message.delete()
@@ -39,14 +39,22 @@ from solaris.utils import (
     LOADING_ICON,
     SUCCESS_ICON,
     SUPPORT_GUILD_INVITE_LINK,
+    TTLCache,
     checks,
     chron,
     converters,
     menu,
+    stats,
     string,
 )
 from solaris.utils.modules import deactivate
 
+# Counts that can only come from REST are reused for this long, rather than refetched on every invocation.
+COUNT_TTL = 300
+MAX_CACHED_COUNTS = 2048
+
+rest_counts = TTLCache(COUNT_TTL, MAX_CACHED_COUNTS)
+
 
 def get_emoji_limit(arg):
     return int(((1+(sqrt_5:=math.sqrt(5)))**(n:=arg+2)-(1-sqrt_5)**n)/(2**n*sqrt_5)*50)
@@ -80,34 +88,6 @@ def get_member(ctx):
     else:
         return ctx.options.target
 
-def online_member_counter(member):
-    try:
-        if member.visible_status == hikari.Status.ONLINE:
-            return True
-    except AttributeError:
-        return False
-
-def idle_member_counter(member):
-    try:
-        if member.visible_status == hikari.Status.IDLE:
-            return True
-    except AttributeError:
-        return False
-
-def dnd_member_counter(member):
-    try:
-        if member.visible_status == hikari.Status.DO_NOT_DISTURB:
-            return True
-    except AttributeError:
-        return False
-
-def offline_member_counter(member):
-    try:
-        if member.visible_status == hikari.Status.ONLINE:
-            return False
-    except AttributeError:
-        return True
-
 def activity_type_checker(ctx, user):
     try:
         return str(ctx.bot.cache.get_presence(ctx.guild_id, user.id).activities[0].type)
@@ -237,19 +217,26 @@ def system_tips_flags_checker(guild):
 
 class DetailedServerInfoMenu(menu.MultiPageMenu):
     def __init__(meta, ctx, table):
-        pagemaps = []
         base_pm = {
             "header": "Information",
             "title": f"Detailed server information for `{ctx.get_guild().name}`",
             "thumbnail": ctx.get_guild().icon_url,
         }
 
-        for key, value in table.items():
-            pm = base_pm.copy()
-            pm.update({"description": f"Showing `{key}` information.", "fields": value})
-            pagemaps.append(pm)
+        def render(section):
+            key, value = section
+            pm = {**base_pm, "description": f"Showing `{key}` information."}
+
+            if callable(value):
+                # Sections given as async callables are only worked out if someone turns to them.
+                return meta.build_page(pm, value)
+            return {**pm, "fields": value}
+
+        super().__init__(ctx, menu.PageSource(list(table.items()), render), timeout=120.0)
 
-        super().__init__(ctx, pagemaps, timeout=120.0)
+    @staticmethod
+    async def build_page(pagemap, fields):
+        return {**pagemap, "fields": await fields()}
 
 
 class LeavingMenu(menu.SelectionMenu):
@@ -342,7 +329,6 @@ meta = lightbulb.plugins.Plugin(
 @meta.listener(hikari.StartedEvent)
 async def on_started(event: hikari.StartedEvent):
     if not meta.bot.ready.booted:
-        meta.d.developer = (await meta.bot.rest.fetch_application()).owner
         meta.d.artist = await meta.bot.grab_user(714022418200657971)
         meta.d.testers = [
             (await meta.bot.grab_user(id_))
@@ -363,12 +349,127 @@ async def on_started(event: hikari.StartedEvent):
     meta.d.image = "https://cdn.discordapp.com/attachments/991572493267636275/991577676794056734/meta.png"
 
 
+def guild_stats(guild):
+    # Built the first time they're asked for, then kept current by the listeners below.
+    if (stats_ := (tracked := meta.d.setdefault("stats", {})).get(guild.id)) is None:
+        stats_ = tracked[guild.id] = stats.GuildStats.build(
+            guild.get_members().values(),
+            meta.bot.cache.get_presences_view_for_guild(guild.id).values(),
+            guild.get_channels().values(),
+        )
+
+    return stats_
+
+
+def tracked_stats(guild_id):
+    if (tracked := meta.d.get("stats")) is None:
+        return None
+
+    return tracked.get(guild_id)
+
+
+@meta.listener(hikari.GuildAvailableEvent)
+@meta.listener(hikari.GuildLeaveEvent)
+async def on_guild_visibility(event: hikari.GuildVisibilityEvent):
+    # The guild's state has been sent afresh (or is gone), so the counts are rebuilt next time they're needed.
+    if (tracked := meta.d.get("stats")) is not None:
+        tracked.pop(event.guild_id, None)
+
+
+@meta.listener(hikari.MemberChunkEvent)
+async def on_member_chunk(event: hikari.MemberChunkEvent):
+    # Chunked members don't get create events, so the counts are rebuilt once the last chunk is in.
+    if event.chunk_index == event.chunk_count - 1 and (tracked := meta.d.get("stats")) is not None:
+        tracked.pop(event.guild_id, None)
+
+
+@meta.listener(hikari.MemberCreateEvent)
+async def on_member_create(event: hikari.MemberCreateEvent):
+    if (stats_ := tracked_stats(event.guild_id)) is not None:
+        stats_.add_member(event.member)
+
+
+@meta.listener(hikari.MemberUpdateEvent)
+async def on_member_update(event: hikari.MemberUpdateEvent):
+    if (stats_ := tracked_stats(event.guild_id)) is not None and event.old_member is not None:
+        stats_.update_member(event.old_member, event.member)
+
+
+@meta.listener(hikari.MemberDeleteEvent)
+async def on_member_delete(event: hikari.MemberDeleteEvent):
+    if (stats_ := tracked_stats(event.guild_id)) is not None:
+        stats_.remove_member(event.user, event.old_member)
+
+
+@meta.listener(hikari.PresenceUpdateEvent)
+async def on_presence_update(event: hikari.PresenceUpdateEvent):
+    if (stats_ := tracked_stats(event.guild_id)) is not None:
+        stats_.set_status(event.user_id, event.presence.visible_status)
+
+
+@meta.listener(hikari.GuildChannelCreateEvent)
+async def on_guild_channel_create(event: hikari.GuildChannelCreateEvent):
+    if (stats_ := tracked_stats(event.guild_id)) is not None:
+        stats_.channels[event.channel.type] += 1
+
+
+@meta.listener(hikari.GuildChannelUpdateEvent)
+async def on_guild_channel_update(event: hikari.GuildChannelUpdateEvent):
+    # Text and news channels can be converted into each other.
+    if (stats_ := tracked_stats(event.guild_id)) is not None and event.old_channel is not None:
+        stats_.channels[event.old_channel.type] -= 1
+        stats_.channels[event.channel.type] += 1
+
+
+@meta.listener(hikari.GuildChannelDeleteEvent)
+async def on_guild_channel_delete(event: hikari.GuildChannelDeleteEvent):
+    if (stats_ := tracked_stats(event.guild_id)) is not None:
+        stats_.channels[event.channel.type] -= 1
+
+
+@meta.listener(hikari.BanCreateEvent)
+async def on_ban_create(event: hikari.BanCreateEvent):
+    if (stats_ := tracked_stats(event.guild_id)) is not None and stats_.bans is not None:
+        stats_.bans += 1
+
+
+@meta.listener(hikari.BanDeleteEvent)
+async def on_ban_delete(event: hikari.BanDeleteEvent):
+    if (stats_ := tracked_stats(event.guild_id)) is not None and stats_.bans is not None:
+        stats_.bans -= 1
+
+
+@meta.listener(hikari.GuildPinsUpdateEvent)
+async def on_guild_pins_update(event: hikari.GuildPinsUpdateEvent):
+    rest_counts.pop(("pins", event.channel_id))
+
+
+async def count(awaitable):
+    return len(await awaitable)
+
+
+async def rest_count(kind, id_, factory):
+    return await rest_counts.fetch((kind, id_), factory)
+
+
+async def ban_count(stats_, guild_id, perm):
+    if not perm.BAN_MEMBERS:
+        return None
+
+    # Bans aren't cached, so they're counted once and then followed through ban events.
+    if stats_.bans is None:
+        stats_.bans = await rest_count("bans", guild_id, lambda: meta.bot.rest.fetch_bans(guild_id).count())
+
+    return stats_.bans
+
+
 @meta.command()
 @lightbulb.add_checks(lightbulb.guild_only)
 @lightbulb.command(name="about", aliases=["credits"], description="View info regarding those behind Solaris' development. This includes the developer and the testers.")
 @lightbulb.implements(commands.prefix.PrefixCommand)
 async def about_command(ctx: lightbulb.context.base.Context):
     prefix = await ctx.bot.prefix(ctx.guild_id)
+    developer = (await ctx.bot.ensure_application()).owner
     await ctx.respond(
         embed=ctx.bot.embed.build(
             ctx=ctx,
@@ -377,7 +478,7 @@ async def about_command(ctx: lightbulb.context.base.Context):
             description=f"Use `{prefix}botinfo` for detailed statistics.",
             thumbnail=ctx.bot.get_me().avatar_url,
             fields=(
-                ("Developer", meta.d.developer.mention, False),
+                ("Developer", developer.mention, False),
                 ("Avatar Designer", meta.d.artist.mention, False),
                 ("Testers", string.list_of([t.mention for t in meta.d.testers]), False),
             ),
@@ -403,6 +504,7 @@ async def support_command(ctx: lightbulb.context.base.Context):
         m for m in meta.d.support_guild.get_members() if not (ctx.bot.cache.get_member(meta.d.support_guild.id, m)).is_bot and (ctx.bot.cache.get_member(meta.d.support_guild.id, m)).get_top_role().position == meta.d.helper_role.position
     ]
     online_helpers = set(online) & set(helpers)
+    developer = (await ctx.bot.ensure_application()).owner
 
     await ctx.respond(
         embed=ctx.bot.embed.build(
@@ -413,7 +515,7 @@ async def support_command(ctx: lightbulb.context.base.Context):
             fields=(
                 ("Online / members", f"{len(online):,} / {len(meta.d.support_guild.get_members()):,}", True),
                 ("Online / helpers", f"{len(online_helpers):,} / {len(helpers):,}", True),
-                ("Developer", str(ctx.bot.cache.get_presence(meta.d.support_guild.id, meta.d.developer.id).visible_status).title(), True),
+                ("Developer", str(ctx.bot.cache.get_presence(meta.d.support_guild.id, developer.id).visible_status).title(), True),
             ),
         )
     )
@@ -540,7 +642,7 @@ async def ping_command(ctx: lightbulb.context.base.Context):
 @lightbulb.implements(commands.prefix.PrefixCommand)
 async def botinfo_command(ctx: lightbulb.context.base.Context):
     with (proc := psutil.Process()).oneshot():
-        bot_ = await ctx.bot.rest.fetch_application()
+        bot_ = await ctx.bot.ensure_application()
         prefix = await ctx.bot.prefix(ctx.get_guild().id)
         uptime = time() - proc.create_time()
         cpu_times = proc.cpu_times()
@@ -720,8 +822,9 @@ async def serverinfo_command(ctx: lightbulb.context.base.Context):
         )
     )
 
-    bot_count = len([m for m in guild.get_members() if ctx.bot.cache.get_member(guild.id, m).is_bot])
-    human_count = guild.member_count - bot_count
+    stats_ = guild_stats(guild)
+    newest = stats_.newest or stats_.find_newest(guild.get_members().values())
+    bans = await ban_count(stats_, guild.id, perm)
     created_at = guild.created_at
     creation_timestamp = dt.datetime(
         created_at.year,
@@ -744,26 +847,22 @@ async def serverinfo_command(ctx: lightbulb.context.base.Context):
                 ("Owner", guild_owner.mention, True),
                 ("Region", guild.preferred_locale, True),
                 ("Top role", ctx.bot.cache.get_role([r for r in guild.get_roles()][1]).mention, True),
-                ("Members", f"{guild.member_count:,}", True),
-                ("Humans / bots", f"{human_count:,} / {bot_count:,}", True),
-                (
-                    "Bans",
-                    f"{len(await ctx.bot.rest.fetch_bans(guild.id)):,}" if perm.BAN_MEMBERS else "-",
-                    True,
-                ),
+                ("Members", f"{stats_.members:,}", True),
+                ("Humans / bots", f"{stats_.humans:,} / {stats_.bots:,}", True),
+                ("Bans", f"{bans:,}" if bans is not None else "-", True),
                 ("Roles", f"{len([r for r in guild.get_roles()])-1:,}", True),
-                ("Text channels", f"{len([c for c in guild.get_channels() if text_channel_counter(ctx.bot.cache.get_guild_channel(c)) is True]):,}", True),
-                ("Voice channels", f"{len([c for c in guild.get_channels() if voice_channel_counter(ctx.bot.cache.get_guild_channel(c)) is True]):,}", True),
-                ("Stage channels", f"{len([c for c in guild.get_channels() if stage_channel_counter(ctx.bot.cache.get_guild_channel(c)) is True]):,}", True),
-                ("News channels", f"{len([c for c in guild.get_channels() if news_channel_counter(ctx.bot.cache.get_guild_channel(c)) is True]):,}", True),
+                ("Text channels", f"{stats_.channels[hikari.ChannelType.GUILD_TEXT]:,}", True),
+                ("Voice channels", f"{stats_.channels[hikari.ChannelType.GUILD_VOICE]:,}", True),
+                ("Stage channels", f"{stats_.channels[hikari.ChannelType.GUILD_STAGE]:,}", True),
+                ("News channels", f"{stats_.channels[hikari.ChannelType.GUILD_NEWS]:,}", True),
                 (
                     "Invites",
-                    f"{len(await ctx.bot.rest.fetch_guild_invites(guild.id)):,}" if perm.MANAGE_GUILD else "-",
+                    f"{len(ctx.bot.cache.get_invites_view_for_guild(guild.id)):,}" if perm.MANAGE_GUILD else "-",
                     True,
                 ),
                 ("Emojis", f"{len(guild.get_emojis()):,} / {get_emoji_limit(guild.premium_tier.value)*2:,}", True),
                 ("Boosts", f"{guild.premium_subscription_count:,} (level {guild.premium_tier.value})", True),
-                ("Newest member", ctx.bot.cache.get_member(guild.id, max(guild.get_members(), key=lambda m: ctx.bot.cache.get_member(guild.id, m).joined_at)).mention, True),
+                ("Newest member", f"<@{newest[1]}>" if newest is not None else "-", True),
                 #("Created on", chron.long_date(guild.created_at), True),
                 ("Created on", f"<t:{int(creation_timestamp)}:R> on\n<t:{int(creation_timestamp)}:F>", True),
                 ("Existed for", chron.short_delta(dt.datetime.utcnow() - guild.created_at.replace(tzinfo=None)), True),
@@ -771,10 +870,10 @@ async def serverinfo_command(ctx: lightbulb.context.base.Context):
                 (
                     "Statuses",
                     (
-                        f"🟢 {len([m for m in guild.get_members() if online_member_counter(ctx.bot.cache.get_presence(guild.id, m)) is True]):,} "
-                        f"🟠 {len([m for m in guild.get_members() if idle_member_counter(ctx.bot.cache.get_presence(guild.id, m)) is True]):,} "
-                        f"🔴 {len([m for m in guild.get_members() if dnd_member_counter(ctx.bot.cache.get_presence(guild.id, m)) is True]):,} "
-                        f"⚪ {len([m for m in guild.get_members() if offline_member_counter(ctx.bot.cache.get_presence(guild.id, m)) is True]):,}"
+                        f"🟢 {stats_.statuses[hikari.Status.ONLINE]:,} "
+                        f"🟠 {stats_.statuses[hikari.Status.IDLE]:,} "
+                        f"🔴 {stats_.statuses[hikari.Status.DO_NOT_DISTURB]:,} "
+                        f"⚪ {stats_.offline:,}"
                     ),
                     False,
                 ),
@@ -830,7 +929,7 @@ async def channelinfo_command(ctx: lightbulb.context.base.Context):
                         f"{len([i for i in ctx.bot.cache.get_invites_view_for_channel(guild.id, target.id)]):,}" if perm.MANAGE_GUILD else "-",
                         True,
                     ),
-                    ("Pins", f"{len(await target.fetch_pins())}", True),
+                    ("Pins", f"{await rest_count('pins', target.id, lambda: count(target.fetch_pins()))}", True),
                     ("Slowmode delay", target.rate_limit_per_user, True),
                     #("Created on", chron.long_date(target.created_at), True),
                     ("Created on", f"<t:{int(creation_timestamp)}:R> on\n <t:{int(creation_timestamp)}:F>", True),
@@ -863,7 +962,7 @@ async def channelinfo_command(ctx: lightbulb.context.base.Context):
                         f"{len([i for i in ctx.bot.cache.get_invites_view_for_channel(guild.id, target.id)]):,}" if perm.MANAGE_GUILD else "-",
                         True,
                     ),
-                    ("Pins", f"{len(await target.fetch_pins())}", True),
+                    ("Pins", f"{await rest_count('pins', target.id, lambda: count(target.fetch_pins()))}", True),
                     #("Created on", chron.long_date(target.created_at), True),
                     ("Created on", f"<t:{int(creation_timestamp)}:R> on\n <t:{int(creation_timestamp)}:F>", True),
                     ("Existed for", chron.short_delta(dt.datetime.utcnow() - target.created_at.replace(tzinfo=None)), True),
@@ -1229,42 +1328,17 @@ async def detailedserverinfo_command(ctx: lightbulb.context.base.Context):
         )
     )
 
-    table = {
-        "overview": (
-            ("ID", guild.id, False),
-            ("Name", guild.name, True),
-            ("Region", guild.preferred_locale, True),
-            ("Inactive channel", ctx.bot.cache.get_guild_channel(guild.afk_channel_id) if guild.afk_channel_id is not None else "-", True),
-            ("Inactive timeout", guild.afk_timeout, True),
-            ("System messages channel", ctx.bot.cache.get_guild_channel(guild.system_channel_id).mention if guild.system_channel_id is not None else "-", True),
-            ("Send welcome messages?", system_message_flags_checker(guild), True),
-            ("Send boost messages?", system_nitro_flags_checker(guild), True),
-            (
-                "Default notifications",
-                "Only @mentions" if guild.default_message_notifications.value else "All Messages",
-                True,
-            ),
-            ("Guild tips reminder?",system_tips_flags_checker(guild), True),
-            ("User join replies?", system_reply_flags_checker(guild), True),
-            ("\u200b", "\u200b", True),
-            ("\u200b", "\u200b", True),
-        ),
-        "moderation": (
-            ("Verficiation level", str(guild.verification_level).title(), False),
-            (
-                "Explicit media content filter",
-                str(guild.explicit_content_filter).replace("_", " ").title(),
-                False,
-            ),
-            ("2FA requirement for moderation?", bool(guild.mfa_level), False),
-        ),
-        "numerical": (
-            ("Members", f"{guild.member_count:,}", True),
-            ("Humans", f"{(hc := len([m for m in guild.get_members() if not ctx.bot.cache.get_member(guild.id, m).is_bot])):,}", True),
-            ("Bots", f"{guild.member_count - hc:,}", True),
-            ("Est. prune (1d)", f"{await ctx.bot.rest.estimate_guild_prune_count(guild=guild.id, days=1):,}", True),
-            ("Est. prune (7d)", f"{await ctx.bot.rest.estimate_guild_prune_count(guild=guild.id, days=7):,}", True),
-            ("Est. prune (30d)", f"{await ctx.bot.rest.estimate_guild_prune_count(guild=guild.id, days=30):,}", True),
+    async def numerical():
+        stats_ = guild_stats(guild)
+        bans = await ban_count(stats_, guild.id, perm)
+
+        return (
+            ("Members", f"{stats_.members:,}", True),
+            ("Humans", f"{stats_.humans:,}", True),
+            ("Bots", f"{stats_.bots:,}", True),
+            ("Est. prune (1d)", f"{await rest_count('prune1', guild.id, lambda: ctx.bot.rest.estimate_guild_prune_count(guild=guild.id, days=1)):,}", True),
+            ("Est. prune (7d)", f"{await rest_count('prune7', guild.id, lambda: ctx.bot.rest.estimate_guild_prune_count(guild=guild.id, days=7)):,}", True),
+            ("Est. prune (30d)", f"{await rest_count('prune30', guild.id, lambda: ctx.bot.rest.estimate_guild_prune_count(guild=guild.id, days=30)):,}", True),
             ("Roles", f"{len([r for r in guild.get_roles()]):,}", True),
             (
                 "Members with top role",
@@ -1273,12 +1347,12 @@ async def detailedserverinfo_command(ctx: lightbulb.context.base.Context):
             ),
             (
                 "Bans",
-                f"{len([b for b in await ctx.bot.rest.fetch_bans(guild.id)]) if perm.BAN_MEMBERS else None:,}",
+                f"{bans:,}" if bans is not None else "-",
                 True,
             ),
             (
                 "Invites",
-                f"{len([i for i in ctx.bot.cache.get_invites_view_for_guild(guild.id)]) if perm.MANAGE_GUILD else None:,}",
+                f"{len(ctx.bot.cache.get_invites_view_for_guild(guild.id)):,}" if perm.MANAGE_GUILD else "-",
                 True,
             ),
             #(
@@ -1288,17 +1362,17 @@ async def detailedserverinfo_command(ctx: lightbulb.context.base.Context):
             #),
             (
                 "Integrations",
-                f"{len([i for i in await ctx.bot.rest.fetch_integrations(guild.id)]) if perm.MANAGE_GUILD else None:,}",
+                f"{await rest_count('integrations', guild.id, lambda: count(ctx.bot.rest.fetch_integrations(guild.id))):,}" if perm.MANAGE_GUILD else "-",
                 True,
             ),
             (
                 "Templates",
-                f"{len([i for i in await ctx.bot.rest.fetch_guild_templates(guild.id)]) if perm.MANAGE_GUILD else None:,}",
+                f"{await rest_count('templates', guild.id, lambda: count(ctx.bot.rest.fetch_guild_templates(guild.id))):,}" if perm.MANAGE_GUILD else "-",
                 True,
             ),
             (
                 "Events",
-                f"{len([i for i in await ctx.bot.rest.fetch_scheduled_events(guild.id)]) if perm.MANAGE_GUILD else None:,}",
+                f"{await rest_count('events', guild.id, lambda: count(ctx.bot.rest.fetch_scheduled_events(guild.id))):,}" if perm.MANAGE_GUILD else "-",
                 True,
             ),
             ("Emojis", f"{len([e for e in guild.get_emojis()]):,}", True),
@@ -1306,10 +1380,41 @@ async def detailedserverinfo_command(ctx: lightbulb.context.base.Context):
             ("Bitrate limit", f"{get_bitrate_limit(guild.premium_tier.value)} kbps", True),
             ("Filesize limit", f"{get_filesie_limit(guild.premium_tier.value)} MB", True),
             ("Boosts", f"{guild.premium_subscription_count:,}", True),
-            ("Boosters", f"{len([m for m in guild.get_members() if ctx.bot.cache.get_member(guild.id, m).premium_since is not None]):,}", True),
+            ("Boosters", f"{stats_.boosters:,}", True),
             ("\u200b", "\u200b", True),
             ("\u200b", "\u200b", True),
+        )
+
+    table = {
+        "overview": (
+            ("ID", guild.id, False),
+            ("Name", guild.name, True),
+            ("Region", guild.preferred_locale, True),
+            ("Inactive channel", ctx.bot.cache.get_guild_channel(guild.afk_channel_id) if guild.afk_channel_id is not None else "-", True),
+            ("Inactive timeout", guild.afk_timeout, True),
+            ("System messages channel", ctx.bot.cache.get_guild_channel(guild.system_channel_id).mention if guild.system_channel_id is not None else "-", True),
+            ("Send welcome messages?", system_message_flags_checker(guild), True),
+            ("Send boost messages?", system_nitro_flags_checker(guild), True),
+            (
+                "Default notifications",
+                "Only @mentions" if guild.default_message_notifications.value else "All Messages",
+                True,
+            ),
+            ("Guild tips reminder?",system_tips_flags_checker(guild), True),
+            ("User join replies?", system_reply_flags_checker(guild), True),
+            ("\u200b", "\u200b", True),
+            ("\u200b", "\u200b", True),
+        ),
+        "moderation": (
+            ("Verficiation level", str(guild.verification_level).title(), False),
+            (
+                "Explicit media content filter",
+                str(guild.explicit_content_filter).replace("_", " ").title(),
+                False,
+            ),
+            ("2FA requirement for moderation?", bool(guild.mfa_level), False),
         ),
+        "numerical": numerical,
         # "miscellaneous": [
         # ]
     }
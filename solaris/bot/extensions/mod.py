@@ -22,6 +22,7 @@
 # aoi.yuito.ehou@gmail.com
 
 import re
+import asyncio
 import aiohttp
 from io import BytesIO
 
@@ -32,9 +33,15 @@ from lightbulb import commands
 import datetime as dt
 
 from solaris.utils import chron
+from solaris.utils import bulk
 from solaris.utils import checks
+from solaris.utils import menu
+from solaris.utils import msgindex
+from solaris.utils import overview
+from solaris.utils import patterns
+from solaris.utils import purge
+from solaris.utils import snapshot
 
-from solaris.bot.extensions.meta import all_channel_under_category
 
 
 LINK_REGEX = re.compile(
@@ -42,9 +49,38 @@ LINK_REGEX = re.compile(
 )
 INVITE_REGEX = re.compile(r"(?:https?://)?discord(?:app)?\.(?:com/invite|gg)/[a-zA-Z0-9]+/?")
 
+MAX_PURGE_SCAN = 10_000
+MAX_LISTED_FAILURES = 10
+MASS_ACTIONS = ("ban", "kick")
+MAX_MASS_TARGETS = 5_000
+MAX_MASS_PREVIEW = 10
+MAX_JOIN_WINDOW = 10_080
+MAX_SCHEDULE_DELTA = dt.timedelta(days=365)
+MAX_LISTED_JOBS = 20
+MODLOG_RESULTS_PER_PAGE = 10
+USER_ID_REGEX = re.compile(r"\b\d{17,20}\b")
+
+HAS_LINKS = purge.flagged("links", purge.content_matches(LINK_REGEX))
+HAS_INVITES = purge.flagged("invites", purge.content_matches(INVITE_REGEX))
+
 
 UNHOIST_PATTERN = "".join(chr(i) for i in [*range(0x20, 0x30), *range(0x3A, 0x41), *range(0x5B, 0x61)])
 STRICT_UNHOIST_PATTERN = "".join(chr(i) for i in [*range(0x20, 0x41), *range(0x5B, 0x61)])
+UNHOIST_REGEX = re.compile(rf"[{re.escape(UNHOIST_PATTERN)}]+")
+STRICT_UNHOIST_REGEX = re.compile(rf"[{re.escape(STRICT_UNHOIST_PATTERN)}]+")
+MAX_UNHOIST_PREVIEW = 10
+
+
+def unhoisted(name, regex):
+    # Returns the name with its leading hoisting characters removed, or None if there's nothing to change.
+    if (match := regex.match(name)) is None or not (name := name[match.end():]):
+        return None
+
+    return name
+
+
+def unhoist_changes(members, regex):
+    return [(member, name) for member in members if (name := unhoisted(member.display_name, regex)) is not None]
 
 
 def is_url(string: str, *, fullmatch: bool = True) -> bool:
@@ -79,6 +115,95 @@ async def on_started(event: hikari.StartedEvent):
 
     mod.d.configurable: bool = False
     mod.d.image = "https://cdn.discordapp.com/attachments/991572493267636275/991578577776689212/mod.png"
+    mod.d.regex = patterns.RegexPool()
+    mod.d.regex.start()
+    mod.d.messages = msgindex.MessageIndex(
+        {
+            "links": HAS_LINKS,
+            "invites": HAS_INVITES,
+            "embeds": purge.has_embeds,
+            "attachments": purge.has_attachments,
+        }
+    )
+
+    for channel_id in await mod.bot.db.column("SELECT ChannelID FROM indexedchannels"):
+        mod.d.messages.enable(channel_id)
+
+    mod.d.unhoist = {
+        guild_id: STRICT_UNHOIST_REGEX if strict else UNHOIST_REGEX
+        for guild_id, strict in await mod.bot.db.records("SELECT GuildID, Strict FROM autounhoist")
+    }
+
+    # Mass actions interrupted by a restart pick up from their last checkpoint.
+    mod.d.mass_jobs = {}
+    for job_id in await mod.bot.db.column("SELECT JobID FROM massactions WHERE Status = 'running'"):
+        start_mass_job(mod.bot, job_id)
+
+
+@mod.listener(hikari.StoppingEvent)
+async def on_stopping(event: hikari.StoppingEvent):
+    mod.d.regex.close()
+
+
+@mod.listener(hikari.GuildMessageCreateEvent)
+async def on_guild_message_create(event: hikari.GuildMessageCreateEvent):
+    if (index := mod.d.get("messages")) is not None:
+        index.add(event.message)
+
+
+@mod.listener(hikari.GuildMessageUpdateEvent)
+async def on_guild_message_update(event: hikari.GuildMessageUpdateEvent):
+    if (index := mod.d.get("messages")) is not None:
+        index.update(event.message)
+
+
+@mod.listener(hikari.GuildMessageDeleteEvent)
+async def on_guild_message_delete(event: hikari.GuildMessageDeleteEvent):
+    if (index := mod.d.get("messages")) is not None:
+        index.discard(event.channel_id, event.message_id)
+
+
+@mod.listener(hikari.GuildBulkMessageDeleteEvent)
+async def on_guild_bulk_message_delete(event: hikari.GuildBulkMessageDeleteEvent):
+    if (index := mod.d.get("messages")) is not None:
+        index.discard(event.channel_id, *event.message_ids)
+
+
+@mod.listener(hikari.GuildChannelDeleteEvent)
+async def on_guild_channel_delete(event: hikari.GuildChannelDeleteEvent):
+    if (index := mod.d.get("messages")) is not None and event.channel_id in index:
+        index.disable(event.channel_id)
+        await mod.bot.db.execute("DELETE FROM indexedchannels WHERE ChannelID = ?", event.channel_id)
+
+
+async def auto_unhoist(member):
+    if (regex := mod.d.get("unhoist", {}).get(member.guild_id)) is None:
+        return
+
+    # The edit fires another update, but the new name no longer matches so it stops there.
+    if (name := unhoisted(member.display_name, regex)) is not None:
+        try:
+            await member.edit(nick=name, reason="Automatically unhoisted.")
+        except hikari.HTTPError:
+            pass
+
+
+@mod.listener(hikari.MemberCreateEvent)
+async def on_member_create(event: hikari.MemberCreateEvent):
+    await auto_unhoist(event.member)
+
+
+@mod.listener(hikari.MemberUpdateEvent)
+async def on_member_update(event: hikari.MemberUpdateEvent):
+    if event.old_member is None or event.old_member.display_name != event.member.display_name:
+        await auto_unhoist(event.member)
+
+
+@mod.listener(hikari.ShardReadyEvent)
+async def on_shard_ready(event: hikari.ShardReadyEvent):
+    # A fresh session means events may have been missed since the last one.
+    if (index := mod.d.get("messages")) is not None:
+        index.reset()
 
 
 @mod.command()
@@ -104,6 +229,7 @@ async def kick_command(ctx: lightbulb.context.base.Context):
             for target in targets:
                 try:
                     await target.kick(reason=f"{reason} - Actioned by {ctx.author.username}")
+                    ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "kick", target.id, reason=reason)
                     count += 1
                 except hikari.ForbiddenError:
                     await ctx.respond(
@@ -160,6 +286,7 @@ async def ban_command(ctx: lightbulb.context.base.Context):
                             + f" - Actioned by {ctx.author.username}"
                         ),
                     )
+                    ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "ban", target.id, reason=reason)
                     count += 1
                     
                 except hikari.ForbiddenError:
@@ -173,6 +300,170 @@ async def ban_command(ctx: lightbulb.context.base.Context):
                 await ctx.respond(f"{ctx.bot.info} No members were banned.")
 
 
+async def parse_run_time(ctx):
+    if (delta := chron.parse_delta(ctx.options.duration)) is None or not dt.timedelta() < delta <= MAX_SCHEDULE_DELTA:
+        await ctx.respond(
+            f"{ctx.bot.cross} The duration is invalid - use something like `12h` or `7d`, up to `{MAX_SCHEDULE_DELTA.days}` days."
+        )
+        assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
+        await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
+        return None
+
+    return dt.datetime.now(dt.timezone.utc) + delta
+
+
+@mod.command()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.BAN_MEMBERS))
+@lightbulb.add_checks(lightbulb.bot_has_guild_permissions(hikari.Permissions.SEND_MESSAGES, hikari.Permissions.BAN_MEMBERS))
+@lightbulb.option(name="reason", description="Reason of the ban", type=str, default="No reason provided.", required=False, modifier=lightbulb.commands.base.OptionModifier.CONSUME_REST)
+@lightbulb.option(name="targets", description="Members or Users to ban", type=hikari.User, required=True, modifier=lightbulb.commands.base.OptionModifier.GREEDY)
+@lightbulb.option(name="duration", description="How long to ban for, like 12h or 7d", type=str, required=True)
+@lightbulb.command(name="tempban", aliases=["tban"], description="Bans one or more members from your server for a set amount of time.")
+@lightbulb.implements(commands.prefix.PrefixCommand)
+async def tempban_command(ctx: lightbulb.context.base.Context):
+    if (run_at := await parse_run_time(ctx)) is None:
+        return
+
+    count = 0
+    reason = f"{ctx.options.reason} (Tempban) - Actioned by {ctx.author.username}"
+
+    async with ctx.get_channel().trigger_typing():
+        for target in ctx.options.targets:
+            try:
+                await ctx.get_guild().ban(target, delete_message_days=1, reason=reason)
+            except hikari.ForbiddenError:
+                await ctx.respond(
+                    f"{ctx.bot.cross} Failed to ban {target.mention} as their permission set is superior to Solaris'."
+                )
+                continue
+
+            await ctx.bot.jobs.schedule(
+                ctx.guild_id, target.id, "unban", run_at, reason=f"Tempban expired. - Actioned by {ctx.author.username}"
+            )
+            ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "tempban", target.id, reason=ctx.options.reason)
+            count += 1
+
+        if count > 0:
+            await ctx.respond(f"{ctx.bot.tick} `{count:,}` member(s) were banned until {chron.long_date_and_time(run_at)} UTC.")
+        else:
+            await ctx.respond(f"{ctx.bot.info} No members were banned.")
+
+
+@mod.command()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.command(name="schedule", aliases=["sched"], description="Schedules moderation actions for later. Use the command for information on available subcommands.")
+@lightbulb.implements(commands.prefix.PrefixCommandGroup)
+async def schedule_group(ctx: lightbulb.context.base.Context):
+    await overview.group_overview(
+        ctx,
+        header="Schedule",
+        description="Scheduled actions are kept across restarts, and any missed while Solaris was offline are run as soon as it's back.",
+    )
+
+
+@schedule_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.BAN_MEMBERS))
+@lightbulb.add_checks(lightbulb.bot_has_guild_permissions(hikari.Permissions.SEND_MESSAGES, hikari.Permissions.BAN_MEMBERS))
+@lightbulb.option(name="reason", description="Reason for the unban", type=str, default="No reason provided.", required=False, modifier=lightbulb.commands.base.OptionModifier.CONSUME_REST)
+@lightbulb.option(name="targets", description="IDs of the Users to unban", type=int, required=True, modifier=lightbulb.commands.base.OptionModifier.GREEDY)
+@lightbulb.option(name="duration", description="How long until the unban, like 12h or 7d", type=str, required=True)
+@lightbulb.command(name="unban", description="Unbans one or more users after a set amount of time.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def schedule_unban_command(ctx: lightbulb.context.base.Context):
+    if (run_at := await parse_run_time(ctx)) is None:
+        return
+
+    reason = f"{ctx.options.reason} (Scheduled) - Actioned by {ctx.author.username}"
+    for target in ctx.options.targets:
+        await ctx.bot.jobs.schedule(ctx.guild_id, target, "unban", run_at, reason=reason)
+
+    await ctx.respond(
+        f"{ctx.bot.tick} `{len(ctx.options.targets):,}` user(s) will be unbanned on {chron.long_date_and_time(run_at)} UTC."
+    )
+
+
+@schedule_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.MANAGE_ROLES))
+@lightbulb.add_checks(lightbulb.bot_has_guild_permissions(hikari.Permissions.SEND_MESSAGES, hikari.Permissions.MANAGE_ROLES))
+@lightbulb.option(name="reason", description="Reason for the role removal", type=str, default="No reason provided.", required=False, modifier=lightbulb.commands.base.OptionModifier.CONSUME_REST)
+@lightbulb.option(name="targets", description="The Members to remove the role from", type=hikari.Member, required=True, modifier=lightbulb.commands.base.OptionModifier.GREEDY)
+@lightbulb.option(name="role", description="The role to remove", type=hikari.Role, required=True)
+@lightbulb.option(name="duration", description="How long until the role is removed, like 12h or 7d", type=str, required=True)
+@lightbulb.command(name="removerole", aliases=["rr"], description="Removes a role from one or more members after a set amount of time.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def schedule_removerole_command(ctx: lightbulb.context.base.Context):
+    if (run_at := await parse_run_time(ctx)) is None:
+        return
+
+    role = ctx.options.role
+    targets = [t for t in ctx.options.targets if role.id in t.role_ids]
+
+    if not targets:
+        return await ctx.respond(f"{ctx.bot.info} None of those members have the {role.mention} role.")
+
+    reason = f"{ctx.options.reason} (Scheduled) - Actioned by {ctx.author.username}"
+    for target in targets:
+        await ctx.bot.jobs.schedule(ctx.guild_id, target.id, "removerole", run_at, role_id=role.id, reason=reason)
+
+    await ctx.respond(
+        f"{ctx.bot.tick} {role.mention} will be removed from `{len(targets):,}` member(s) on {chron.long_date_and_time(run_at)} UTC."
+    )
+
+
+@schedule_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.BAN_MEMBERS))
+@lightbulb.command(name="list", description="Lists the moderation actions scheduled in this server.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def schedule_list_command(ctx: lightbulb.context.base.Context):
+    records = await ctx.bot.db.records(
+        "SELECT JobID, UserID, Action, RoleID, RunTime FROM modjobs WHERE GuildID = ? ORDER BY RunTime", ctx.guild_id
+    )
+
+    if not records:
+        return await ctx.respond(f"{ctx.bot.info} There are no scheduled actions in this server.")
+
+    lines = [
+        f"`{job_id}` {action.title()} <@{user_id}>{f' from <@&{role_id}>' if role_id else ''}"
+        f" on {chron.short_date_and_time(chron.from_iso(run_time))} UTC"
+        for job_id, user_id, action, role_id, run_time in records
+    ]
+
+    await ctx.respond(
+        embed=ctx.bot.embed.build(
+            ctx=ctx,
+            header="Schedule",
+            title=f"{len(records):,} scheduled action(s)",
+            description="\n".join(lines[:MAX_LISTED_JOBS])
+            + (f"\n...and {hidden:,} more." if (hidden := len(lines) - MAX_LISTED_JOBS) > 0 else ""),
+        )
+    )
+
+
+@schedule_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.BAN_MEMBERS))
+@lightbulb.option(name="job_id", description="The ID of the scheduled action to cancel.", type=str, required=True)
+@lightbulb.command(name="cancel", description="Cancels a scheduled moderation action.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def schedule_cancel_command(ctx: lightbulb.context.base.Context):
+    if await ctx.bot.db.field(
+        "SELECT JobID FROM modjobs WHERE JobID = ? AND GuildID = ?", ctx.options.job_id, ctx.guild_id
+    ) is None:
+        return await ctx.respond(f"{ctx.bot.cross} That scheduled action does not exist.")
+
+    await ctx.bot.jobs.cancel(ctx.options.job_id)
+    await ctx.respond(f"{ctx.bot.tick} Scheduled action `{ctx.options.job_id}` cancelled.")
+
+
 @mod.command()
 @lightbulb.add_checks(lightbulb.guild_only)
 @lightbulb.add_checks(checks.bot_is_ready())
@@ -196,6 +487,7 @@ async def unban_command(ctx: lightbulb.context.base.Context):
         async with ctx.get_channel().trigger_typing():
             for target in targets:
                 await ctx.get_guild().unban(target, reason=f"{reason} - Actioned by {ctx.author.username}")
+                ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "unban", target, reason=reason)
                 count += 1
 
             if count > 0:
@@ -255,6 +547,7 @@ async def softban_command(ctx: lightbulb.context.base.Context):
                     )
 
                 await ctx.get_guild().unban(target, reason=f"{reason} - Actioned by {ctx.author.username}")
+                ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "softban", target.id, reason=reason)
                 count += 1
 
             if count > 0:
@@ -263,35 +556,313 @@ async def softban_command(ctx: lightbulb.context.base.Context):
                 await ctx.respond(f"{ctx.bot.info} No members were softbanned.")
 
 
-@mod.command()
-@lightbulb.add_checks(lightbulb.guild_only)
-@lightbulb.command(name="clear", aliases=["clr"], description="Clears up to 100 messages from a channel. Use the command for information on available subcommands.")
-@lightbulb.implements(commands.prefix.PrefixCommandGroup)
-async def clear_group(ctx: lightbulb.context.base.Context):
-    cmds = []
+def mass_job_embed(bot, job_id, action, done, total, failed, title):
+    return bot.embed.build(
+        header="Mass action",
+        title=title,
+        description=f"`{done:,}/{total:,}` account(s) processed for job `{job_id}`.",
+        fields=(
+            ("Action", action.title(), True),
+            ("Failed", f"{failed:,}", True),
+        ),
+    )
+
+
+async def run_mass_job(bot, job_id):
+    guild_id, channel_id, mod_id, action, reason, delete_message_days = await bot.db.record(
+        "SELECT GuildID, ChannelID, ModID, Action, Reason, DeleteMessageDays FROM massactions WHERE JobID = ?", job_id
+    )
+    total, done_before, failed_before = await bot.db.record(
+        "SELECT COUNT(*), COALESCE(SUM(Done), 0), COUNT(Error) FROM masstargets WHERE JobID = ?", job_id
+    )
+    user_ids = await bot.db.column("SELECT UserID FROM masstargets WHERE JobID = ? AND Done = 0", job_id)
+
+    async def act(user_id):
+        try:
+            if action == "ban":
+                await bot.rest.ban_user(guild_id, user_id, delete_message_days=delete_message_days, reason=reason)
+            else:
+                await bot.rest.kick_user(guild_id, user_id, reason=reason)
+
+        except hikari.HTTPError as error:
+            await bot.db.execute(
+                "UPDATE masstargets SET Done = 1, Error = ? WHERE JobID = ? AND UserID = ?",
+                error.__class__.__name__,
+                job_id,
+                user_id,
+            )
+            raise
+
+        await bot.db.execute("UPDATE masstargets SET Done = 1 WHERE JobID = ? AND UserID = ?", job_id, user_id)
+
+    status = await bot.rest.create_message(
+        channel_id, embed=mass_job_embed(bot, job_id, action, done_before, total, failed_before, "Running mass action...")
+    )
+
+    async def report(result):
+        # Checkpoint alongside every progress update, so a restart only repeats a few seconds of work.
+        await bot.db.commit()
+        await status.edit(
+            embed=mass_job_embed(
+                bot, job_id, action, done_before + result.done, total, failed_before + len(result.failed), "Running mass action..."
+            )
+        )
+
+    result = await bulk.BulkAction(user_ids, act, on_progress=report).run()
+
+    bot.modlog.record(guild_id, mod_id, f"mass {action}", reason=reason, count=len(result.succeeded))
+    await bot.db.execute("UPDATE massactions SET Status = 'done' WHERE JobID = ?", job_id)
+    await bot.db.commit()
+    await status.edit(
+        embed=mass_job_embed(
+            bot, job_id, action, done_before + result.done, total, failed_before + len(result.failed), "Mass action finished"
+        )
+    )
+
+
+def start_mass_job(bot, job_id):
+    if job_id in mod.d.mass_jobs:
+        return
+
+    task = mod.d.mass_jobs[job_id] = asyncio.create_task(run_mass_job(bot, job_id))
+    task.add_done_callback(lambda _: mod.d.mass_jobs.pop(job_id, None))
+
+
+async def create_mass_job(ctx, user_ids):
+    guild = ctx.get_guild()
+    protected = {ctx.author.id, guild.owner_id, ctx.bot.get_me().id}
+    user_ids = sorted(set(user_ids) - protected)
+
+    if not user_ids:
+        return await ctx.respond(f"{ctx.bot.cross} No accounts matched the specified criteria.")
+
+    if len(user_ids) > MAX_MASS_TARGETS:
+        return await ctx.respond(
+            f"{ctx.bot.cross} Mass actions are limited to `{MAX_MASS_TARGETS:,}` accounts at a time, but `{len(user_ids):,}` matched."
+        )
+
+    job_id = ctx.bot.generate_id()
+    await ctx.bot.db.execute(
+        "INSERT INTO massactions (JobID, GuildID, ChannelID, ModID, Action, Reason) VALUES (?, ?, ?, ?, ?, ?)",
+        job_id,
+        ctx.guild_id,
+        ctx.channel_id,
+        ctx.author.id,
+        ctx.options.action,
+        f"{ctx.options.reason} (Mass {ctx.options.action}) - Actioned by {ctx.author.username}",
+    )
+    await ctx.bot.db.executemany(
+        "INSERT INTO masstargets (JobID, UserID) VALUES (?, ?)", [(job_id, user_id) for user_id in user_ids]
+    )
+
     prefix = await ctx.bot.prefix(ctx.guild_id)
-    cmds_list = sorted(ctx.command.subcommands.values(), key=lambda c: c.name)
-    for cmd in cmds_list:
-        if cmd not in cmds:
-            cmds.append(cmd)
+    preview = "\n".join(f"<@{user_id}> (`{user_id}`)" for user_id in user_ids[:MAX_MASS_PREVIEW])
+    if (hidden := len(user_ids) - MAX_MASS_PREVIEW) > 0:
+        preview += f"\n...and {hidden:,} more."
 
     await ctx.respond(
         embed=ctx.bot.embed.build(
             ctx=ctx,
-            header="Clear",
-            thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991580004137844766/broom.png",
-            description="There are a few different clear methods you can use.",
-            fields=(
-                *(
-                    (
-                        cmd.name.title(),
-                        f"{cmd.description} For more infomation, use `{prefix}help clear {cmd.name}`",
-                        False,
-                    )
-                    for cmd in cmds
-                ),
+            header="Mass action",
+            title=f"Dry run: {ctx.options.action} {len(user_ids):,} account(s)",
+            description=(
+                f"Nothing has been actioned yet. Use `{prefix}mass run {job_id}` to go ahead,"
+                f" or `{prefix}mass cancel {job_id}` to discard this job."
             ),
+            fields=(("Accounts", preview, False),),
+        )
+    )
+
+
+@mod.command()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.command(name="mass", description="Bans or kicks many accounts at once. Use the command for information on available subcommands.")
+@lightbulb.implements(commands.prefix.PrefixCommandGroup)
+async def mass_group(ctx: lightbulb.context.base.Context):
+    await overview.group_overview(
+        ctx,
+        header="Mass action",
+        description="Mass actions are dry run first, and only carried out once confirmed with the run subcommand.",
+    )
+
+
+@mass_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.BAN_MEMBERS, hikari.Permissions.KICK_MEMBERS))
+@lightbulb.add_checks(lightbulb.bot_has_guild_permissions(hikari.Permissions.SEND_MESSAGES, hikari.Permissions.BAN_MEMBERS, hikari.Permissions.KICK_MEMBERS))
+@lightbulb.option(name="reason", description="Reason for the mass action.", type=str, default="No reason provided.", required=False, modifier=lightbulb.commands.base.OptionModifier.CONSUME_REST)
+@lightbulb.option(name="minutes", description="How many minutes back to look for new members.", type=int, required=True)
+@lightbulb.option(name="action", description="Either ban or kick.", type=str, required=True)
+@lightbulb.command(name="joined", description="Prepares a mass action against every member who joined in the last few minutes.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def mass_joined_command(ctx: lightbulb.context.base.Context):
+    if ctx.options.action not in MASS_ACTIONS:
+        return await ctx.respond(f"{ctx.bot.cross} The action must be either `ban` or `kick`.")
+
+    if not 0 < ctx.options.minutes <= MAX_JOIN_WINDOW:
+        return await ctx.respond(
+            f"{ctx.bot.cross} The join window is outside valid bounds - it should be between `1` and `{MAX_JOIN_WINDOW:,}` minutes inclusive."
         )
+
+    cutoff = dt.datetime.now(dt.timezone.utc) - dt.timedelta(minutes=ctx.options.minutes)
+    await create_mass_job(ctx, (m.id for m in ctx.get_guild().get_members().values() if m.joined_at >= cutoff))
+
+
+@mass_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.BAN_MEMBERS, hikari.Permissions.KICK_MEMBERS))
+@lightbulb.add_checks(lightbulb.bot_has_guild_permissions(hikari.Permissions.SEND_MESSAGES, hikari.Permissions.BAN_MEMBERS, hikari.Permissions.KICK_MEMBERS))
+@lightbulb.option(name="reason", description="Reason for the mass action.", type=str, default="No reason provided.", required=False, modifier=lightbulb.commands.base.OptionModifier.CONSUME_REST)
+@lightbulb.option(name="action", description="Either ban or kick.", type=str, required=True)
+@lightbulb.command(name="ids", description="Prepares a mass action against the user IDs in an attached text file.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def mass_ids_command(ctx: lightbulb.context.base.Context):
+    if ctx.options.action not in MASS_ACTIONS:
+        return await ctx.respond(f"{ctx.bot.cross} The action must be either `ban` or `kick`.")
+
+    if not ctx.attachments:
+        return await ctx.respond(f"{ctx.bot.cross} You need to attach a file containing the user IDs.")
+
+    user_ids = []
+    for attachment in ctx.attachments:
+        user_ids.extend(int(m) for m in USER_ID_REGEX.findall((await attachment.read()).decode("utf-8", "ignore")))
+
+    await create_mass_job(ctx, user_ids)
+
+
+@mass_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.BAN_MEMBERS, hikari.Permissions.KICK_MEMBERS))
+@lightbulb.add_checks(lightbulb.bot_has_guild_permissions(hikari.Permissions.SEND_MESSAGES, hikari.Permissions.BAN_MEMBERS, hikari.Permissions.KICK_MEMBERS))
+@lightbulb.option(name="job_id", description="The ID of the dry run to carry out.", type=str, required=True)
+@lightbulb.command(name="run", description="Carries out a mass action that was prepared by a dry run.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def mass_run_command(ctx: lightbulb.context.base.Context):
+    status = await ctx.bot.db.field(
+        "SELECT Status FROM massactions WHERE JobID = ? AND GuildID = ?", ctx.options.job_id, ctx.guild_id
+    )
+
+    if status is None:
+        return await ctx.respond(f"{ctx.bot.cross} That mass action does not exist.")
+
+    if status != "pending":
+        return await ctx.respond(f"{ctx.bot.cross} That mass action is already `{status}`.")
+
+    # Claimed in one statement, so if two runs race only one of them gets the job.
+    if not await ctx.bot.db.execute(
+        "UPDATE massactions SET Status = 'running' WHERE JobID = ? AND GuildID = ? AND Status = 'pending'",
+        ctx.options.job_id,
+        ctx.guild_id,
+    ):
+        return await ctx.respond(f"{ctx.bot.cross} That mass action has already been started.")
+
+    await ctx.bot.db.commit()
+    start_mass_job(ctx.bot, ctx.options.job_id)
+
+
+@mass_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.BAN_MEMBERS, hikari.Permissions.KICK_MEMBERS))
+@lightbulb.option(name="job_id", description="The ID of the mass action to cancel.", type=str, required=True)
+@lightbulb.command(name="cancel", description="Discards a dry run, or stops a mass action that is running.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def mass_cancel_command(ctx: lightbulb.context.base.Context):
+    status = await ctx.bot.db.field(
+        "SELECT Status FROM massactions WHERE JobID = ? AND GuildID = ?", ctx.options.job_id, ctx.guild_id
+    )
+
+    if status not in ("pending", "running"):
+        return await ctx.respond(f"{ctx.bot.cross} There is no pending or running mass action with that ID.")
+
+    if (task := mod.d.mass_jobs.get(ctx.options.job_id)) is not None:
+        task.cancel()
+
+    await ctx.bot.db.execute("UPDATE massactions SET Status = 'cancelled' WHERE JobID = ?", ctx.options.job_id)
+    await ctx.respond(f"{ctx.bot.tick} Mass action `{ctx.options.job_id}` cancelled.")
+
+
+async def invalid_scan(ctx):
+    if 0 < ctx.options.scan <= MAX_PURGE_SCAN:
+        return False
+
+    await ctx.respond(
+        f"{ctx.bot.cross} The number of messages to clear is outside valid bounds - it should be between `1` and `{MAX_PURGE_SCAN:,}` inclusive."
+    )
+    assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
+    await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
+    return True
+
+
+def target_predicates(ctx):
+    return [purge.by_authors(*(t.id for t in ctx.options.targets))] if ctx.options.targets else []
+
+
+async def purge_messages(ctx, *predicates, filters=(), limit):
+    status = None
+
+    async def report(p):
+        nonlocal status
+        content = (
+            f"{ctx.bot.info} Scanned `{p.scanned:,}` message(s) and deleted `{p.deleted:,}` so far"
+            f" ({p.throughput:,.1f} per second)..."
+        )
+
+        if status is None:
+            status = await (await ctx.respond(content)).message()
+            p.ignore.add(status.id)
+        else:
+            await status.edit(content=content)
+
+    result = purge.Purge(
+        ctx.bot, ctx.channel_id, predicates, filters=filters, index=mod.d.messages, limit=limit, on_progress=report
+    )
+
+    try:
+        async with ctx.get_channel().trigger_typing():
+            await result.run()
+
+    except patterns.RegexTimeout:
+        return await ctx.respond(
+            f"{ctx.bot.cross} The regular expression took too long to evaluate, so clearing was stopped."
+            f" `{result.deleted:,}` message(s) were deleted before then.", delete_after=5,
+        )
+
+    finally:
+        if status is not None:
+            await status.delete()
+
+        if result.deleted:
+            ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "clear", channel_id=ctx.channel_id, count=result.deleted)
+
+    if not result.matched:
+        await ctx.respond(
+            f"{ctx.bot.cross} No messages matched the specified criteria from the past two weeks!", delete_after=5,
+        )
+    elif result.failed:
+        await ctx.respond(
+            f"{ctx.bot.info} Only `{result.deleted:,}/{result.matched:,}` message(s) were deleted due to an error.", delete_after=5,
+        )
+    else:
+        await ctx.respond(
+            f"{ctx.bot.tick} `{result.deleted:,}` message(s) were deleted"
+            f" (`{result.scanned:,}` scanned in {result.elapsed:,.1f}s).", delete_after=5,
+        )
+
+
+@mod.command()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.command(name="clear", aliases=["clr"], description="Clears messages from the past two weeks in a channel. Use the command for information on available subcommands.")
+@lightbulb.implements(commands.prefix.PrefixCommandGroup)
+async def clear_group(ctx: lightbulb.context.base.Context):
+    await overview.group_overview(
+        ctx,
+        header="Clear",
+        thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991580004137844766/broom.png",
+        description="There are a few different clear methods you can use.",
     )
 
 
@@ -303,66 +874,14 @@ async def clear_group(ctx: lightbulb.context.base.Context):
 @lightbulb.add_cooldown(300, 5, lightbulb.buckets.UserBucket)
 @lightbulb.option(name="targets", description="The User Objects or IDs", type=hikari.Member, required=False, modifier=lightbulb.commands.base.OptionModifier.GREEDY)
 @lightbulb.option(name="scan", description="The number of messages to clear", type=int, required=True)
-@lightbulb.command(name="message", aliases=["m"], description="Clears up to 100 messages from a channel.")
+@lightbulb.command(name="message", aliases=["m"], description="Clears messages from a channel.")
 @lightbulb.implements(commands.prefix.PrefixSubCommand)
 async def clear_message_command(ctx: lightbulb.context.base.Context):
-    if not 0 < ctx.options.scan <= 100:
-        await ctx.respond(
-            f"{ctx.bot.cross} The number of messages to clear is outside valid bounds - it should be between `1` and `100` inclusive."
-        )
-        assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
-        return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
-    
-    else:
-        async with ctx.get_channel().trigger_typing():
-            channel = ctx.get_channel()
-            predicates = [
-                # Ignore deferred typing indicator so it doesn't get deleted lmfao
-                lambda message: not (hikari.MessageFlag.LOADING & message.flags)
-            ]
-
-            if ctx.options.targets:
-                predicates.extend([(lambda m: m.author.id == t.id) for t in ctx.options.targets])
-            
-                messages = (
-                    await ctx.bot.rest.fetch_messages(channel)
-                    .take_until(lambda m: (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=14)) > m.created_at)
-                    .filter(*predicates)
-                    .limit(ctx.options.scan)
-                )
-            
-                if messages:
-                    try:
-                        await ctx.bot.rest.delete_messages(channel, messages)
-                        await ctx.respond(
-                            f"{ctx.bot.tick} `{len(messages):,}` message(s) were deleted.", delete_after=5,
-                        )
-                    except hikari.BulkDeleteError as error:
-                        await ctx.respond(
-                            f"{ctx.bot.info} Only `{len(error.messages_deleted)}/{len(messages)}` message(s) were deleted due to an error.", delete_after=5,
-                        )
-                else:
-                    await ctx.respond(
-                        f"{ctx.bot.cross} No messages matched the specified criteria from the past two weeks!", delete_after=5,
-                    )
-                        
-            else:
-                messages = (
-                    await ctx.bot.rest.fetch_messages(channel)
-                    .take_until(lambda m: (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=14)) > m.created_at)
-                    .limit(ctx.options.scan + 1)
-                )
+    if await invalid_scan(ctx):
+        return
 
-                if messages:
-                    try:
-                        await ctx.bot.rest.delete_messages(channel, messages)
-                        await ctx.respond(
-                            f"{ctx.bot.tick} `{len(messages):,}` message(s) were deleted.", delete_after=5,
-                        )
-                    except hikari.BulkDeleteError as error:
-                        await ctx.respond(
-                            f"{ctx.bot.info} Only `{len(error.messages_deleted)}/{len(messages)}` message(s) were deleted due to an error.", delete_after=5,
-                        )
+    # Without targets, the invoking message is cleared along with the requested amount.
+    await purge_messages(ctx, *target_predicates(ctx), limit=ctx.options.scan + (not ctx.options.targets))
 
 
 @clear_group.child()
@@ -377,90 +896,23 @@ async def clear_message_command(ctx: lightbulb.context.base.Context):
 @lightbulb.command(name="regex", aliases=["r"], description="Only delete messages that match with the regular expression.")
 @lightbulb.implements(commands.prefix.PrefixSubCommand)
 async def clear_regex_message_command(ctx: lightbulb.context.base.Context):
-    if not 0 < ctx.options.scan <= 100:
-        await ctx.respond(
-            f"{ctx.bot.cross} The number of messages to clear is outside valid bounds - it should be between `1` and `100` inclusive."
-        )
-        assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
-        return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
-    
-    else:
-        async with ctx.get_channel().trigger_typing():
-            channel = ctx.get_channel()
-            predicates = [
-                # Ignore deferred typing indicator so it doesn't get deleted lmfao
-                lambda message: not (hikari.MessageFlag.LOADING & message.flags)
-            ]
-
-            if ctx.options.targets:
-                predicates.extend([(lambda m: m.author.id == t.id) for t in ctx.options.targets])
-                
-                try:
-                    regex = re.compile(ctx.options.regex_expression)
-                
-                except re.error as error:
-                    await ctx.respond(f"{ctx.bot.cross} Invalid regex passed. Failed parsing regex: ```{str(error)}```")
-                    assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
-                    return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
-        
-                else:
-                    predicates.append(lambda message, regex=regex: regex.match(message.content) if message.content else False)
-
-                messages = (
-                    await ctx.app.rest.fetch_messages(channel)
-                    .take_until(lambda m: (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=14)) > m.created_at)
-                    .filter(*predicates)
-                    .limit(ctx.options.scan)
-                )
-
-                if messages:
-                    try:
-                        await ctx.app.rest.delete_messages(channel, messages)
-                        await ctx.respond(
-                            f"{ctx.bot.tick} `{len(messages):,}` message(s) were deleted.", delete_after=5,
-                        )
-                    except hikari.BulkDeleteError as error:
-                        await ctx.respond(
-                            f"{ctx.bot.info} Only `{len(error.messages_deleted)}/{len(messages)}` message(s) were deleted due to an error.", delete_after=5,
-                        ) 
-                else:
-                    await ctx.respond(
-                        f"{ctx.bot.cross} No messages matched the specified criteria from the past two weeks!", delete_after=5,
-                    )
-            else:
+    if await invalid_scan(ctx):
+        return
 
-                try:
-                    regex = re.compile(ctx.options.regex_expression)
-                
-                except re.error as error:
-                    await ctx.respond(f"{ctx.bot.cross} Invalid regex passed. Failed parsing regex: ```{str(error)}```")
-                    assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
-                    return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
-        
-                else:
-                    predicates.append(lambda message, regex=regex: regex.match(message.content) if message.content else False)
+    try:
+        patterns.compile(ctx.options.regex_expression)
 
-                messages = (
-                    await ctx.app.rest.fetch_messages(channel)
-                    .take_until(lambda m: (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=14)) > m.created_at)
-                    .filter(*predicates)
-                    .limit(ctx.options.scan)
-                )
+    except re.error as error:
+        await ctx.respond(f"{ctx.bot.cross} Invalid regex passed. Failed parsing regex: ```{str(error)}```")
+        assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
+        return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
 
-                if messages:
-                    try:
-                        await ctx.app.rest.delete_messages(channel, messages)
-                        await ctx.respond(
-                            f"{ctx.bot.tick} `{len(messages):,}` message(s) were deleted.", delete_after=5,
-                        )
-                    except hikari.BulkDeleteError as error:
-                        await ctx.respond(
-                            f"{ctx.bot.info} Only `{len(error.messages_deleted)}/{len(messages)}` message(s) were deleted due to an error.", delete_after=5,
-                        ) 
-                else:
-                    await ctx.respond(
-                        f"{ctx.bot.cross} No messages matched the specified criteria from the past two weeks!", delete_after=5,
-                    )
+    await purge_messages(
+        ctx,
+        *target_predicates(ctx),
+        filters=(purge.RegexFilter(mod.d.regex, ctx.options.regex_expression),),
+        limit=ctx.options.scan,
+    )
 
 
 @clear_group.child()
@@ -474,70 +926,10 @@ async def clear_regex_message_command(ctx: lightbulb.context.base.Context):
 @lightbulb.command(name="embed", aliases=["e"], description="Only delete messages that contain embeds.")
 @lightbulb.implements(commands.prefix.PrefixSubCommand)
 async def clear_embed_message_command(ctx: lightbulb.context.base.Context):
-    if not 0 < ctx.options.scan <= 100:
-        await ctx.respond(
-            f"{ctx.bot.cross} The number of messages to clear is outside valid bounds - it should be between `1` and `100` inclusive."
-        )
-        assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
-        return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
-    
-    else:
-        async with ctx.get_channel().trigger_typing():
-            channel = ctx.get_channel()
-            predicates = [
-                # Ignore deferred typing indicator so it doesn't get deleted lmfao
-                lambda message: not (hikari.MessageFlag.LOADING & message.flags)
-            ]
-
-            if ctx.options.targets:
-                predicates.extend([(lambda m: m.author.id == t.id) for t in ctx.options.targets])
-                predicates.append(lambda message: bool(message.embeds))
-
-                messages = (
-                    await ctx.app.rest.fetch_messages(channel)
-                    .take_until(lambda m: (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=14)) > m.created_at)
-                    .filter(*predicates)
-                    .limit(ctx.options.scan)
-                )
-
-                if messages:
-                    try:
-                        await ctx.app.rest.delete_messages(channel, messages)
-                        await ctx.respond(
-                            f"{ctx.bot.tick} `{len(messages):,}` message(s) were deleted.", delete_after=5,
-                        )
-                    except hikari.BulkDeleteError as error:
-                        await ctx.respond(
-                            f"{ctx.bot.info} Only `{len(error.messages_deleted)}/{len(messages)}` message(s) were deleted due to an error.", delete_after=5,
-                        )     
-                else:
-                    await ctx.respond(
-                        f"{ctx.bot.cross} No messages matched the specified criteria from the past two weeks!", delete_after=5,
-                    )
-            else:
-                predicates.append(lambda message: bool(message.embeds))
-                
-                messages = (
-                    await ctx.app.rest.fetch_messages(channel)
-                    .take_until(lambda m: (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=14)) > m.created_at)
-                    .filter(*predicates)
-                    .limit(ctx.options.scan)
-                )
+    if await invalid_scan(ctx):
+        return
 
-                if messages:
-                    try:
-                        await ctx.app.rest.delete_messages(channel, messages)
-                        await ctx.respond(
-                            f"{ctx.bot.tick} `{len(messages):,}` message(s) were deleted.", delete_after=5,
-                        )
-                    except hikari.BulkDeleteError as error:
-                        await ctx.respond(
-                            f"{ctx.bot.info} Only `{len(error.messages_deleted)}/{len(messages)}` message(s) were deleted due to an error.", delete_after=5,
-                        ) 
-                else:
-                    await ctx.respond(
-                        f"{ctx.bot.cross} No messages matched the specified criteria from the past two weeks!", delete_after=5,
-                    )
+    await purge_messages(ctx, *target_predicates(ctx), purge.has_embeds, limit=ctx.options.scan)
 
 
 @clear_group.child()
@@ -551,70 +943,10 @@ async def clear_embed_message_command(ctx: lightbulb.context.base.Context):
 @lightbulb.command(name="links", aliases=["l"], description="Only delete messages that contain links.")
 @lightbulb.implements(commands.prefix.PrefixSubCommand)
 async def clear_link_message_command(ctx: lightbulb.context.base.Context):
-    if not 0 < ctx.options.scan <= 100:
-        await ctx.respond(
-            f"{ctx.bot.cross} The number of messages to clear is outside valid bounds - it should be between `1` and `100` inclusive."
-        )
-        assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
-        return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
-    
-    else:
-        async with ctx.get_channel().trigger_typing():
-            channel = ctx.get_channel()
-            predicates = [
-                # Ignore deferred typing indicator so it doesn't get deleted lmfao
-                lambda message: not (hikari.MessageFlag.LOADING & message.flags)
-            ]
-
-            if ctx.options.targets:
-                predicates.extend([(lambda m: m.author.id == t.id) for t in ctx.options.targets])
-                predicates.append(lambda message: is_url(message.content, fullmatch=False) if message.content else False)
-
-                messages = (
-                    await ctx.app.rest.fetch_messages(channel)
-                    .take_until(lambda m: (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=14)) > m.created_at)
-                    .filter(*predicates)
-                    .limit(ctx.options.scan)
-                )
-
-                if messages:
-                    try:
-                        await ctx.app.rest.delete_messages(channel, messages)
-                        await ctx.respond(
-                            f"{ctx.bot.tick} `{len(messages):,}` message(s) were deleted.", delete_after=5,
-                        )
-                    except hikari.BulkDeleteError as error:
-                        await ctx.respond(
-                            f"{ctx.bot.info} Only `{len(error.messages_deleted)}/{len(messages)}` message(s) were deleted due to an error.", delete_after=5,
-                        )       
-                else:
-                    await ctx.respond(
-                        f"{ctx.bot.cross} No messages matched the specified criteria from the past two weeks!", delete_after=5,
-                    )
-            else:
-                predicates.append(lambda message: is_url(message.content, fullmatch=False) if message.content else False)
-                
-                messages = (
-                    await ctx.app.rest.fetch_messages(channel)
-                    .take_until(lambda m: (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=14)) > m.created_at)
-                    .filter(*predicates)
-                    .limit(ctx.options.scan)
-                )
+    if await invalid_scan(ctx):
+        return
 
-                if messages:
-                    try:
-                        await ctx.app.rest.delete_messages(channel, messages)
-                        await ctx.respond(
-                            f"{ctx.bot.tick} `{len(messages):,}` message(s) were deleted.", delete_after=5,
-                        )
-                    except hikari.BulkDeleteError as error:
-                        await ctx.respond(
-                            f"{ctx.bot.info} Only `{len(error.messages_deleted)}/{len(messages)}` message(s) were deleted due to an error.", delete_after=5,
-                        ) 
-                else:
-                    await ctx.respond(
-                        f"{ctx.bot.cross} No messages matched the specified criteria from the past two weeks!", delete_after=5,
-                    )
+    await purge_messages(ctx, *target_predicates(ctx), HAS_LINKS, limit=ctx.options.scan)
 
 
 @clear_group.child()
@@ -628,70 +960,10 @@ async def clear_link_message_command(ctx: lightbulb.context.base.Context):
 @lightbulb.command(name="invites", aliases=["i"], description="Only delete messages that contain Discord invites.")
 @lightbulb.implements(commands.prefix.PrefixSubCommand)
 async def clear_invite_message_command(ctx: lightbulb.context.base.Context):
-    if not 0 < ctx.options.scan <= 100:
-        await ctx.respond(
-            f"{ctx.bot.cross} The number of messages to clear is outside valid bounds - it should be between `1` and `100` inclusive."
-        )
-        assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
-        return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
-    
-    else:
-        async with ctx.get_channel().trigger_typing():
-            channel = ctx.get_channel()
-            predicates = [
-                # Ignore deferred typing indicator so it doesn't get deleted lmfao
-                lambda message: not (hikari.MessageFlag.LOADING & message.flags)
-            ]
-
-            if ctx.options.targets:
-                predicates.extend([(lambda m: m.author.id == t.id) for t in ctx.options.targets])
-                predicates.append(lambda message: is_invite(message.content, fullmatch=False) if message.content else False)
-
-                messages = (
-                    await ctx.app.rest.fetch_messages(channel)
-                    .take_until(lambda m: (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=14)) > m.created_at)
-                    .filter(*predicates)
-                    .limit(ctx.options.scan)
-                )
-
-                if messages:
-                    try:
-                        await ctx.app.rest.delete_messages(channel, messages)
-                        await ctx.respond(
-                            f"{ctx.bot.tick} `{len(messages):,}` message(s) were deleted.", delete_after=5,
-                        )
-                    except hikari.BulkDeleteError as error:
-                        await ctx.respond(
-                            f"{ctx.bot.info} Only `{len(error.messages_deleted)}/{len(messages)}` message(s) were deleted due to an error.", delete_after=5,
-                        )   
-                else:
-                    await ctx.respond(
-                        f"{ctx.bot.cross} No messages matched the specified criteria from the past two weeks!", delete_after=5,
-                    )
-            else:
-                predicates.append(lambda message: is_invite(message.content, fullmatch=False) if message.content else False)
+    if await invalid_scan(ctx):
+        return
 
-                messages = (
-                    await ctx.app.rest.fetch_messages(channel)
-                    .take_until(lambda m: (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=14)) > m.created_at)
-                    .filter(*predicates)
-                    .limit(ctx.options.scan)
-                )
-
-                if messages:
-                    try:
-                        await ctx.app.rest.delete_messages(channel, messages)
-                        await ctx.respond(
-                            f"{ctx.bot.tick} `{len(messages):,}` message(s) were deleted.", delete_after=5,
-                        )
-                    except hikari.BulkDeleteError as error:
-                        await ctx.respond(
-                            f"{ctx.bot.info} Only `{len(error.messages_deleted)}/{len(messages)}` message(s) were deleted due to an error.", delete_after=5,
-                        ) 
-                else:
-                    await ctx.respond(
-                        f"{ctx.bot.cross} No messages matched the specified criteria from the past two weeks!", delete_after=5,
-                    )
+    await purge_messages(ctx, *target_predicates(ctx), HAS_INVITES, limit=ctx.options.scan)
 
 
 @clear_group.child()
@@ -705,70 +977,31 @@ async def clear_invite_message_command(ctx: lightbulb.context.base.Context):
 @lightbulb.command(name="attachments", aliases=["a"], description="Only delete messages that contain files & images.")
 @lightbulb.implements(commands.prefix.PrefixSubCommand)
 async def clear_attachment_message_command(ctx: lightbulb.context.base.Context):
-    if not 0 < ctx.options.scan <= 100:
-        await ctx.respond(
-            f"{ctx.bot.cross} The number of messages to clear is outside valid bounds - it should be between `1` and `100` inclusive."
-        )
-        assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
-        return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
-    
-    else:
-        async with ctx.get_channel().trigger_typing():
-            channel = ctx.get_channel()
-            predicates = [
-                # Ignore deferred typing indicator so it doesn't get deleted lmfao
-                lambda message: not (hikari.MessageFlag.LOADING & message.flags)
-            ]
-
-            if ctx.options.targets:
-                predicates.extend([(lambda m: m.author.id == t.id) for t in ctx.options.targets])
-                predicates.append(lambda message: bool(message.attachments))
-
-                messages = (
-                    await ctx.app.rest.fetch_messages(channel)
-                    .take_until(lambda m: (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=14)) > m.created_at)
-                    .filter(*predicates)
-                    .limit(ctx.options.scan)
-                )
+    if await invalid_scan(ctx):
+        return
 
-                if messages:
-                    try:
-                        await ctx.app.rest.delete_messages(channel, messages)
-                        await ctx.respond(
-                            f"{ctx.bot.tick} `{len(messages):,}` message(s) were deleted.", delete_after=5,
-                        )
-                    except hikari.BulkDeleteError as error:
-                        await ctx.respond(
-                            f"{ctx.bot.info} Only `{len(error.messages_deleted)}/{len(messages)}` message(s) were deleted due to an error.", delete_after=5,
-                        )     
-                else:
-                    await ctx.respond(
-                        f"{ctx.bot.cross} No messages matched the specified criteria from the past two weeks!", delete_after=5,
-                    )
-            else:
-                predicates.append(lambda message: bool(message.attachments))
+    await purge_messages(ctx, *target_predicates(ctx), purge.has_attachments, limit=ctx.options.scan)
 
-                messages = (
-                    await ctx.app.rest.fetch_messages(channel)
-                    .take_until(lambda m: (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=14)) > m.created_at)
-                    .filter(*predicates)
-                    .limit(ctx.options.scan)
-                )
 
-                if messages:
-                    try:
-                        await ctx.app.rest.delete_messages(channel, messages)
-                        await ctx.respond(
-                            f"{ctx.bot.tick} `{len(messages):,}` message(s) were deleted.", delete_after=5,
-                        )
-                    except hikari.BulkDeleteError as error:
-                        await ctx.respond(
-                            f"{ctx.bot.info} Only `{len(error.messages_deleted)}/{len(messages)}` message(s) were deleted due to an error.", delete_after=5,
-                        ) 
-                else:
-                    await ctx.respond(
-                        f"{ctx.bot.cross} No messages matched the specified criteria from the past two weeks!", delete_after=5,
-                    )
+@clear_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.MANAGE_MESSAGES))
+@lightbulb.command(name="index", description="Toggles keeping an in-memory index of this channel's messages, so clears can skip fetching them.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def clear_index_command(ctx: lightbulb.context.base.Context):
+    if ctx.channel_id in mod.d.messages:
+        mod.d.messages.disable(ctx.channel_id)
+        await ctx.bot.db.execute("DELETE FROM indexedchannels WHERE ChannelID = ?", ctx.channel_id)
+        await ctx.respond(f"{ctx.bot.tick} Messages in this channel are no longer indexed.")
+    else:
+        mod.d.messages.enable(ctx.channel_id)
+        await ctx.bot.db.execute(
+            "INSERT OR IGNORE INTO indexedchannels (ChannelID, GuildID) VALUES (?, ?)", ctx.channel_id, ctx.guild_id
+        )
+        await ctx.respond(
+            f"{ctx.bot.tick} Messages sent in this channel from now on will be indexed. Older messages are still fetched when clearing."
+        )
 
 
 @mod.command()
@@ -785,60 +1018,124 @@ async def clearchannel_command(ctx: lightbulb.context.base.Context):
     reason = ctx.options.reason
     target = ctx.options.target
     ctx_is_target = ctx.get_channel() == target
-    if target.permission_overwrites is not None:
-        permission_overwrites = tuple(target.permission_overwrites.values())
-    else:
-        permission_overwrites = None
+
+    if not snapshot.supported(target):
+        return await ctx.respond(f"{ctx.bot.cross} Solaris can not clear that type of channel.")
 
     async with ctx.get_channel().trigger_typing():
-        if isinstance(target, hikari.GuildTextChannel):
-            await ctx.get_guild().create_text_channel(
-                name=target.name,
-                topic=target.topic,
-                nsfw=target.is_nsfw,
-                rate_limit_per_user=target.rate_limit_per_user,
-                permission_overwrites=permission_overwrites,
-                category=target.parent_id,
-                reason=f"{reason} - Actioned by {ctx.author.username}"
-            )
+        await replace_channel(ctx.bot, ctx.guild_id, target, snapshot.take(target), f"{reason} - Actioned by {ctx.author.username}")
+        ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "clearchannel", channel_id=target.id, reason=reason)
 
-        elif isinstance(target, hikari.GuildNewsChannel):
-            await ctx.get_guild().create_news_channel(
-                name=target.name,
-                topic=target.topic,
-                nsfw=target.is_nsfw,
-                rate_limit_per_user=target.rate_limit_per_user,
-                permission_overwrites=permission_overwrites,
-                category=target.parent_id,
-                reason=f"{reason} - Actioned by {ctx.author.username}"
-            )
+        if not ctx_is_target:
+            await ctx.respond(f"{ctx.bot.tick} Channel cleared.")
 
-        elif isinstance(target, hikari.GuildVoiceChannel):
-            await ctx.get_guild().create_voice_channel(
-                name=target.name,
-                user_limit=target.user_limit,
-                bitrate=target.bitrate,
-                video_quality_mode=target.video_quality_mode,
-                permission_overwrites=permission_overwrites,
-                region=target.region,
-                category=target.parent_id,
-                reason=f"{reason} - Actioned by {ctx.author.username}"
-            )
-            
-        if isinstance(target, hikari.GuildStageChannel):
-            await ctx.get_guild().create_stage_channel(
-                name=target.name,
-                user_limit=target.user_limit,
-                bitrate=target.bitrate,
-                permission_overwrites=permission_overwrites,
-                region=target.region,
-                category=target.parent_id,
-                reason=f"{reason} - Actioned by {ctx.author.username}"
+
+async def replace_channel(bot, guild_id, channel, snap, reason):
+    new = await snapshot.restore(bot.rest, guild_id, snap, reason=reason)
+
+    try:
+        await channel.delete()
+    except hikari.HTTPError:
+        # Never leave two copies of the same channel behind.
+        await new.delete()
+        raise
+
+    return new
+
+
+@mod.command()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.command(name="snapshot", aliases=["snap"], description="Saves and restores channels. Use the command for information on available subcommands.")
+@lightbulb.implements(commands.prefix.PrefixCommandGroup)
+async def snapshot_group(ctx: lightbulb.context.base.Context):
+    await overview.group_overview(
+        ctx,
+        header="Snapshot",
+        description="Snapshots record a channel's settings and permissions, so it can be rebuilt after a raid.",
+    )
+
+
+@snapshot_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.MANAGE_CHANNELS))
+@lightbulb.option(name="targets", description="The channels to snapshot", type=hikari.GuildChannel, required=False, modifier=lightbulb.commands.base.OptionModifier.GREEDY)
+@lightbulb.command(name="take", description="Saves a snapshot of the given channels, or every channel in the server if none are given.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def snapshot_take_command(ctx: lightbulb.context.base.Context):
+    channels = ctx.options.targets or ctx.get_guild().get_channels().values()
+    snaps = [snapshot.take(channel) for channel in channels if snapshot.supported(channel)]
+
+    await ctx.bot.db.executemany(
+        "INSERT OR REPLACE INTO channelsnapshots (GuildID, ChannelID, Snapshot) VALUES (?, ?, ?)",
+        [(ctx.guild_id, snap.id, snapshot.dumps(snap)) for snap in snaps],
+    )
+    await ctx.respond(f"{ctx.bot.tick} Saved snapshots of `{len(snaps):,}` channel(s).")
+
+
+@snapshot_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.MANAGE_CHANNELS))
+@lightbulb.add_checks(lightbulb.bot_has_guild_permissions(hikari.Permissions.SEND_MESSAGES, hikari.Permissions.MANAGE_CHANNELS))
+@lightbulb.add_cooldown(300, 1, lightbulb.buckets.GuildBucket)
+@lightbulb.option(name="reason", description="Reason for the restore", type=str, default="No reason provided.", required=False, modifier=lightbulb.commands.base.OptionModifier.CONSUME_REST)
+@lightbulb.option(name="targets", description="IDs of the snapshotted channels to rebuild", type=int, required=False, modifier=lightbulb.commands.base.OptionModifier.GREEDY)
+@lightbulb.command(name="restore", description="Recreates snapshotted channels that were deleted. Channels given by ID are rebuilt even if they still exist.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def snapshot_restore_command(ctx: lightbulb.context.base.Context):
+    reason = f"{ctx.options.reason} - Actioned by {ctx.author.username}"
+    targets = set(ctx.options.targets or ())
+    snaps = [
+        snapshot.loads(data)
+        for data in await ctx.bot.db.column("SELECT Snapshot FROM channelsnapshots WHERE GuildID = ?", ctx.guild_id)
+    ]
+    # Without explicit targets, only channels that no longer exist are rebuilt.
+    snaps = [
+        snap for snap in snaps
+        if (snap.id in targets if targets else ctx.bot.cache.get_guild_channel(snap.id) is None)
+    ]
+
+    if not snaps:
+        return await ctx.respond(f"{ctx.bot.info} There are no snapshotted channels to restore.")
+
+    # Categories go first, so that restored channels can be put back under their new IDs.
+    parents = {}
+    restored = failed = 0
+
+    async with ctx.get_channel().trigger_typing():
+        for snap in sorted(snaps, key=lambda s: (s.type != hikari.ChannelType.GUILD_CATEGORY, s.position)):
+            if snap.parent_id in parents:
+                snap = snap._replace(parent_id=parents[snap.parent_id])
+            elif snap.parent_id is not None and ctx.bot.cache.get_guild_channel(snap.parent_id) is None:
+                snap = snap._replace(parent_id=None)
+
+            try:
+                if (channel := ctx.bot.cache.get_guild_channel(snap.id)) is not None:
+                    new = await replace_channel(ctx.bot, ctx.guild_id, channel, snap, reason)
+                else:
+                    new = await snapshot.restore(ctx.bot.rest, ctx.guild_id, snap, reason=reason)
+            except hikari.HTTPError:
+                failed += 1
+                continue
+
+            parents[snap.id] = new.id
+            restored += 1
+            await ctx.bot.db.execute(
+                "UPDATE channelsnapshots SET ChannelID = ?, Snapshot = ? WHERE GuildID = ? AND ChannelID = ?",
+                new.id,
+                snapshot.dumps(snap._replace(id=int(new.id))),
+                ctx.guild_id,
+                snap.id,
             )
-        await target.delete()
 
-        if not ctx_is_target:
-            await ctx.respond(f"{ctx.bot.tick} Channel cleared.")
+    if ctx.channel_id in targets:
+        return
+
+    message = f"{ctx.bot.tick} Restored `{restored:,}` channel(s)."
+    if failed:
+        message += f" `{failed:,}` could not be restored."
+    await ctx.respond(message)
 
 
 @mod.command()
@@ -846,30 +1143,11 @@ async def clearchannel_command(ctx: lightbulb.context.base.Context):
 @lightbulb.command(name="timeout", aliases=["to"], description="Timeout a user. Use the command for information on available subcommands.")
 @lightbulb.implements(commands.prefix.PrefixCommandGroup)
 async def timeout_group(ctx: lightbulb.context.base.Context):
-    cmds = []
-    prefix = await ctx.bot.prefix(ctx.guild_id)
-    cmds_list = sorted(ctx.command.subcommands.values(), key=lambda c: c.name)
-    for cmd in cmds_list:
-        if cmd not in cmds:
-            cmds.append(cmd)
-
-    await ctx.respond(
-        embed=ctx.bot.embed.build(
-            ctx=ctx,
-            header="Timeout",
-            thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991580653185417246/stopwatch.png",
-            description="There are a few different timeout methods you can use.",
-            fields=(
-                *(
-                    (
-                        cmd.name.title(),
-                        f"{cmd.description} For more infomation, use `{prefix}help timeout {cmd.name}`",
-                        False,
-                    )
-                    for cmd in cmds
-                ),
-            ),
-        )
+    await overview.group_overview(
+        ctx,
+        header="Timeout",
+        thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991580653185417246/stopwatch.png",
+        description="There are a few different timeout methods you can use.",
     )
 
 
@@ -905,6 +1183,7 @@ async def timeout_add_command(ctx: lightbulb.context.base.Context):
                         communication_disabled_until=today + dt.timedelta(days=ctx.options.duration),
                         reason=f"{ctx.options.reason} - Actioned by {ctx.author.username}"
                     )
+                    ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "timeout", target.id, reason=ctx.options.reason)
                     count += 1
                 except hikari.ForbiddenError:
                     await ctx.respond(
@@ -937,6 +1216,7 @@ async def timeout_remove_command(ctx: lightbulb.context.base.Context):
                         communication_disabled_until=None,
                         reason=f"{ctx.options.reason} - Actioned by {ctx.author.username}"
                     )
+                    ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "untimeout", target.id, reason=ctx.options.reason)
                     count += 1
                 except hikari.ForbiddenError:
                     await ctx.respond(
@@ -996,30 +1276,11 @@ async def slowmode_command(ctx: lightbulb.context.base.Context):
 @lightbulb.command(name="create", aliases=["crt", "mk"], description="Creates new items in singular or batches. Use the command for information on available subcommands.")
 @lightbulb.implements(commands.prefix.PrefixCommandGroup)
 async def create_group(ctx: lightbulb.context.base.Context):
-    cmds = []
-    prefix = await ctx.bot.prefix(ctx.guild_id)
-    cmds_list = sorted(ctx.command.subcommands.values(), key=lambda c: c.name)
-    for cmd in cmds_list:
-        if cmd not in cmds:
-            cmds.append(cmd)
-
-    await ctx.respond(
-        embed=ctx.bot.embed.build(
-            ctx=ctx,
-            header="create",
-            thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991584795572306020/add-image.png",
-            description="There are a few different creation methods you can use.",
-            fields=(
-                *(
-                    (
-                        cmd.name.title(),
-                        f"{cmd.description} For more infomation, use `{prefix}help create {cmd.name}`",
-                        False,
-                    )
-                    for cmd in cmds
-                ),
-            ),
-        )
+    await overview.group_overview(
+        ctx,
+        header="create",
+        thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991584795572306020/add-image.png",
+        description="There are a few different creation methods you can use.",
     )
 
 
@@ -1143,60 +1404,151 @@ async def clearnickname_command(ctx: lightbulb.context.base.Context):
 @lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.MANAGE_NICKNAMES))
 @lightbulb.add_checks(lightbulb.bot_has_guild_permissions(hikari.Permissions.SEND_MESSAGES, hikari.Permissions.MANAGE_NICKNAMES))
 @lightbulb.add_cooldown(callback=lambda _: lightbulb.buckets.UserBucket(3600, 1))
+@lightbulb.option(name="preview", description="Whether to only preview the changes", type=bool, default=False, required=False)
 @lightbulb.option(name="strict", description="Whether to change it strictly or not", type=bool, default=False, required=False)
 @lightbulb.command(name="unhoistnicknames", description="Unhoists the nicknames of all members.")
 @lightbulb.implements(commands.prefix.PrefixCommand)
 async def unhoistnicknames_command(ctx: lightbulb.context.base.Context):
-    count = 0
-    strict = ctx.options.strict
+    regex = STRICT_UNHOIST_REGEX if ctx.options.strict else UNHOIST_REGEX
+    members = ctx.get_guild().get_members().values()
+    changes = unhoist_changes(members, regex)
+
+    if ctx.options.preview or not changes:
+        examples = "\n".join(
+            f"`{member.display_name}` -> `{name}`" for member, name in changes[:MAX_UNHOIST_PREVIEW]
+        )
+        if (hidden := len(changes) - MAX_UNHOIST_PREVIEW) > 0:
+            examples += f"\n...and {hidden:,} more."
+
+        await ctx.respond(
+            embed=ctx.bot.embed.build(
+                ctx=ctx,
+                header="Unhoist",
+                title="Nickname unhoist preview",
+                description=f"`{len(changes):,}` of `{len(members):,}` member(s) would be unhoisted.",
+                fields=((("Changes", examples, False),) if examples else ()),
+            )
+        )
+        # Previews don't change anything, so they shouldn't hold up the real run.
+        assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
+        return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
+
+    reason = f"Unhoisted. - Actioned by {ctx.author.username}"
+    status = None
+
+    async def unhoist(change):
+        member, name = change
+        await member.edit(nick=name, reason=reason)
+
+    async def report(result):
+        nonlocal status
+        message = f"{ctx.bot.info} Unhoisting nicknames... `{result.done:,}/{len(changes):,}`"
+        if status is None:
+            status = await (await ctx.respond(message)).message()
+        else:
+            await status.edit(message)
 
     async with ctx.get_channel().trigger_typing():
-        for member in ctx.get_guild().get_members():
-            try:
-                match = re.match(
-                    rf"[{STRICT_UNHOIST_PATTERN if strict else UNHOIST_PATTERN}]+", ctx.bot.cache.get_member(ctx.guild_id, member).display_name
-                )
-                if match is not None:
-                    await ctx.bot.cache.get_member(ctx.guild_id, member).edit(
-                        nick=ctx.bot.cache.get_member(ctx.guild_id, member).display_name.replace(match.group(), "", 1),
-                        reason=f"Unhoisted. - Actioned by {ctx.author.username}",
-                    )
-                    count += 1
-            except hikari.ForbiddenError:
-                pass
+        result = await bulk.BulkAction(changes, unhoist, on_progress=report).run()
+
+    message = f"{ctx.bot.tick} Unhoisted `{len(result.succeeded):,}` nicknames."
+    if result.failed:
+        message += f" `{len(result.failed):,}` could not be changed."
 
-        await ctx.respond(f"{ctx.bot.tick} Unhoisted `{count:,}` nicknames.")
+    if status is not None:
+        await status.edit(message)
+    else:
+        await ctx.respond(message)
 
 
 @mod.command()
 @lightbulb.add_checks(lightbulb.guild_only)
-@lightbulb.command(name="delete", aliases=["del", "rm"], description="Deletes items in singular or batches. Use the command for information on available subcommands.")
-@lightbulb.implements(commands.prefix.PrefixCommandGroup)
-async def delete_group(ctx: lightbulb.context.base.Context):
-    cmds = []
-    prefix = await ctx.bot.prefix(ctx.guild_id)
-    cmds_list = sorted(ctx.command.subcommands.values(), key=lambda c: c.name)
-    for cmd in cmds_list:
-        if cmd not in cmds:
-            cmds.append(cmd)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.MANAGE_GUILD))
+@lightbulb.add_checks(lightbulb.bot_has_guild_permissions(hikari.Permissions.SEND_MESSAGES, hikari.Permissions.MANAGE_NICKNAMES))
+@lightbulb.option(name="mode", description="Either on, strict, or off.", type=str, required=True)
+@lightbulb.command(name="autounhoist", description="Unhoists nicknames automatically as members join or change them.")
+@lightbulb.implements(commands.prefix.PrefixCommand)
+async def autounhoist_command(ctx: lightbulb.context.base.Context):
+    mode = ctx.options.mode.lower()
 
-    await ctx.respond(
-        embed=ctx.bot.embed.build(
+    if mode == "off":
+        mod.d.unhoist.pop(ctx.guild_id, None)
+        await ctx.bot.db.execute("DELETE FROM autounhoist WHERE GuildID = ?", ctx.guild_id)
+        return await ctx.respond(f"{ctx.bot.tick} Nicknames will no longer be unhoisted automatically.")
+
+    if mode not in ("on", "strict"):
+        return await ctx.respond(f"{ctx.bot.cross} The mode must be one of `on`, `strict`, or `off`.")
+
+    mod.d.unhoist[ctx.guild_id] = STRICT_UNHOIST_REGEX if mode == "strict" else UNHOIST_REGEX
+    await ctx.bot.db.execute(
+        "INSERT OR REPLACE INTO autounhoist (GuildID, Strict) VALUES (?, ?)", ctx.guild_id, int(mode == "strict")
+    )
+    await ctx.respond(f"{ctx.bot.tick} Nicknames will now be unhoisted automatically{' (strict)' if mode == 'strict' else ''}.")
+
+
+async def bulk_delete(ctx, items, action, *, noun, label=lambda item: getattr(item, "name", item), last=None):
+    status = None
+
+    def progress_embed(result, title):
+        failures = "\n".join(
+            f"{label(item)} - {error.__class__.__name__}" for item, error in result.failed[:MAX_LISTED_FAILURES]
+        )
+        if (hidden := len(result.failed) - MAX_LISTED_FAILURES) > 0:
+            failures += f"\n...and {hidden:,} more."
+
+        return ctx.bot.embed.build(
             ctx=ctx,
             header="Delete",
-            thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991585028528148530/delete.png",
-            description="There are a few different deletion methods you can use.",
+            title=title,
+            description=f"`{result.done:,}/{len(result.items):,}` {noun}(s) processed in {result.elapsed:,.1f}s.",
             fields=(
-                *(
-                    (
-                        cmd.name.title(),
-                        f"{cmd.description} For more infomation, use `{prefix}help delete {cmd.name}`",
-                        False,
-                    )
-                    for cmd in cmds
-                ),
+                ("Deleted", f"{len(result.succeeded):,}", True),
+                ("Failed", f"{len(result.failed):,}", True),
+                *((("Failures", failures, False),) if failures else ()),
             ),
         )
+
+    async def report(result):
+        nonlocal status
+        if status is None:
+            status = await (await ctx.respond(embed=progress_embed(result, f"Deleting {noun}s..."))).message()
+        else:
+            await status.edit(embed=progress_embed(result, f"Deleting {noun}s..."))
+
+    async with ctx.get_channel().trigger_typing():
+        result = await bulk.BulkAction(items, action, on_progress=report).run()
+
+    deleted = len(result.succeeded)
+    try:
+        # Progress is reported in the invoking channel, so if that's being deleted, it goes after everything else.
+        if last is not None:
+            await action(last)
+            deleted += 1
+    finally:
+        if deleted:
+            ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, f"delete {noun}", count=deleted)
+
+    return result, status, progress_embed(result, f"Finished deleting {noun}s")
+
+
+async def finish_bulk_delete(ctx, status, embed):
+    if status is not None:
+        await status.edit(embed=embed)
+    else:
+        await ctx.respond(embed=embed)
+
+
+@mod.command()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.command(name="delete", aliases=["del", "rm"], description="Deletes items in singular or batches. Use the command for information on available subcommands.")
+@lightbulb.implements(commands.prefix.PrefixCommandGroup)
+async def delete_group(ctx: lightbulb.context.base.Context):
+    await overview.group_overview(
+        ctx,
+        header="Delete",
+        thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991585028528148530/delete.png",
+        description="There are a few different deletion methods you can use.",
     )
 
 
@@ -1218,6 +1570,7 @@ async def delete_channel_command(ctx: lightbulb.context.base.Context):
     async with ctx.get_channel().trigger_typing():
         await target.delete()
         #await target.delete(reason=f"{reason} - Actioned by {ctx.author.username}")
+        ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "delete channel", channel_id=target.id)
 
         if not ctx_is_target:
             await ctx.respond(f"{ctx.bot.tick} Channel deleted.")
@@ -1242,17 +1595,12 @@ async def delete_channels_command(ctx: lightbulb.context.base.Context):
         assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
         return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
     else:
-        ctx_in_targets = ctx.get_channel() in targets
-        count = 0
+        others = [t for t in targets if t.id != ctx.channel_id]
+        last = ctx.channel_id if len(others) != len(targets) else None
+        result, status, embed = await bulk_delete(ctx, others, ctx.bot.rest.delete_channel, noun="channel", last=last)
 
-        async with ctx.get_channel().trigger_typing():
-            for target in targets:
-                await target.delete()
-                #await target.delete(reason=f"{reason} - Actioned by {ctx.author.username}")
-                count += 1
-
-        if not ctx_in_targets:
-            await ctx.respond(f"{ctx.bot.tick} `{count:,}` channel(s) were deleted.")
+        if last is None:
+            await finish_bulk_delete(ctx, status, embed)
 
 
 @delete_group.child()
@@ -1268,20 +1616,20 @@ async def delete_channels_command(ctx: lightbulb.context.base.Context):
 async def delete_category_command(ctx: lightbulb.context.base.Context):
     target = ctx.options.target
     #reason = ctx.options.reason
-    all_channels = ctx.bot.cache.get_guild_channels_view_for_guild(ctx.guild_id)
-    category_channels = [c for c in all_channels if all_channel_under_category(ctx, c, target.id) is True]
-    ctx_in_targets = ctx.get_channel().id in category_channels
+    channels = [
+        c for c in ctx.bot.cache.get_guild_channels_view_for_guild(ctx.guild_id).values() if c.parent_id == target.id
+    ]
+    others = [c for c in channels if c.id != ctx.channel_id]
+    last = ctx.channel_id if len(others) != len(channels) else None
 
-    async with ctx.get_channel().trigger_typing():
-        for tc in all_channels:
-            if ctx.bot.cache.get_guild_channel(tc).parent_id == target.id:
-                await ctx.bot.cache.get_guild_channel(tc).delete()
-            #await ctx.bot.cache.get_guild_channel(tc).delete(reason=f"{reason} - Actioned by {ctx.author.username}")
-        await target.delete()
-        #await target.delete(reason=f"{reason} - Actioned by {ctx.author.username}")
+    result, status, embed = await bulk_delete(ctx, others, ctx.bot.rest.delete_channel, noun="channel", last=last)
+
+    await target.delete()
+    #await target.delete(reason=f"{reason} - Actioned by {ctx.author.username}")
+    ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "delete category", channel_id=target.id)
 
-        if not ctx_in_targets:
-            await ctx.respond(f"{ctx.bot.tick} Category deleted.")
+    if last is None:
+        await finish_bulk_delete(ctx, status, embed)
 
 
 @delete_group.child()
@@ -1301,6 +1649,7 @@ async def delete_role_command(ctx: lightbulb.context.base.Context):
     async with ctx.get_channel().trigger_typing():
         await ctx.bot.rest.delete_role(ctx.guild_id, target.id)
         #await target.delete(reason=f"{reason} - Actioned by {ctx.author.username}")
+        ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "delete role")
 
         await ctx.respond(f"{ctx.bot.tick} Role deleted.")
 
@@ -1324,15 +1673,10 @@ async def delete_roles_command(ctx: lightbulb.context.base.Context):
         assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
         return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
     else:
-        count = 0
-
-        async with ctx.get_channel().trigger_typing():
-            for target in targets:
-                await ctx.bot.rest.delete_role(ctx.guild_id, target.id)
-                #await target.delete(reason=f"{reason} - Actioned by {ctx.author.username}")
-                count += 1
-
-        await ctx.respond(f"{ctx.bot.tick} `{count:,}` role(s) were deleted.")
+        result, status, embed = await bulk_delete(
+            ctx, targets, lambda target: ctx.bot.rest.delete_role(ctx.guild_id, target.id), noun="role"
+        )
+        await finish_bulk_delete(ctx, status, embed)
 
 
 @delete_group.child()
@@ -1348,6 +1692,7 @@ async def delete_roles_command(ctx: lightbulb.context.base.Context):
 async def delete_emoji_command(ctx: lightbulb.context.base.Context):
     async with ctx.get_channel().trigger_typing():
         await ctx.bot.rest.delete_emoji(guild=ctx.guild_id, emoji=ctx.options.target, reason=f"{ctx.options.reason} - Actioned by {ctx.author.username}")
+        ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "delete emoji", reason=ctx.options.reason)
         await ctx.respond(f"{ctx.bot.tick} Successfully deleted the Emoji.")
 
 
@@ -1369,13 +1714,11 @@ async def delete_emojis_command(ctx: lightbulb.context.base.Context):
         assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
         return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
     else:
-        count = 0
-        
-        async with ctx.get_channel().trigger_typing():
-            for target in ctx.options.targets:
-                await ctx.bot.rest.delete_emoji(guild=ctx.guild_id, emoji=target, reason=f"{ctx.options.reason} - Actioned by {ctx.author.username}")
-                count += 1
-            await ctx.respond(f"{ctx.bot.tick} `{count:,}` emoji(s) were deleted.")
+        reason = f"{ctx.options.reason} - Actioned by {ctx.author.username}"
+        result, status, embed = await bulk_delete(
+            ctx, targets, lambda target: ctx.bot.rest.delete_emoji(guild=ctx.guild_id, emoji=target, reason=reason), noun="emoji"
+        )
+        await finish_bulk_delete(ctx, status, embed)
 
 
 @delete_group.child()
@@ -1389,9 +1732,9 @@ async def delete_emojis_command(ctx: lightbulb.context.base.Context):
 @lightbulb.command(name="sticker", aliases=["st"], description="Deletes the specified sticker.")
 @lightbulb.implements(commands.prefix.PrefixSubCommand)
 async def delete_sticker_command(ctx: lightbulb.context.base.Context):
-    target = await ctx.bot.rest.fetch_sticker(ctx.options.ID)
     async with ctx.get_channel().trigger_typing():
-        await ctx.get_guild().delete_sticker(sticker=target, reason=f"{ctx.options.reason} - Actioned by {ctx.author.username}")
+        await ctx.bot.rest.delete_sticker(ctx.guild_id, ctx.options.ID, reason=f"{ctx.options.reason} - Actioned by {ctx.author.username}")
+        ctx.bot.modlog.record(ctx.guild_id, ctx.author.id, "delete sticker", reason=ctx.options.reason)
         await ctx.respond(f"{ctx.bot.tick} Successfully deleted the sticker.")
 
 
@@ -1406,20 +1749,105 @@ async def delete_sticker_command(ctx: lightbulb.context.base.Context):
 @lightbulb.command(name="stickers", description="Deletes the specified stickers.")
 @lightbulb.implements(commands.prefix.PrefixSubCommand)
 async def delete_stickers_command(ctx: lightbulb.context.base.Context):
-    targets = ctx.options.targets
+    targets = ctx.options.IDs
 
     if not targets:
         await ctx.respond(f"{ctx.bot.cross} No valid targets were passed.")
         assert ctx.invoked is not None and ctx.invoked.cooldown_manager is not None
         return await ctx.invoked.cooldown_manager.reset_cooldown(ctx)
     else:
-        count = 0
-        async with ctx.get_channel().trigger_typing():
-            for sticker in ctx.options.IDs:
-                target = await ctx.bot.rest.fetch_sticker(sticker)
-                await ctx.get_guild().delete_sticker(sticker=target, reason=f"{ctx.options.reason} - Actioned by {ctx.author.username}")
-                count += 1
-            await ctx.respond(f"{ctx.bot.tick} Successfully deleted the sticker.")
+        # Stickers are deleted by ID directly, there is no need to fetch each one first.
+        reason = f"{ctx.options.reason} - Actioned by {ctx.author.username}"
+        result, status, embed = await bulk_delete(
+            ctx, targets, lambda sticker: ctx.bot.rest.delete_sticker(ctx.guild_id, sticker, reason=reason), noun="sticker"
+        )
+        await finish_bulk_delete(ctx, status, embed)
+
+
+async def show_modlog(ctx, title, condition="", *values):
+    # Anything still waiting to be written should show up too.
+    await ctx.bot.modlog.flush()
+
+    total = await ctx.bot.db.field(f"SELECT COUNT(*) FROM modactions WHERE GuildID = ?{condition}", ctx.guild_id, *values)
+    if not total:
+        return await ctx.respond(f"{ctx.bot.info} No moderation actions have been logged.")
+
+    def line(action_id, mod_id, target_id, channel_id, action, reason, count, action_time):
+        target = f" <@{target_id}>" if target_id is not None else ""
+        channel = f" in <#{channel_id}>" if channel_id is not None else ""
+        amount = f" ×{count:,}" if count > 1 else ""
+        return (
+            f"`#{action_id}` **{action.title()}**{amount}{target}{channel} by <@{mod_id}>"
+            f" on {chron.short_date_and_time(chron.from_iso(action_time))}"
+            + (f"\n> {reason}" if reason else "")
+        )
+
+    async def render(page):
+        records = await ctx.bot.db.records(
+            "SELECT ActionID, ModID, TargetID, ChannelID, Action, Reason, Count, ActionTime FROM modactions "
+            f"WHERE GuildID = ?{condition} ORDER BY ActionTime DESC, ActionID DESC LIMIT ? OFFSET ?",
+            ctx.guild_id,
+            *values,
+            MODLOG_RESULTS_PER_PAGE,
+            page * MODLOG_RESULTS_PER_PAGE,
+        )
+
+        return {
+            "header": "Modlog",
+            "title": title,
+            "description": "\n".join(line(*record) for record in records),
+            "thumbnail": ctx.get_guild().icon_url,
+        }
+
+    # Each page is its own query, run the first time it's shown.
+    pages = range(-(-total // MODLOG_RESULTS_PER_PAGE))
+    await menu.MultiPageMenu(ctx, menu.PageSource(pages, render), timeout=120.0).start()
+
+
+@mod.command()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.command(name="modlog", aliases=["ml"], description="Shows logged moderation actions. Use the command for information on available subcommands.")
+@lightbulb.implements(commands.prefix.PrefixCommandGroup)
+async def modlog_group(ctx: lightbulb.context.base.Context):
+    await overview.group_overview(
+        ctx,
+        header="Modlog",
+        description="Every moderation action taken through Solaris is logged, newest first.",
+    )
+
+
+@modlog_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.VIEW_AUDIT_LOG))
+@lightbulb.command(name="recent", description="Shows the most recent moderation actions in this server.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def modlog_recent_command(ctx: lightbulb.context.base.Context):
+    await show_modlog(ctx, "Recent moderation actions")
+
+
+@modlog_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.VIEW_AUDIT_LOG))
+@lightbulb.option(name="target", description="The user to look up.", type=hikari.User, required=True)
+@lightbulb.command(name="user", description="Shows the moderation actions taken against a user.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def modlog_user_command(ctx: lightbulb.context.base.Context):
+    target = ctx.options.target
+    await show_modlog(ctx, f"Moderation actions against {target.username}", " AND TargetID = ?", target.id)
+
+
+@modlog_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.add_checks(lightbulb.has_guild_permissions(hikari.Permissions.VIEW_AUDIT_LOG))
+@lightbulb.option(name="moderator", description="The moderator to look up.", type=hikari.User, required=True)
+@lightbulb.command(name="mod", description="Shows the moderation actions taken by a moderator.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def modlog_mod_command(ctx: lightbulb.context.base.Context):
+    moderator = ctx.options.moderator
+    await show_modlog(ctx, f"Moderation actions by {moderator.username}", " AND ModID = ?", moderator.id)
 
 
 def load(bot) -> None:
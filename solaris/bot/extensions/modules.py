@@ -28,7 +28,7 @@ import lightbulb
 from lightbulb import commands
 
 from solaris import Config
-from solaris.utils import ERROR_ICON, LOADING_ICON, SUCCESS_ICON, checks, menu, modules
+from solaris.utils import ERROR_ICON, LOADING_ICON, SUCCESS_ICON, checks, menu, modules, overview
 
 
 class SetupMenu(menu.SelectionMenu):
@@ -248,30 +248,11 @@ async def setup_command(ctx: lightbulb.context.base.Context) -> None:
 @lightbulb.command(name="config", aliases=["set"], description="Configures Solaris; use `help config` to bring up a special help menu.")
 @lightbulb.implements(commands.prefix.PrefixCommandGroup)
 async def config_group(ctx: lightbulb.context.base.Context):
-    cmds = []
-    prefix = await ctx.bot.prefix(ctx.guild_id)
-    cmds_list = sorted(ctx.command.subcommands.values(), key=lambda c: c.name)
-    for cmd in cmds_list:
-        if cmd not in cmds:
-            cmds.append(cmd)
-
-    await ctx.respond(
-        embed=ctx.bot.embed.build(
-            ctx=ctx,
-            header="Config",
-            thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991585569647906836/config.png",
-            description="There are a few different config methods you can use.",
-            fields=(
-                *(
-                    (
-                        cmd.name.title(),
-                        f"{cmd.description} For more infomation, use `{prefix}help config {cmd.name}`",
-                        False,
-                    )
-                    for cmd in cmds
-                ),
-            ),
-        )
+    await overview.group_overview(
+        ctx,
+        header="Config",
+        thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991585569647906836/config.png",
+        description="There are a few different config methods you can use.",
     )
 
 
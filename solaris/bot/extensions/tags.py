@@ -24,10 +24,17 @@ from lightbulb import commands
 import typing as t
 from string import ascii_lowercase
 
-from solaris.utils import menu, checks, markdown, converters
+from solaris.utils import LRUCache, NGramIndex, menu, checks, markdown, converters, overview
 
 #MAX_TAGS = 35
 MAX_TAGNAME_LENGTH = 25
+MAX_CACHED_TAGS = 256
+MAX_INDEXED_GUILDS = 64
+# Past this many names, a guild's index drops the least recently used to make room. Those just stop being suggested.
+MAX_INDEXED_NAMES = 5000
+MAX_SUGGESTIONS = 5
+MAX_PREVIEW_LENGTH = 350
+SEARCH_RESULTS_PER_PAGE = 5
 
 
 class HelpMenu(menu.MultiPageMenu):
@@ -35,6 +42,26 @@ class HelpMenu(menu.MultiPageMenu):
         super().__init__(ctx, pagemaps, timeout=120.0)
 
 
+class TagCache:
+    def __init__(self, maxsize=MAX_CACHED_TAGS):
+        self.maxsize = maxsize
+        self._guilds = {}
+
+    def guild(self, guild_id):
+        if (cache := self._guilds.get(guild_id)) is None:
+            cache = self._guilds[guild_id] = LRUCache(self.maxsize)
+        return cache
+
+    def invalidate(self, guild_id, tag_name=None):
+        if tag_name is None:
+            self._guilds.pop(guild_id, None)
+        elif (cache := self._guilds.get(guild_id)) is not None:
+            cache.pop(tag_name)
+
+    def __repr__(self):
+        return f"<TagCache maxsize={self.maxsize!r} guilds={len(self._guilds)!r}>"
+
+
 tag = lightbulb.plugins.Plugin(
     name="Tags",
     description="Commands for creating tags.",
@@ -49,6 +76,132 @@ async def on_started(event: hikari.StartedEvent) -> None:
 
     tag.d.configurable: bool = False
     tag.d.image = "https://cdn.discordapp.com/attachments/991572493267636275/991586086906237048/tags.png"
+    tag.d.cache = TagCache()
+    tag.d.names = LRUCache(MAX_INDEXED_GUILDS)
+
+    await migrate_aliases(tag.bot)
+    await load_stags(tag.bot)
+
+
+@tag.listener(hikari.GuildLeaveEvent)
+async def on_guild_leave(event: hikari.GuildLeaveEvent) -> None:
+    tag.d.cache.invalidate(event.guild_id)
+    tag.d.names.pop(event.guild_id)
+
+
+async def migrate_aliases(bot):
+    # Moves aliases stored in the legacy comma separated columns into the alias tables.
+    for guild_id, tag_id, aliases in await bot.db.records(
+        "SELECT GuildID, TagID, TagAliases FROM tags WHERE TagAliases IS NOT NULL"
+    ):
+        await bot.db.executemany(
+            "INSERT OR IGNORE INTO tagaliases (GuildID, Alias, TagID) VALUES (?, ?, ?)",
+            ((guild_id, alias, tag_id) for a in aliases.split(",") if (alias := a.strip())),
+        )
+
+    for stag_id, aliases in await bot.db.records("SELECT STagID, STagAliases FROM stags WHERE STagAliases IS NOT NULL"):
+        await bot.db.executemany(
+            "INSERT OR IGNORE INTO stagaliases (Alias, STagID) VALUES (?, ?)",
+            ((alias, stag_id) for a in aliases.split(",") if (alias := a.strip())),
+        )
+
+    await bot.db.execute("UPDATE tags SET TagAliases = NULL WHERE TagAliases IS NOT NULL")
+    await bot.db.execute("UPDATE stags SET STagAliases = NULL WHERE STagAliases IS NOT NULL")
+
+
+async def load_stags(bot):
+    # Global tags are shared by every guild, so they are held in memory once for the whole process.
+    tag.d.stags = {}
+
+    for user_id, stag_id, stag_name, content, stag_time, alias in await bot.db.records(
+        "SELECT UserID, s.STagID, STagName, STagContent, STagTime, Alias FROM stags AS s "
+        "LEFT JOIN stagaliases AS a ON a.STagID = s.STagID"
+    ):
+        record = (user_id, stag_id, stag_name, content, stag_time)
+        tag.d.stags.setdefault(stag_name, record)
+        if alias is not None:
+            tag.d.stags.setdefault(alias, record)
+
+
+async def fetch_tag(bot, guild_id, tag_name):
+    # Returns (UserID, TagID, TagName, TagContent, TagTime), or None if the tag does not exist.
+    # Tag names take priority over aliases, so a single lookup resolves both.
+    cache = tag.d.cache.guild(guild_id)
+
+    if (record := cache.get(tag_name)) is None:
+        record = await bot.db.record(
+            "SELECT UserID, TagID, TagName, TagContent, TagTime FROM ("
+            "SELECT 0 AS Priority, UserID, TagID, TagName, TagContent, TagTime FROM tags "
+            "WHERE GuildID = ? AND TagName = ? "
+            "UNION ALL "
+            "SELECT 1, t.UserID, t.TagID, t.TagName, t.TagContent, t.TagTime FROM tagaliases AS a "
+            "JOIN tags AS t ON t.GuildID = a.GuildID AND t.TagID = a.TagID WHERE a.GuildID = ? AND a.Alias = ?"
+            ") ORDER BY Priority LIMIT 1",
+            guild_id,
+            tag_name,
+            guild_id,
+            tag_name,
+        )
+
+        if record is not None:
+            cache.set(tag_name, record)
+
+    return record
+
+
+async def resolve_tag(bot, guild_id, tag_name):
+    # Falls back to the global tags when the guild has no tag or alias by that name.
+    if (record := await fetch_tag(bot, guild_id, tag_name)) is None:
+        record = tag.d.stags.get(tag_name)
+
+    return record
+
+
+async def invalidate_tag(bot, guild_id, tag_id, tag_name):
+    # Every name a tag can be resolved by has to be dropped from the cache.
+    aliases = await bot.db.column("SELECT Alias FROM tagaliases WHERE GuildID = ? AND TagID = ?", guild_id, tag_id)
+
+    for name in (tag_name, *aliases):
+        tag.d.cache.invalidate(guild_id, name)
+
+    return aliases
+
+
+async def tag_name_index(bot, guild_id):
+    # Indexes are only held for recently used guilds, and rebuilt with a single query when evicted.
+    if (index := tag.d.names.get(guild_id)) is None:
+        index = NGramIndex(
+            await bot.db.column(
+                "SELECT TagName FROM tags WHERE GuildID = ? UNION SELECT Alias FROM tagaliases WHERE GuildID = ? LIMIT ?",
+                guild_id,
+                guild_id,
+                MAX_INDEXED_NAMES,
+            ),
+            max_terms=MAX_INDEXED_NAMES,
+        )
+        tag.d.names.set(guild_id, index)
+
+    return index
+
+
+async def similar_tag_names(bot, guild_id, tag_name):
+    return (await tag_name_index(bot, guild_id)).closest(tag_name, limit=MAX_SUGGESTIONS)
+
+
+def fts_query(text):
+    # Every word is quoted so user input is never parsed as FTS5 syntax. The last word also matches as a prefix.
+    if terms := ['"' + word.replace('"', '""') + '"' for word in text.split()]:
+        return " ".join(terms) + "*"
+
+
+def preview_field(prefix, tag_name, tag_id, preview):
+    preview = preview.replace("<", "\\<")
+    return (
+        tag_name,
+        f"ID: {tag_id}\n\n**Content**\n```\n{preview}...\n\n```\n"
+        f"***To see this tags whole content type `{prefix}tag {tag_name}`***",
+        False,
+    )
 
 
 @tag.command()
@@ -61,19 +214,20 @@ async def tag_command(ctx: lightbulb.context.base.Context) -> None:
     if any(c not in ascii_lowercase for c in ctx.options.tag_name):
         return await ctx.respond(f"{ctx.bot.cross} Tag identifiers can only contain lower case letters.")
 
-    tag_names= await ctx.bot.db.column("SELECT TagName FROM tags WHERE GuildID = ?", ctx.guild_id)
-
-    cache = []
-
-    if ctx.options.tag_name not in tag_names:
-        await ctx.respond(f'{ctx.bot.cross} The Tag `{ctx.options.tag_name}` does not exist.')
-        for x in range(len(tag_names)):
-            if tag_names[x][0] == ctx.options.tag_name[0]:
-                cache.append(tag_names[x])
-        await ctx.respond(ctx.bot.info + "Did you mean..." + '\n'.join(cache) + "?")
+    if (record := await resolve_tag(ctx.bot, ctx.guild_id, ctx.options.tag_name)) is None:
+        if suggestions := await similar_tag_names(ctx.bot, ctx.guild_id, ctx.options.tag_name):
+            await ctx.respond(
+                f"{ctx.bot.cross} The Tag `{ctx.options.tag_name}` does not exist. Did you mean...\n"
+                + "\n".join(f"`{name}`" for name in suggestions)
+            )
+        else:
+            await ctx.respond(f'{ctx.bot.cross} The Tag `{ctx.options.tag_name}` does not exist.')
 
     else:
-        content, tag_id = await ctx.bot.db.record("SELECT TagContent, TagID FROM tags WHERE GuildID = ? AND TagName = ?", ctx.guild_id, ctx.options.tag_name)
+        user_id, tag_id, tag_name, content, tag_time = record
+        # Names that get used stay suggestible in guilds with more than the index holds.
+        if (index := tag.d.names.get(ctx.guild_id)) is not None:
+            index.add(ctx.options.tag_name)
         await ctx.respond(content)
 
 
@@ -82,30 +236,11 @@ async def tag_command(ctx: lightbulb.context.base.Context) -> None:
 @lightbulb.command(name="tags", description="Commands to create tags in the server.")
 @lightbulb.implements(commands.prefix.PrefixCommandGroup)
 async def tags_group(ctx: lightbulb.context.base.Context) -> None:
-    cmds = []
-    prefix = await ctx.bot.prefix(ctx.guild_id)
-    cmds_list = sorted(ctx.command.subcommands.values(), key=lambda c: c.name)
-    for cmd in cmds_list:
-        if cmd not in cmds:
-            cmds.append(cmd)
-
-    await ctx.respond(
-        embed=ctx.bot.embed.build(
-            ctx=ctx,
-            header="Tags",
-            thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991586109073137664/tag2.png",
-            description="There are a few different tag methods you can use.",
-            fields=(
-                *(
-                    (
-                        cmd.name.title(),
-                        f"{cmd.description} For more infomation, use `{prefix}help tags {cmd.name}`",
-                        False,
-                    )
-                    for cmd in cmds
-                ),
-            ),
-        )
+    await overview.group_overview(
+        ctx,
+        header="Tags",
+        thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991586109073137664/tag2.png",
+        description="There are a few different tag methods you can use.",
     )
 
 
@@ -125,12 +260,10 @@ async def tag_create(ctx: lightbulb.context.base.Context) -> None:
             f"{ctx.bot.cross} Tag identifiers must not exceed `{MAX_TAGNAME_LENGTH}` characters in length."
         )
 
-    tag_names = await ctx.bot.db.column("SELECT TagName FROM tags WHERE GuildID = ?", ctx.guild_id)
-
     #if len(tag_names) == MAX_TAGS:
         #return await ctx.send(f"{ctx.bot.cross} You can only set up to {MAX_TAGS} warn types.")
 
-    if ctx.options.tag_name in tag_names:
+    if await fetch_tag(ctx.bot, ctx.guild_id, ctx.options.tag_name) is not None:
         prefix = await ctx.bot.prefix(ctx.guild_id)
         return await ctx.respond(
             f"{ctx.bot.cross} That tag already exists. You can use `{prefix}tag edit {ctx.options.tag_name}`"
@@ -144,6 +277,9 @@ async def tag_create(ctx: lightbulb.context.base.Context) -> None:
         ctx.options.tag_name.strip(),
         ctx.options.content.strip()
     )
+    tag.d.cache.invalidate(ctx.guild_id, ctx.options.tag_name)
+    if (index := tag.d.names.get(ctx.guild_id)) is not None:
+        index.add(ctx.options.tag_name.strip())
     await ctx.respond(f'{ctx.bot.tick} The tag `{ctx.options.tag_name}` has been created.')
 
 
@@ -156,29 +292,27 @@ async def tag_create(ctx: lightbulb.context.base.Context) -> None:
 @lightbulb.implements(commands.prefix.PrefixSubCommand)
 async def tag_edit(ctx: lightbulb.context.base.Context) -> None:
     if any(c not in ascii_lowercase for c in ctx.options.tag_name):
-        return await ctx.repond(f"{ctx.bot.cross} Tag identifiers can only contain lower case letters.")
+        return await ctx.respond(f"{ctx.bot.cross} Tag identifiers can only contain lower case letters.")
+
+    if (record := await fetch_tag(ctx.bot, ctx.guild_id, ctx.options.tag_name)) is None:
+        return await ctx.respond(f'{ctx.bot.cross} The tag `{ctx.options.tag_name}` does not exist.')
 
-    user_id, tag_id = await ctx.bot.db.record("SELECT UserID, TagID FROM tags WHERE GuildID = ? AND TagName = ?", ctx.guild_id, ctx.options.tag_name)
+    user_id, tag_id, tag_name, content, tag_time = record
 
     if user_id != ctx.author.id:
-        return await ctx.repond(f"{ctx.bot.cross} You can't edit others tags. You can only edit your own tags.")
+        return await ctx.respond(f"{ctx.bot.cross} You can't edit others tags. You can only edit your own tags.")
 
     else:
-        tag_content = await ctx.bot.db.column("SELECT TagContent FROM tags WHERE GuildID = ?", ctx.guild_id)
-        tag_names = await ctx.bot.db.column("SELECT TagName FROM tags WHERE GuildID = ?", ctx.guild_id)
-
-        if ctx.options.tag_name not in tag_names:
-            return await ctx.repond(f'{ctx.bot.cross} The tag `{ctx.options.tag_name}` does not exist.')
-
-        if ctx.options.content in tag_content:
-            return await ctx.repond(f'{ctx.bot.cross} That content already exists in this `{ctx.options.tag_name}` tag.')
+        if ctx.options.content == content:
+            return await ctx.respond(f'{ctx.bot.cross} That content already exists in this `{ctx.options.tag_name}` tag.')
 
         await ctx.bot.db.execute(
-            "UPDATE tags SET TagContent = ? WHERE GuildID = ? AND TagName = ?",
+            "UPDATE tags SET TagContent = ? WHERE GuildID = ? AND TagID = ?",
             ctx.options.content,
             ctx.guild_id,
-            ctx.options.tag_name,
+            tag_id,
         )
+        await invalidate_tag(ctx.bot, ctx.guild_id, tag_id, tag_name)
 
         await ctx.respond(
             f"{ctx.bot.tick} The `{ctx.options.tag_name}` tag's content has been updated."
@@ -195,19 +329,91 @@ async def tag_delete_command(ctx: lightbulb.context.base.Context) -> None:
     if any(c not in ascii_lowercase for c in ctx.options.tag_name):
         return await ctx.respond(f"{ctx.bot.cross} Tag identifiers can only contain lower case letters.")
 
-    user_id, tag_id = await ctx.bot.db.record("SELECT UserID, TagID FROM tags WHERE GuildID = ? AND TagName = ?", ctx.guild_id, ctx.options.tag_name)
+    if (record := await fetch_tag(ctx.bot, ctx.guild_id, ctx.options.tag_name)) is None:
+        return await ctx.respond(f"{ctx.bot.cross} That tag does not exist.")
+
+    user_id, tag_id, tag_name, content, tag_time = record
 
     if user_id != ctx.author.id:
         return await ctx.respond(f"{ctx.bot.cross} You can't delete others tags. You can only delete your own tags.")
 
-    modified = await ctx.bot.db.execute(
-        "DELETE FROM tags WHERE GuildID = ? AND TagName = ?", ctx.guild_id, ctx.options.tag_name
-    )
+    aliases = await invalidate_tag(ctx.bot, ctx.guild_id, tag_id, tag_name)
+    modified = await ctx.bot.db.execute("DELETE FROM tags WHERE GuildID = ? AND TagID = ?", ctx.guild_id, tag_id)
+    await ctx.bot.db.execute("DELETE FROM tagaliases WHERE GuildID = ? AND TagID = ?", ctx.guild_id, tag_id)
+    if (index := tag.d.names.get(ctx.guild_id)) is not None:
+        for name in (tag_name, *aliases):
+            index.remove(name)
 
     if not modified:
         return await ctx.respond(f"{ctx.bot.cross} That tag does not exist.")
 
-    await ctx.respond(f'{ctx.bot.tick} Tag `{ctx.options.tag_name}` deleted.')
+    await ctx.respond(f'{ctx.bot.tick} Tag `{tag_name}` deleted.')
+
+
+@tags_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.option(name="alias", description="Alias to add to the tag.", type=str)
+@lightbulb.option(name="tag_name", description="Name of the tag to alias.", type=str)
+@lightbulb.command(name="alias", description="Adds an alias to an existing tag.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def tag_alias_command(ctx: lightbulb.context.base.Context) -> None:
+    if any(c not in ascii_lowercase for c in ctx.options.tag_name + ctx.options.alias):
+        return await ctx.respond(f"{ctx.bot.cross} Tag identifiers can only contain lower case letters.")
+
+    if len(ctx.options.alias) > MAX_TAGNAME_LENGTH:
+        return await ctx.respond(
+            f"{ctx.bot.cross} Tag identifiers must not exceed `{MAX_TAGNAME_LENGTH}` characters in length."
+        )
+
+    if (record := await fetch_tag(ctx.bot, ctx.guild_id, ctx.options.tag_name)) is None:
+        return await ctx.respond(f'{ctx.bot.cross} The tag `{ctx.options.tag_name}` does not exist.')
+
+    user_id, tag_id, tag_name, content, tag_time = record
+
+    if user_id != ctx.author.id:
+        return await ctx.respond(f"{ctx.bot.cross} You can't alias others tags. You can only alias your own tags.")
+
+    if await fetch_tag(ctx.bot, ctx.guild_id, ctx.options.alias) is not None:
+        return await ctx.respond(f"{ctx.bot.cross} A tag or alias named `{ctx.options.alias}` already exists.")
+
+    await ctx.bot.db.execute(
+        "INSERT INTO tagaliases (GuildID, Alias, TagID) VALUES (?, ?, ?)", ctx.guild_id, ctx.options.alias, tag_id
+    )
+    tag.d.cache.invalidate(ctx.guild_id, ctx.options.alias)
+    if (index := tag.d.names.get(ctx.guild_id)) is not None:
+        index.add(ctx.options.alias)
+    await ctx.respond(f"{ctx.bot.tick} The tag `{tag_name}` can now also be used as `{ctx.options.alias}`.")
+
+
+@tags_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.option(name="alias", description="Alias to remove.", type=str)
+@lightbulb.command(name="unalias", description="Removes an alias from a tag.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def tag_unalias_command(ctx: lightbulb.context.base.Context) -> None:
+    if any(c not in ascii_lowercase for c in ctx.options.alias):
+        return await ctx.respond(f"{ctx.bot.cross} Tag identifiers can only contain lower case letters.")
+
+    if (record := await ctx.bot.db.record(
+        "SELECT t.UserID, t.TagName FROM tagaliases AS a JOIN tags AS t ON t.GuildID = a.GuildID AND t.TagID = a.TagID "
+        "WHERE a.GuildID = ? AND a.Alias = ?",
+        ctx.guild_id,
+        ctx.options.alias,
+    )) is None:
+        return await ctx.respond(f"{ctx.bot.cross} The alias `{ctx.options.alias}` does not exist.")
+
+    user_id, tag_name = record
+
+    if user_id != ctx.author.id:
+        return await ctx.respond(f"{ctx.bot.cross} You can't unalias others tags. You can only unalias your own tags.")
+
+    await ctx.bot.db.execute("DELETE FROM tagaliases WHERE GuildID = ? AND Alias = ?", ctx.guild_id, ctx.options.alias)
+    tag.d.cache.invalidate(ctx.guild_id, ctx.options.alias)
+    if (index := tag.d.names.get(ctx.guild_id)) is not None:
+        index.remove(ctx.options.alias)
+    await ctx.respond(f"{ctx.bot.tick} The alias `{ctx.options.alias}` has been removed from `{tag_name}`.")
 
 
 @tags_group.child()
@@ -220,12 +426,10 @@ async def tag_info_command(ctx: lightbulb.context.base.Context) -> None:
     if any(c not in ascii_lowercase for c in ctx.options.tag_name):
         return await ctx.respond(f"{ctx.bot.cross} Tag identifiers can only contain lower case letters.")
 
-    tag_names = await ctx.bot.db.column("SELECT TagName FROM tags WHERE GuildID = ?", ctx.get_guild().id)
-
-    if ctx.options.tag_name not in tag_names:
+    if (record := await resolve_tag(ctx.bot, ctx.guild_id, ctx.options.tag_name)) is None:
         return await ctx.respond(f'{ctx.bot.cross} The Tag `{ctx.options.tag_name}` does not exist.')
 
-    user_id, tag_id, tag_time = await ctx.bot.db.record("SELECT UserID, TagID, TagTime FROM tags WHERE GuildID = ? AND TagName = ?", ctx.guild_id, ctx.options.tag_name)
+    user_id, tag_id, tag_name, content, tag_time = record
 
     user = await ctx.bot.grab_user(user_id)
     
@@ -237,7 +441,7 @@ async def tag_info_command(ctx: lightbulb.context.base.Context) -> None:
             thumbnail=user.avatar_url,
             fields=(
                 ("Owner", user.username, False),
-                ("Tag name", ctx.options.tag_name, True),
+                ("Tag name", tag_name, True),
                 ("Tag ID", tag_id, True),
                 ("Created at", tag_time, True),
             ),
@@ -255,10 +459,14 @@ async def member_tag_list_command(ctx: lightbulb.context.base.Context) -> None:
     target = ctx.options.target or ctx.author
 
     prefix = await ctx.bot.prefix(ctx.get_guild().id)
-    all_tags = await ctx.bot.db.column("SELECT TagName FROM tags WHERE GuildID = ?", ctx.guild_id)
-    tag_names = await ctx.bot.db.column("SELECT TagName FROM tags WHERE GuildID = ? AND UserID = ?", ctx.guild_id, target.id)
-    tag_all = await ctx.bot.db.records("SELECT Tagname, TagID FROM tags WHERE GuildID = ? AND UserID = ?", ctx.guild_id, target.id)
-    if len(tag_names) == 0:
+    total = await ctx.bot.db.field("SELECT COUNT(*) FROM tags WHERE GuildID = ?", ctx.guild_id)
+    records = await ctx.bot.db.records(
+        "SELECT TagName, TagID, substr(TagContent, 1, ?) FROM tags WHERE GuildID = ? AND UserID = ? ORDER BY TagName",
+        MAX_PREVIEW_LENGTH,
+        ctx.guild_id,
+        target.id,
+    )
+    if len(records) == 0:
         if target == ctx.author:
             return await ctx.respond(f"{ctx.bot.cross} You don't have any tag list.")
         else:
@@ -266,39 +474,27 @@ async def member_tag_list_command(ctx: lightbulb.context.base.Context) -> None:
 
     user = await ctx.bot.grab_user(target.id)
 
+    def render(record):
+        return {
+            "header": "Tags",
+            "title": f"All tags of this server for {user.username}",
+            "description": f"Using **{len(records)}** of this server's {total} tags.",
+            "thumbnail": user.avatar_url,
+            "fields": (preview_field(prefix, *record),),
+        }
+
     try:
-        pagemaps = []
-
-        for tag_name, tag_id in sorted(tag_all):
-            content, tag_id = await ctx.bot.db.record("SELECT TagContent, TagID FROM tags WHERE GuildID = ? AND TagName = ?", ctx.guild_id, tag_name)
-            first_step = content
-            pagemaps.append(
-                {
-                    "header": "Tags",
-                    "title": f"All tags of this server for {user.username}",
-                    "description": f"Using **{len(tag_names)}** of this server's {len(all_tags)} tags.",
-                    "thumbnail": user.avatar_url,
-                    "fields": (
-                        (
-                            tag_name,
-                            "ID: " + tag_id + "\n\n**Content**" + "\n```\n" + ''.join(first_step.replace('<', '\\<')[0:350]) + "..." + "\n\n```\n***To see this tags whole content type `" + prefix + "tag " + tag_name + "`***",
-                            False
-                            ),
-                        ),
-                    }
-                )
-
-        await HelpMenu(ctx, pagemaps).start()
+        await HelpMenu(ctx, menu.PageSource(records, render)).start()
 
     except IndexError:
         await ctx.respond(
             embed=ctx.bot.embed.build(
             ctx=ctx,
             header="Tags",
-            title=f"All tags of this server for {self.user.username}",
-            description=f"Using {len(tag_names)} of this server's {len(all_tags)} tags.",
+            title=f"All tags of this server for {user.username}",
+            description=f"Using {len(records)} of this server's {total} tags.",
             thumbnail=user.avatar_url,
-            fields=((tag_name, f"ID: {tag_id}", True) for tag_name, tag_id in sorted(tag_all)),
+            fields=((tag_name, f"ID: {tag_id}", True) for tag_name, tag_id, preview in records),
         )
     )
 
@@ -313,13 +509,10 @@ async def raw_command(ctx: lightbulb.context.base.Context) -> None:
     if any(c not in ascii_lowercase for c in ctx.options.tag_name):
         return await ctx.respond(f"{ctx.bot.cross} Tag identifiers can only contain lower case letters.")
 
-    tag_content = await ctx.bot.db.column("SELECT TagContent FROM tags WHERE GuildID = ?", ctx.guild_id)
-    tag_names = await ctx.bot.db.column("SELECT TagName FROM tags WHERE GuildID = ?", ctx.guild_id)
-
-    if ctx.options.tag_name not in tag_names:
+    if (record := await resolve_tag(ctx.bot, ctx.guild_id, ctx.options.tag_name)) is None:
         return await ctx.respond(f'{ctx.bot.cross} The Tag `{ctx.options.tag_name}` does not exist.')
 
-    content, tag_id = await ctx.bot.db.record("SELECT TagContent, TagID FROM tags WHERE GuildID = ? AND TagName = ?", ctx.guild_id, ctx.options.tag_name)
+    user_id, tag_id, tag_name, content, tag_time = record
 
     first_step = markdown.escape_markdown(content)
     await ctx.respond(first_step.replace('<', '\\<'))
@@ -332,32 +525,23 @@ async def raw_command(ctx: lightbulb.context.base.Context) -> None:
 @lightbulb.implements(commands.prefix.PrefixSubCommand)
 async def tags_list_command(ctx: lightbulb.context.base.Context) -> None:
     prefix = await ctx.bot.prefix(ctx.get_guild().id)
-    tag_names = await ctx.bot.db.column("SELECT TagName FROM tags WHERE GuildID = ?", ctx.guild_id)
-    records = await ctx.bot.db.records("SELECT TagName, TagID FROM tags WHERE GuildID = ?", ctx.guild_id)
+    records = await ctx.bot.db.records(
+        "SELECT TagName, TagID, substr(TagContent, 1, ?) FROM tags WHERE GuildID = ? ORDER BY TagName",
+        MAX_PREVIEW_LENGTH,
+        ctx.guild_id,
+    )
+
+    def render(record):
+        return {
+            "header": "Tags",
+            "title": "All tags of this server",
+            "description": f"A total of **{len(records)}** tags of this server.",
+            "thumbnail": ctx.get_guild().icon_url,
+            "fields": (preview_field(prefix, *record),),
+        }
 
     try:
-        pagemaps = []
-
-        for tag_name, tag_id in sorted(records):
-            content, tag_id = await ctx.bot.db.record("SELECT TagContent, TagID FROM tags WHERE GuildID = ? AND TagName = ?", ctx.guild_id, tag_name)
-            first_step = content
-            pagemaps.append(
-                {
-                    "header": "Tags",
-                    "title": f"All tags of this server",
-                    "description": f"A total of **{len(tag_names)}** tags of this server.",
-                    "thumbnail": ctx.get_guild().icon_url,
-                    "fields": (
-                        (
-                            tag_name,
-                            "ID: " + tag_id + "\n\n**Content**" + "\n```\n" + ''.join(first_step.replace('<', '\\<')[0:350]) + "..." + "\n\n```\n***To see this tags whole content type `" + prefix + "tag " + tag_name + "`***",
-                            False
-                            ),
-                        ),
-                    }
-                )
-
-        await HelpMenu(ctx, pagemaps).start()
+        await HelpMenu(ctx, menu.PageSource(records, render)).start()
 
     except IndexError:
         await ctx.respond(
@@ -365,13 +549,56 @@ async def tags_list_command(ctx: lightbulb.context.base.Context) -> None:
             ctx=ctx,
             header="Tags",
             title="All tags of this server",
-            description=f"A total of **{len(tag_names)}** tags of this server.",
+            description=f"A total of **{len(records)}** tags of this server.",
             thumbnail=ctx.get_guild().icon_url,
-            fields=((tag_name, f"ID: {tag_id}", True) for tag_name, tag_id in sorted(records)),
+            fields=((tag_name, f"ID: {tag_id}", True) for tag_name, tag_id, preview in records),
         )
     )
 
 
+@tags_group.child()
+@lightbulb.add_checks(lightbulb.guild_only)
+@lightbulb.add_checks(checks.bot_is_ready())
+@lightbulb.option(name="query", description="Words to search for.", type=str, modifier=lightbulb.commands.base.OptionModifier.CONSUME_REST)
+@lightbulb.command(name="search", description="Searches the server's tags by name and content.")
+@lightbulb.implements(commands.prefix.PrefixSubCommand)
+async def tags_search_command(ctx: lightbulb.context.base.Context) -> None:
+    if (query := fts_query(ctx.options.query)) is None:
+        return await ctx.respond(f"{ctx.bot.cross} You need to provide something to search for.")
+
+    # GuildID isn't indexed, so it's checked against each row MATCH returns rather than narrowing the search itself.
+    total = await ctx.bot.db.field(
+        "SELECT COUNT(*) FROM tags_search WHERE tags_search MATCH ? AND GuildID = ?", query, ctx.guild_id
+    )
+    if not total:
+        return await ctx.respond(f"{ctx.bot.cross} No tags matched `{ctx.options.query}`.")
+
+    prefix = await ctx.bot.prefix(ctx.guild_id)
+
+    async def results(page):
+        # Names are weighted above content, so a tag called "rules" outranks a tag that mentions the rules.
+        records = await ctx.bot.db.records(
+            "SELECT s.TagName, t.TagID, snippet(tags_search, 2, '**', '**', '...', 16) FROM tags_search AS s "
+            "JOIN tags AS t ON t.rowid = s.rowid WHERE tags_search MATCH ? AND s.GuildID = ? "
+            "ORDER BY bm25(tags_search, 0.0, 10.0, 1.0) LIMIT ? OFFSET ?",
+            query,
+            ctx.guild_id,
+            SEARCH_RESULTS_PER_PAGE,
+            page * SEARCH_RESULTS_PER_PAGE,
+        )
+
+        return {
+            "header": "Tags",
+            "title": f"Search results for {ctx.options.query}",
+            "description": f"Found **{total}** matching tags. Use `{prefix}tag <name>` to see a tag in full.",
+            "thumbnail": ctx.get_guild().icon_url,
+            "fields": tuple((tag_name, f"ID: {tag_id}\n{snippet}", False) for tag_name, tag_id, snippet in records),
+        }
+
+    # Each page is its own query, run the first time it's shown.
+    await HelpMenu(ctx, menu.PageSource(range(-(-total // SEARCH_RESULTS_PER_PAGE)), results)).start()
+
+
 def load(bot) -> None:
     bot.add_plugin(tag)
 
@@ -29,7 +29,7 @@ import hikari
 import lightbulb
 from lightbulb import commands
 
-from solaris.utils import checks, chron, string
+from solaris.utils import checks, chron, overview, string
 
 MODULE_NAME = "warn"
 
@@ -60,30 +60,11 @@ async def on_started(event: hikari.StartedEvent):
 @lightbulb.command(name="warn", description="Warns one or more members in your server. Use the command for information on available subcommands.")
 @lightbulb.implements(commands.prefix.PrefixCommandGroup)
 async def warn_group(ctx: lightbulb.context.base.Context):
-    cmds = []
-    prefix = await ctx.bot.prefix(ctx.guild_id)
-    cmds_list = sorted(ctx.command.subcommands.values(), key=lambda c: c.name)
-    for cmd in cmds_list:
-        if cmd not in cmds:
-            cmds.append(cmd)
-
-    await ctx.respond(
-        embed=ctx.bot.embed.build(
-            ctx=ctx,
-            header="Warn",
-            thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991586267630403604/siren.png",
-            description="There are a few different warning methods you can use.",
-            fields=(
-                *(
-                    (
-                        cmd.name.title(),
-                        f"{cmd.description} For more infomation, use `{prefix}help warn {cmd.name}`",
-                        False,
-                    )
-                    for cmd in cmds
-                ),
-            ),
-        )
+    await overview.group_overview(
+        ctx,
+        header="Warn",
+        thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991586267630403604/siren.png",
+        description="There are a few different warning methods you can use.",
     )
 
 
@@ -255,30 +236,11 @@ async def warn_list_command(ctx: lightbulb.context.base.Context) -> None:
 @lightbulb.command(name="warntype", description="Manages warn types. Use the command for information on available subcommands.")
 @lightbulb.implements(commands.prefix.PrefixCommandGroup)
 async def warntype_group(ctx: lightbulb.context.base.Context) -> None:
-    cmds = []
-    prefix = await ctx.bot.prefix(ctx.guild_id)
-    cmds_list = sorted(ctx.command.subcommands.values(), key=lambda c: c.name)
-    for cmd in cmds_list:
-        if cmd not in cmds:
-            cmds.append(cmd)
-
-    await ctx.respond(
-        embed=ctx.bot.embed.build(
-            ctx=ctx,
-            header="WarnType",
-            thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991586166052749332/mobile.png",
-            description="There are a few different commands you can use to manage warn types.",
-            fields=(
-                *(
-                    (
-                        cmd.name.title(),
-                        f"{cmd.description} For more infomation, use `{prefix}help warntype {cmd.name}`",
-                        False,
-                    )
-                    for cmd in cmds
-                ),
-            ),
-        )
+    await overview.group_overview(
+        ctx,
+        header="WarnType",
+        thumbnail="https://cdn.discordapp.com/attachments/991572493267636275/991586166052749332/mobile.png",
+        description="There are a few different commands you can use to manage warn types.",
     )
 
 
@@ -78,6 +78,84 @@ CREATE TABLE IF NOT EXISTS accepted (
 	PRIMARY KEY (GuildID, UserID)
 );
 
+-- automod
+
+CREATE TABLE IF NOT EXISTS automod (
+	GuildID integer PRIMARY KEY,
+	MessageLimit integer DEFAULT 8,
+	ChannelLimit integer DEFAULT 30,
+	DuplicateLimit integer DEFAULT 4,
+	MentionLimit integer DEFAULT 10,
+	TimeoutMinutes integer DEFAULT 10
+);
+
+-- mod
+
+CREATE TABLE IF NOT EXISTS indexedchannels (
+	ChannelID integer PRIMARY KEY,
+	GuildID integer
+);
+
+CREATE TABLE IF NOT EXISTS autounhoist (
+	GuildID integer PRIMARY KEY,
+	Strict integer DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS channelsnapshots (
+	GuildID integer,
+	ChannelID integer,
+	Snapshot text,
+	SnapshotTime text DEFAULT CURRENT_TIMESTAMP,
+	PRIMARY KEY (GuildID, ChannelID)
+);
+
+CREATE TABLE IF NOT EXISTS modjobs (
+	JobID text PRIMARY KEY,
+	GuildID integer,
+	UserID integer,
+	Action text,
+	RoleID integer,
+	Reason text,
+	RunTime text,
+	Attempts integer DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS modactions (
+	ActionID integer PRIMARY KEY,
+	GuildID integer,
+	ModID integer,
+	TargetID integer,
+	ChannelID integer,
+	Action text,
+	Reason text,
+	Count integer DEFAULT 1,
+	ActionTime text DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS modactions_guild_time ON modactions (GuildID, ActionTime);
+CREATE INDEX IF NOT EXISTS modactions_guild_target ON modactions (GuildID, TargetID, ActionTime);
+CREATE INDEX IF NOT EXISTS modactions_guild_mod ON modactions (GuildID, ModID, ActionTime);
+
+CREATE TABLE IF NOT EXISTS massactions (
+	JobID text PRIMARY KEY,
+	GuildID integer,
+	ChannelID integer,
+	ModID integer,
+	Action text,
+	Reason text,
+	DeleteMessageDays integer DEFAULT 1,
+	Status text DEFAULT 'pending',
+	JobTime text DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS masstargets (
+	JobID text,
+	UserID integer,
+	Done integer DEFAULT 0,
+	Error text,
+	PRIMARY KEY (JobID, UserID)
+);
+
 -- warn
 
 CREATE TABLE IF NOT EXISTS warn (
@@ -124,3 +202,43 @@ CREATE TABLE IF NOT EXISTS stags (
 	STagAliases text,
 	STagTime text DEFAULT CURRENT_TIMESTAMP
 );
+
+CREATE TABLE IF NOT EXISTS tagaliases (
+	GuildID integer,
+	Alias text,
+	TagID text,
+	PRIMARY KEY (GuildID, Alias)
+);
+
+CREATE TABLE IF NOT EXISTS stagaliases (
+	Alias text PRIMARY KEY,
+	STagID text
+);
+
+CREATE INDEX IF NOT EXISTS tags_guild_name ON tags (GuildID, TagName);
+CREATE INDEX IF NOT EXISTS tags_guild_id ON tags (GuildID, TagID);
+CREATE INDEX IF NOT EXISTS tagaliases_guild_tag ON tagaliases (GuildID, TagID);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS tags_search USING fts5 (
+	GuildID UNINDEXED,
+	TagName,
+	TagContent,
+	content='tags',
+	tokenize='porter unicode61'
+);
+
+-- Only indexes existing tags the first time the table is created; the triggers keep it in sync afterwards.
+INSERT INTO tags_search (tags_search) SELECT 'rebuild' WHERE NOT EXISTS (SELECT 1 FROM tags_search_docsize) AND EXISTS (SELECT 1 FROM tags);
+
+CREATE TRIGGER IF NOT EXISTS tags_search_insert AFTER INSERT ON tags BEGIN
+	INSERT INTO tags_search (rowid, GuildID, TagName, TagContent) VALUES (new.rowid, new.GuildID, new.TagName, new.TagContent);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tags_search_delete AFTER DELETE ON tags BEGIN
+	INSERT INTO tags_search (tags_search, rowid, GuildID, TagName, TagContent) VALUES ('delete', old.rowid, old.GuildID, old.TagName, old.TagContent);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tags_search_update AFTER UPDATE OF GuildID, TagName, TagContent ON tags BEGIN
+	INSERT INTO tags_search (tags_search, rowid, GuildID, TagName, TagContent) VALUES ('delete', old.rowid, old.GuildID, old.TagName, old.TagContent);
+	INSERT INTO tags_search (rowid, GuildID, TagName, TagContent) VALUES (new.rowid, new.GuildID, new.TagName, new.TagContent);
+END;
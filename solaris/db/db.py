@@ -75,6 +75,16 @@ class Database:
         await self.executemany("DELETE FROM system WHERE GuildID = ?", removals)
         await self.executemany("DELETE FROM gateway WHERE GuildID = ?", removals)
         await self.executemany("DELETE FROM warn WHERE GuildID = ?", removals)
+        await self.executemany("DELETE FROM indexedchannels WHERE GuildID = ?", removals)
+        await self.executemany("DELETE FROM autounhoist WHERE GuildID = ?", removals)
+        await self.executemany("DELETE FROM channelsnapshots WHERE GuildID = ?", removals)
+        await self.executemany("DELETE FROM modjobs WHERE GuildID = ?", removals)
+        await self.executemany("DELETE FROM modactions WHERE GuildID = ?", removals)
+        await self.executemany("DELETE FROM automod WHERE GuildID = ?", removals)
+        await self.executemany(
+            "DELETE FROM masstargets WHERE JobID IN (SELECT JobID FROM massactions WHERE GuildID = ?)", removals
+        )
+        await self.executemany("DELETE FROM massactions WHERE GuildID = ?", removals)
 
         # Commit.
         await self.commit()
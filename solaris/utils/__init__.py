@@ -45,10 +45,14 @@ SUCCESS_ICON = "https://cdn.discordapp.com/attachments/710177462989881415/738066
 SUPPORT_GUILD_INVITE_LINK = "https://discord.gg/c3b4cZs"
 
 # Dependant on constants above.
+from .cache import LRUCache, TTLCache
 from .embed import EmbedConstructor
+from .jobs import ModerationJobs
 #from .emoji import EmojiGetter
 from .loc import CodeCounter
+from .menu import MenuRouter
+from .modlog import ActionLog
 from .presence import PresenceSetter
 from .ready import Ready
-from .search import Search
+from .search import NGramIndex, Search
 from .oauth_url import oauth_url 
\ No newline at end of file
@@ -0,0 +1,91 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+import asyncio
+import time
+
+import hikari
+
+# hikari already queues requests on each route's rate limit bucket. This only stops a single
+# action from holding hundreds of requests in those queues at once.
+MAX_CONCURRENCY = 5
+
+
+class BulkAction:
+    def __init__(self, items, action, *, concurrency=MAX_CONCURRENCY, on_progress=None, progress_interval=2.0):
+        self.items = list(items)
+        self.action = action
+        self.concurrency = concurrency
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+
+        self.succeeded = []
+        self.failed = []
+        self._started = None
+
+    @property
+    def done(self):
+        return len(self.succeeded) + len(self.failed)
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self._started if self._started is not None else 0.0
+
+    async def run(self):
+        self._started = time.monotonic()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_one(item):
+            async with semaphore:
+                try:
+                    await self.action(item)
+                except hikari.HTTPError as error:
+                    # One failure shouldn't stop the rest from being actioned.
+                    self.failed.append((item, error))
+                else:
+                    self.succeeded.append(item)
+
+        tasks = asyncio.gather(*(run_one(item) for item in self.items))
+        reporter = asyncio.create_task(self._report()) if self.on_progress is not None else None
+
+        try:
+            await tasks
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+
+        return self
+
+    async def _report(self):
+        while True:
+            await asyncio.sleep(self.progress_interval)
+
+            try:
+                await self.on_progress(self)
+            except hikari.HTTPError:
+                # The progress message may have gone with whatever is being deleted.
+                pass
+
+    def __repr__(self):
+        return (
+            f"<BulkAction"
+            f" items={len(self.items)!r}"
+            f" succeeded={len(self.succeeded)!r}"
+            f" failed={len(self.failed)!r}>"
+        )
@@ -0,0 +1,126 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+import asyncio
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def set(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        return self._data.pop(key, default)
+
+    def clear(self):
+        self._data.clear()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"<LRUCache maxsize={self.maxsize!r} size={len(self._data)!r}>"
+
+
+class TTLCache:
+    # Values expire after `ttl` seconds. Concurrent misses for the same key share one fetch rather than each making their own.
+    def __init__(self, ttl, maxsize=128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._pending = {}
+
+    def get(self, key, default=None):
+        try:
+            expires, value = self._data[key]
+        except KeyError:
+            return default
+
+        if expires <= time.monotonic():
+            del self._data[key]
+            return default
+
+        return value
+
+    def set(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def fetch(self, key, factory):
+        if (value := self.get(key, _MISSING)) is not _MISSING:
+            return value
+
+        if (future := self._pending.get(key)) is None:
+            future = self._pending[key] = asyncio.ensure_future(factory())
+            future.add_done_callback(lambda f: self._settle(key, f))
+
+        # Shielded, so one caller giving up doesn't cancel the fetch for everyone else waiting on it.
+        return await asyncio.shield(future)
+
+    def _settle(self, key, future):
+        # A key popped mid-fetch has been invalidated, so whatever the fetch returns is already stale.
+        if self._pending.get(key) is not future:
+            return
+
+        del self._pending[key]
+        if not future.cancelled() and future.exception() is None:
+            self.set(key, future.result())
+
+    def pop(self, key, default=None):
+        self._pending.pop(key, None)
+
+        if (entry := self._data.pop(key, None)) is None:
+            return default
+        return entry[1]
+
+    def clear(self):
+        self._data.clear()
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"<TTLCache ttl={self.ttl!r} maxsize={self.maxsize!r} size={len(self._data)!r}>"
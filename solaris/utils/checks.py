@@ -21,9 +21,77 @@
 # Aoi Yuito (Rewritten author)
 # aoi.yuito.ehou@gmail.com
 
+import asyncio
+import functools
+
 import lightbulb
 
 from solaris.utils import modules
+from solaris.utils.cache import LRUCache
+
+MAX_CHECK_CONTEXTS = 256
+_MISSING = object()
+
+
+class CheckContext:
+    # What the checks for one invocation look up, worked out at most once however many checks ask for it.
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self._member = _MISSING
+        self._permissions = None
+        self._system = None
+        self._retrieved = {}
+
+    @property
+    def member(self):
+        if self._member is _MISSING:
+            self._member = self.ctx.bot.cache.get_member(self.ctx.guild_id, self.ctx.author.id)
+        return self._member
+
+    @property
+    def permissions(self):
+        if self._permissions is None:
+            self._permissions = lightbulb.utils.permissions_for(self.member)
+        return self._permissions
+
+    def has_role(self, role):
+        return role is not None and role.id in self.member.role_ids
+
+    async def system(self):
+        # Every system setting a check might want comes from the one row, so it's read once rather than once per check.
+        if self._system is None:
+            self._system = asyncio.ensure_future(
+                self.ctx.bot.db.record(
+                    "SELECT RunFTS, LogChannelID, AdminRoleID FROM system WHERE GuildID = ?", self.ctx.guild_id
+                )
+            )
+        return await self._system or (None, None, None)
+
+    async def admin_role(self):
+        _, _, role_id = await self.system()
+        return self.ctx.bot.cache.get_role(role_id) if role_id is not None else None
+
+    async def retrieve(self, name):
+        # Futures are stored rather than results, so checks evaluated concurrently still share the one query.
+        if (future := self._retrieved.get(name)) is None:
+            future = self._retrieved[name] = asyncio.ensure_future(
+                getattr(modules.retrieve, name)(self.ctx.bot, self.ctx.guild_id)
+            )
+        return await future
+
+    def __repr__(self):
+        return f"<CheckContext retrieved={tuple(self._retrieved)!r}>"
+
+
+# Keyed by the context's id. The context is held alongside it, so the id can't be reused while the entry is alive.
+_contexts = LRUCache(MAX_CHECK_CONTEXTS)
+
+
+def check_context(ctx):
+    if (entry := _contexts.get(id(ctx))) is None or entry[0] is not ctx:
+        entry = (ctx, CheckContext(ctx))
+        _contexts.set(id(ctx), entry)
+    return entry[1]
 
 
 class CustomCheckFailure(lightbulb.errors.CheckFailure):
@@ -37,6 +105,9 @@ class BotHasNotBooted(CustomCheckFailure):
         super().__init__("Solaris is still booting and is not ready to receive commands. Please try again later.")
 
 
+# Check factories are cached, so every command using a check shares one instance of it. That lets callers evaluating many
+# commands at once, like help, run each distinct check only once.
+@functools.lru_cache(maxsize=None)
 def bot_has_booted():
     async def predicate(ctx):
         if not ctx.bot.ready.booted:
@@ -51,6 +122,7 @@ class ModuleHasNotInitialised(CustomCheckFailure):
         super().__init__(f"The {module} module is still initialising. Please try again later.")
 
 
+@functools.lru_cache(maxsize=None)
 def module_has_initialised(module):
     async def predicate(ctx):
         if not getattr(ctx.bot.ready, module):
@@ -65,6 +137,7 @@ class BotIsNotReady(CustomCheckFailure):
         super().__init__("Solaris is still performing some start-up procedures. Please try again later.")
 
 
+@functools.lru_cache(maxsize=None)
 def bot_is_ready():
     async def predicate(ctx):
         if not ctx.bot.ready.ok:
@@ -81,9 +154,11 @@ class FirstTimeSetupNotRun(CustomCheckFailure):
         )
 
 
+@functools.lru_cache(maxsize=None)
 def first_time_setup_has_run():
     async def predicate(ctx):
-        if not await modules.retrieve.system__runfts(ctx.bot, ctx.guild_id):
+        run_fts, _, _ = await check_context(ctx).system()
+        if not run_fts:
             raise FirstTimeSetupNotRun(await ctx.bot.prefix(ctx.guild_id))
         return True
 
@@ -95,9 +170,11 @@ class FirstTimeSetupRun(CustomCheckFailure):
         super().__init__("The first time setup has already been run.")
 
 
+@functools.lru_cache(maxsize=None)
 def first_time_setup_has_not_run():
     async def predicate(ctx):
-        if await modules.retrieve.system__runfts(ctx.bot, ctx.guild_id):
+        run_fts, _, _ = await check_context(ctx).system()
+        if run_fts:
             raise FirstTimeSetupRun()
         return True
 
@@ -109,9 +186,11 @@ class LogChannelNotSet(CustomCheckFailure):
         super().__init__("The log channel has not been set.")
 
 
+@functools.lru_cache(maxsize=None)
 def log_channel_is_set():
     async def predicate(ctx):
-        if not await modules.retrieve.system__logchannel(ctx.bot, ctx.guild_id):
+        _, channel_id, _ = await check_context(ctx).system()
+        if channel_id is None or ctx.bot.cache.get_guild_channel(channel_id) is None:
             raise LogChannelNotSet()
         return True
 
@@ -123,9 +202,10 @@ class AdminRoleNotSet(CustomCheckFailure):
         super().__init__("The admin role has not been set.")
 
 
+@functools.lru_cache(maxsize=None)
 def admin_role_is_set():
     async def predicate(ctx):
-        if not await modules.retrieve.system__adminrole(ctx.bot, ctx.guild_id):
+        if not await check_context(ctx).admin_role():
             raise AdminRoleNotSet()
         return True
 
@@ -137,19 +217,11 @@ class AuthorCanNotConfigure(CustomCheckFailure):
         super().__init__("You are not able to configure Solaris.")
 
 
+@functools.lru_cache(maxsize=None)
 def author_can_configure():
     async def predicate(ctx):
-        user = ctx.bot.cache.get_member(
-            ctx.guild_id,
-            ctx.author.id
-        )
-        perm = lightbulb.utils.permissions_for(
-            user
-        )
-        if not (
-            perm.MANAGE_GUILD
-            or await modules.retrieve.system__adminrole(ctx.bot, ctx.guild_id) in user.get_roles()
-        ):
+        cc = check_context(ctx)
+        if not (cc.permissions.MANAGE_GUILD or cc.has_role(await cc.admin_role())):
             raise AuthorCanNotConfigure()
         return True
 
@@ -161,19 +233,11 @@ class AuthorCanNotWarn(CustomCheckFailure):
         super().__init__("You are not able to warn other members.")
 
 
+@functools.lru_cache(maxsize=None)
 def author_can_warn():
     async def predicate(ctx):
-        user = ctx.bot.cache.get_member(
-            ctx.guild_id,
-            ctx.author.id
-        )
-        perm = lightbulb.utils.permissions_for(
-            user
-        )
-        if not (
-            perm.MANAGE_GUILD
-            or await modules.retrieve.warn__warnrole(ctx.bot, ctx.guild) in user.get_roles()
-        ):
+        cc = check_context(ctx)
+        if not (cc.permissions.MANAGE_GUILD or cc.has_role(await cc.retrieve("warn__warnrole"))):
             raise AuthorCanNotWarn()
         return True
 
@@ -185,9 +249,10 @@ class ModuleIsNotActive(CustomCheckFailure):
         super().__init__(f"The {module} module is not active.")
 
 
+@functools.lru_cache(maxsize=None)
 def module_is_active(module):
     async def predicate(ctx):
-        if not await getattr(modules.retrieve, f"{module}__active")(ctx.bot, ctx.guild_id):
+        if not await check_context(ctx).retrieve(f"{module}__active"):
             raise ModuleIsNotActive(module)
         return True
 
@@ -199,9 +264,10 @@ class ModuleIsActive(CustomCheckFailure):
         super().__init__(f"The {module} module is already active.")
 
 
+@functools.lru_cache(maxsize=None)
 def module_is_not_active(module):
     async def predicate(ctx):
-        if await getattr(modules.retrieve, f"{module}__active")(ctx.bot, ctx.guild_id):
+        if await check_context(ctx).retrieve(f"{module}__active"):
             raise ModuleIsActive(module)
         return True
 
@@ -215,6 +281,7 @@ class GuildIsDiscordBotList(CustomCheckFailure):
         )
 
 
+@functools.lru_cache(maxsize=None)
 def guild_is_not_discord_bot_list():
     async def predicate(ctx):
         if ctx.guild_id == 264445053596991498:
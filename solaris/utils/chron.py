@@ -22,10 +22,14 @@
 # aoi.yuito.ehou@gmail.com
 
 import datetime as dt
+import re
 from time import strftime
 
 from solaris.utils import string
 
+DELTA_REGEX = re.compile(r"(\d+)\s*([wdhms])")
+DELTA_UNITS = {"w": 604_800, "d": 86_400, "h": 3_600, "m": 60, "s": 1}
+
 
 def sys_time():
     return strftime("%H:%M:%S")
@@ -95,6 +99,15 @@ def long_delta(td, milliseconds=False):
     return string.list_of(parts)
 
 
+def parse_delta(text):
+    # Accepts things like "1d12h" or "2w 3d". Returns None if anything else is in the string.
+    text = text.lower()
+    if not (parts := DELTA_REGEX.findall(text)) or DELTA_REGEX.sub("", text).strip(", "):
+        return None
+
+    return dt.timedelta(seconds=sum(int(n) * DELTA_UNITS[unit] for n, unit in parts))
+
+
 def from_iso(stamp):
     try:
         return dt.datetime.fromisoformat(stamp)
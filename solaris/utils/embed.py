@@ -23,7 +23,7 @@
 
 from hikari import Embed
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 from solaris.utils import DEFAULT_EMBED_COLOUR
 
@@ -38,12 +38,8 @@ class EmbedConstructor:
         embed = Embed(
             title=kwargs.get("title"),
             description=kwargs.get("description"),
-            colour=(
-                kwargs.get("colour")
-                or (ctx.member.get_top_role().color if ctx and ctx.member.get_top_role().color else None)
-                or DEFAULT_EMBED_COLOUR
-            ),
-            timestamp=datetime.now().astimezone(),
+            colour=kwargs.get("colour") or self._colour(ctx),
+            timestamp=datetime.now(timezone.utc),
         )
 
         embed.set_author(name=kwargs.get("header", "Solaris"))
@@ -61,4 +57,12 @@ class EmbedConstructor:
         for name, value, inline in kwargs.get("fields", ()):
             embed.add_field(name=name, value=value, inline=inline)
 
-        return embed
\ No newline at end of file
+        return embed
+
+    @staticmethod
+    def _colour(ctx):
+        # The top role is looked up once, rather than once to check its colour and again to use it.
+        if ctx and ctx.member and (role := ctx.member.get_top_role()) and role.color:
+            return role.color
+
+        return DEFAULT_EMBED_COLOUR
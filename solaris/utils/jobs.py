@@ -0,0 +1,118 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+import datetime as dt
+
+import hikari
+from apscheduler.triggers.date import DateTrigger
+
+from solaris.utils import chron
+
+# Jobs that fail for reasons other than the target being gone are retried after this long.
+RETRY_DELAY = dt.timedelta(minutes=5)
+MAX_ATTEMPTS = 5
+# Jobs missed while offline are spread out by this much at boot, rather than all firing at once.
+CATCH_UP_STAGGER = dt.timedelta(seconds=1)
+
+
+class ModerationJobs:
+    # The jobs themselves live in the database. The scheduler only ever holds what's needed to fire them.
+    def __init__(self, bot):
+        self.bot = bot
+        self.actions = {
+            "unban": self._unban,
+            "removerole": self._remove_role,
+        }
+
+    async def arm(self):
+        now = dt.datetime.now(dt.timezone.utc)
+        missed = 0
+
+        for job_id, run_time in await self.bot.db.records("SELECT JobID, RunTime FROM modjobs ORDER BY RunTime"):
+            if (run_at := chron.from_iso(run_time)) <= now:
+                run_at = now + CATCH_UP_STAGGER * missed
+                missed += 1
+
+            self._arm(job_id, run_at)
+
+        return missed
+
+    async def schedule(self, guild_id, user_id, action, run_at, *, role_id=None, reason=None):
+        job_id = self.bot.generate_id()
+
+        await self.bot.db.execute(
+            "INSERT INTO modjobs (JobID, GuildID, UserID, Action, RoleID, Reason, RunTime) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            job_id,
+            guild_id,
+            user_id,
+            action,
+            role_id,
+            reason,
+            chron.to_iso(run_at),
+        )
+        self._arm(job_id, run_at)
+        return job_id
+
+    async def cancel(self, job_id):
+        if (job := self.bot.scheduler.get_job(job_id)) is not None:
+            job.remove()
+
+        await self.bot.db.execute("DELETE FROM modjobs WHERE JobID = ?", job_id)
+
+    async def run(self, job_id):
+        if (job := await self.bot.db.record(
+            "SELECT GuildID, UserID, Action, RoleID, Reason, Attempts FROM modjobs WHERE JobID = ?", job_id
+        )) is None:
+            return
+
+        guild_id, user_id, action, role_id, reason, attempts = job
+
+        try:
+            await self.actions[action](guild_id, user_id, role_id, reason)
+        except (hikari.NotFoundError, hikari.ForbiddenError):
+            # The ban, member, or role is already gone, or Solaris can't act on it any more.
+            pass
+        except hikari.HTTPError:
+            if attempts + 1 < MAX_ATTEMPTS:
+                run_at = dt.datetime.now(dt.timezone.utc) + RETRY_DELAY
+                await self.bot.db.execute(
+                    "UPDATE modjobs SET Attempts = Attempts + 1, RunTime = ? WHERE JobID = ?", chron.to_iso(run_at), job_id
+                )
+                return self._arm(job_id, run_at)
+
+        await self.bot.db.execute("DELETE FROM modjobs WHERE JobID = ?", job_id)
+
+    def _arm(self, job_id, run_at):
+        self.bot.scheduler.add_job(
+            self.run,
+            DateTrigger(run_at),
+            args=[job_id],
+            id=job_id,
+            replace_existing=True,
+            misfire_grace_time=None,
+        )
+
+    async def _unban(self, guild_id, user_id, role_id, reason):
+        await self.bot.rest.unban_user(guild_id, user_id, reason=reason)
+
+    async def _remove_role(self, guild_id, user_id, role_id, reason):
+        await self.bot.rest.remove_role_from_member(guild_id, user_id, role_id, reason=reason)
+
+    def __repr__(self):
+        return f"<ModerationJobs actions={tuple(self.actions)!r}>"
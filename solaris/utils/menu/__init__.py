@@ -21,4 +21,5 @@
 # Aoi Yuito (Rewritten author)
 # aoi.yuito.ehou@gmail.com
 
-from .menus import MultiPageMenu, NumberedSelectionMenu, SelectionMenu
\ No newline at end of file
+from .menus import MultiPageMenu, NumberedSelectionMenu, PageSource, SelectionMenu
+from .router import MenuRouter
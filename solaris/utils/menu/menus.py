@@ -21,6 +21,10 @@
 # Aoi Yuito (Rewritten author)
 # aoi.yuito.ehou@gmail.com
 
+import inspect
+
+import hikari
+
 from solaris.utils.menu import selectors
 
 
@@ -31,39 +35,58 @@ class Menu:
         self.pagemap = pagemap
         self.delete_after = delete_after
         self.delete_invoke_after = delete_invoke_after or delete_after
+        self.message = None
+        # The component interaction that hasn't been answered yet. The next render answers it, which edits the message in
+        # the same call.
+        self.interaction = None
+        self._components = []
+
+    def components(self):
+        return []
 
     async def start(self):
-        resp = await self.ctx.respond(embed=self.bot.embed.build(ctx=self.ctx, **self.pagemap))
+        self._components = self.components()
+        resp = await self.ctx.respond(embed=self.bot.embed.build(ctx=self.ctx, **self.pagemap), components=self._components)
         self.message = await resp.message()
 
-    async def stop(self):
-        if self.delete_after:
-            await self.message.delete()
+    async def _render(self, **kwargs):
+        if (interaction := self.interaction) is not None:
+            self.interaction = None
+            await interaction.create_initial_response(hikari.ResponseType.MESSAGE_UPDATE, **kwargs)
         else:
-            await self.message.remove_all_reactions()
-            await self.message.edit(content=f"{self.bot.info} The interactive menu was closed.", embed=None)
+            await self.message.edit(**kwargs)
 
-        if self.delete_invoke_after:
-            await self.ctx.message.delete()
+    async def defer(self):
+        # Discord only waits three seconds for an answer, so anything slower acknowledges the press first and edits the
+        # message once it's done.
+        if (interaction := self.interaction) is not None:
+            self.interaction = None
+            await interaction.create_initial_response(hikari.ResponseType.DEFERRED_MESSAGE_UPDATE)
+
+    async def _close(self, content):
+        self._components = []
 
-    async def timeout(self, length):
         if self.delete_after:
+            await self.defer()
             await self.message.delete()
         else:
-            await self.message.remove_all_reactions()
-            await self.message.edit(
-                content=f"{self.bot.info} The interactive menu timed out as there was no user interaction for {length}.",
-                embed=None,
-            )
+            await self._render(content=content, embeds=[], components=[])
 
         if self.delete_invoke_after:
-            await self.ctx.message.delete()
+            await self.ctx.event.message.delete()
+
+    async def stop(self):
+        await self._close(f"{self.bot.info} The interactive menu was closed.")
+
+    async def timeout(self, length):
+        await self._close(f"{self.bot.info} The interactive menu timed out as there was no user interaction for {length}.")
 
     async def switch(self, pagemap=None, remove_all_reactions=False):
+        # `remove_all_reactions` is kept from when menus were driven by reactions. It now takes the controls off instead.
         if remove_all_reactions:
-            await self.message.remove_all_reactions()
+            self._components = []
 
-        await self.message.edit(embed=self.bot.embed.build(ctx=self.ctx, **(pagemap or self.pagemap)))
+        await self._render(embeds=[self.bot.embed.build(ctx=self.ctx, **(pagemap or self.pagemap))], components=self._components)
 
     def __repr__(self):
         return (
@@ -90,6 +113,9 @@ class SelectionMenu(Menu):
         super().__init__(ctx, pagemap, delete_after=delete_after, delete_invoke_after=delete_invoke_after)
         self.selector = selectors.Selector(self, selection, timeout=timeout, auto_exit=auto_exit, check=check)
 
+    def components(self):
+        return self.selector.components()
+
     async def start(self):
         await super().start()
         return await self.selector.response()
@@ -126,15 +152,18 @@ class NumberedSelectionMenu(Menu):
     async def page_field(self):
         return (f"{self.selector.page_info}", f"{await self.selector.table}", False)
 
+    def components(self):
+        return self.selector.components()
+
     async def start(self):
         self.pagemap.update({"fields": (await self.page_field,)})
         await super().start()
         return await self.selector.response()
 
-    async def switch(self, emoji_name, emoji_id):
+    async def turn(self):
         self.pagemap.update({"fields": (await self.page_field,)})
+        self._components = self.components()
         await super().switch()
-        await self.message.remove_reaction(emoji=emoji_name, emoji_id=emoji_id, user=self.ctx.author)
 
     def __repr__(self):
         return (
@@ -148,20 +177,54 @@ class NumberedSelectionMenu(Menu):
         )
 
 
+class PageSource:
+    # A lazily rendered stand-in for a list of pagemaps. Pages are only built when first shown. `render` can return an
+    # awaitable for pages that need to fetch something first.
+    def __init__(self, entries, render):
+        self.entries = entries
+        self.render = render
+        self._pages = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    async def page(self, index, *, waiting=None):
+        if (pagemap := self._pages.get(index)) is None:
+            if inspect.isawaitable(pagemap := self.render(self.entries[index])):
+                # Called before a slow page is awaited, so whatever asked for it can be answered first.
+                if waiting is not None:
+                    await waiting()
+                pagemap = await pagemap
+            self._pages[index] = pagemap
+        return pagemap
+
+    def __repr__(self):
+        return f"<PageSource entries={len(self.entries)!r} rendered={len(self._pages)!r}>"
+
+
 class MultiPageMenu(Menu):
     def __init__(
         self, ctx, pagemaps, *, delete_after=False, delete_invoke_after=None, timeout=300.0, auto_exit=True, check=None
     ):
-        super().__init__(ctx, pagemaps[0], delete_after=delete_after, delete_invoke_after=delete_invoke_after)
+        # Pages can be given as a PageSource, or as a list of pagemaps that are all ready to show.
+        if not isinstance(pagemaps, PageSource):
+            pagemaps = PageSource(pagemaps, lambda pagemap: pagemap)
+
+        super().__init__(ctx, None, delete_after=delete_after, delete_invoke_after=delete_invoke_after)
+        self.source = pagemaps
         self.selector = selectors.PageControls(self, pagemaps, timeout=timeout, auto_exit=auto_exit, check=check)
 
+    def components(self):
+        return self.selector.components()
+
     async def start(self):
+        self.pagemap = await self.source.page(0)
         await super().start()
         return await self.selector.response()
 
-    async def switch(self, emoji_name, emoji_id):
-        await super().switch(self.selector.pagemaps[self.selector.page])
-        await self.message.remove_reaction(emoji=emoji_name, emoji_id=emoji_id, user=self.ctx.author)
+    async def turn(self):
+        self._components = self.components()
+        await super().switch(await self.source.page(self.selector.page, waiting=self.defer))
 
     def __repr__(self):
         return (
@@ -0,0 +1,112 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+import asyncio
+import math
+from collections import namedtuple
+
+import hikari
+
+# Timeouts are only as precise as this, which is plenty for menus that wait minutes.
+TICK = 1.0
+# Enough slots that a menu's timeout almost never has to go round the wheel more than once.
+WHEEL_SIZE = 512
+
+Waiter = namedtuple("Waiter", ("event_type", "check", "future", "expires"))
+
+
+class MenuRouter:
+    # Every open menu waits here, keyed by its message. An event costs one dict lookup however many menus are open, and
+    # all of their timeouts share one timer wheel rather than each keeping its own.
+    def __init__(self, bot):
+        self.bot = bot
+        self._waiting = {}
+        self._slots = [set() for _ in range(WHEEL_SIZE)]
+        self._tick = 0
+        self._ticker = None
+
+    async def wait(self, message_id, check, timeout, *, event_type=hikari.InteractionCreateEvent):
+        if (old := self._waiting.get(message_id)) is not None:
+            old.future.cancel()
+            self._discard(message_id, old)
+
+        expires = self._tick + max(1, math.ceil(timeout / TICK))
+        waiter = self._waiting[message_id] = Waiter(
+            event_type, check, asyncio.get_running_loop().create_future(), expires
+        )
+        self._slots[expires % WHEEL_SIZE].add(message_id)
+
+        if self._ticker is None:
+            self._ticker = asyncio.get_running_loop().call_later(TICK, self._advance)
+
+        try:
+            return await waiter.future
+        finally:
+            if self._waiting.get(message_id) is waiter:
+                self._discard(message_id, waiter)
+
+    async def on_interaction(self, event: hikari.InteractionCreateEvent) -> None:
+        if not isinstance(interaction := event.interaction, hikari.ComponentInteraction):
+            return
+
+        if (waiter := self._waiting.get(interaction.message.id)) is None or waiter.event_type is not hikari.InteractionCreateEvent:
+            return
+
+        if not waiter.check(interaction):
+            # Anyone else pressing a button gets told why nothing happened, rather than a failed interaction.
+            return await interaction.create_initial_response(
+                hikari.ResponseType.MESSAGE_CREATE,
+                f"{self.bot.cross} Only the person who opened this menu can use it.",
+                flags=hikari.MessageFlag.EPHEMERAL,
+            )
+
+        self._resolve(interaction.message.id, waiter, interaction)
+
+    async def on_reaction(self, event: hikari.ReactionAddEvent) -> None:
+        if (waiter := self._waiting.get(event.message_id)) is None or waiter.event_type is not hikari.ReactionAddEvent:
+            return
+
+        if waiter.check(event):
+            self._resolve(event.message_id, waiter, event)
+
+    def _resolve(self, message_id, waiter, value):
+        self._discard(message_id, waiter)
+        if not waiter.future.done():
+            waiter.future.set_result(value)
+
+    def _discard(self, message_id, waiter):
+        if self._waiting.get(message_id) is waiter:
+            del self._waiting[message_id]
+        self._slots[waiter.expires % WHEEL_SIZE].discard(message_id)
+
+    def _advance(self):
+        self._tick += 1
+        slot = self._slots[self._tick % WHEEL_SIZE]
+
+        for message_id in tuple(slot):
+            # Anything still here from a later lap of the wheel is left for then.
+            if (waiter := self._waiting.get(message_id)) is not None and waiter.expires <= self._tick:
+                self._discard(message_id, waiter)
+                if not waiter.future.done():
+                    waiter.future.set_exception(asyncio.TimeoutError())
+
+        self._ticker = asyncio.get_running_loop().call_later(TICK, self._advance) if self._waiting else None
+
+    def __repr__(self):
+        return f"<MenuRouter waiting={len(self._waiting)!r} tick={self._tick!r}>"
@@ -28,6 +28,9 @@ from asyncio import TimeoutError
 from solaris import Config
 from solaris.utils import chron
 
+# Discord allows five buttons to an action row.
+ROW_WIDTH = 5
+
 
 class Selector:
     def __init__(self, menu, selection, *, timeout=300.0, auto_exit=True, check=None):
@@ -46,36 +49,42 @@ class Selector:
     def selection(self, value):
         self._base_selection = value
 
-    def _default_check(self, reaction):
+    def _emoji(self, emoji_id):
+        # The hub guild is fetched once at startup, so building the buttons never goes over REST.
+        return self.menu.bot.emoji_guild.get_emoji(int(emoji_id))
+
+    def _default_check(self, interaction):
         return (
-            reaction.message_id == self.menu.message.id
-            and reaction.user_id == self.menu.ctx.author.id
-            and reaction.emoji_name in self.selection
+            interaction.user.id == self.menu.ctx.author.id
+            and interaction.custom_id in (self._emoji(e).name for e in self.selection)
         )
 
-    async def _serve(self):
-        await self.menu.message.remove_all_reactions()
-        emoji = await self.menu.bot.rest.fetch_guild(Config.HUB_GUILD_ID)
+    def components(self):
+        rows = []
 
-        for e in self.selection:
-            await self.menu.message.add_reaction(emoji.get_emoji(int(e)))
+        for i, emoji_id in enumerate(self.selection):
+            if i % ROW_WIDTH == 0:
+                rows.append(self.menu.bot.rest.build_action_row())
 
-    async def response(self):
-        await self._serve()
+            emoji = self._emoji(emoji_id)
+            rows[-1].add_button(hikari.ButtonStyle.SECONDARY, emoji.name).set_emoji(emoji).add_to_container()
 
-        def predicate(event: hikari.ReactionAddEvent) -> bool:
-            return event.user_id == self.menu.ctx.author.id and event.message_id == self.menu.message.id
+        return rows
 
+    async def wait(self):
+        self.menu.interaction = await self.menu.bot.menus.wait(self.menu.message.id, self.check, self.timeout)
+        return self.menu.interaction.custom_id
+
+    async def response(self):
         try:
-            reaction = await self.menu.bot.wait_for(hikari.ReactionAddEvent, timeout=self.timeout, predicate=predicate)
+            r = await self.wait()
         except TimeoutError:
             await self.menu.timeout(chron.long_delta(timedelta(seconds=self.timeout)))
         else:
-            if (r := reaction.emoji_name) == "exit" and self.auto_exit:
+            if r == "exit" and self.auto_exit:
                 await self.menu.stop()
             else:
                 return r
-        
 
     def __repr__(self):
         return (
@@ -141,8 +150,7 @@ class NumericalSelector(Selector):
             "option9": Config.OPTION9_EMOJI_ID
 
         }
-        emoji = await self.menu.bot.rest.fetch_guild(Config.HUB_GUILD_ID)
-        return "\n".join(f"{emoji.get_emoji(emoji_dic[k]).mention} {v}" for k, v in self.pages[self.page].items())
+        return "\n".join(f"{self._emoji(emoji_dic[k]).mention} {v}" for k, v in self.pages[self.page].items())
 
     def set_selection(self):
         s = self._base_selection.copy()
@@ -173,21 +181,17 @@ class NumericalSelector(Selector):
 
         self.selection = s
 
-    async def response(self):
+    def components(self):
         self.set_selection()
+        return super().components()
 
-        if self.selection != self.last_selection:
-            await self._serve()
- 
-        def predicate(event: hikari.ReactionAddEvent) -> bool:
-            return event.user_id == self.menu.ctx.author.id and event.message_id == self.menu.message.id
-
+    async def response(self):
         try:
-            reaction = await self.menu.bot.wait_for(hikari.ReactionAddEvent, timeout=self.timeout, predicate=predicate)
+            r = await self.wait()
         except TimeoutError:
             await self.menu.timeout(chron.long_delta(timedelta(seconds=self.timeout)))
         else:
-            if (r := reaction.emoji_name) == "exit":
+            if r == "exit":
                 if self.auto_exit:
                     await self.menu.stop()
                 return
@@ -202,7 +206,7 @@ class NumericalSelector(Selector):
             else:
                 return self.pages[self.page][r]
 
-            await self.menu.switch(reaction.emoji_name, reaction.emoji_id)
+            await self.menu.turn()
             return await self.response()
 
     def __repr__(self):
@@ -269,21 +273,17 @@ class PageControls(Selector):
 
         self.selection = s
 
-    async def response(self):
+    def components(self):
         self.set_selection()
+        return super().components()
 
-        if self.selection != self.last_selection:
-            await self._serve()
-
-        def predicate(event: hikari.ReactionAddEvent) -> bool:
-            return event.user_id == self.menu.ctx.author.id and event.message_id == self.menu.message.id
-
+    async def response(self):
         try:
-            reaction = await self.menu.bot.wait_for(hikari.ReactionAddEvent, timeout=self.timeout, predicate=predicate)
+            r = await self.wait()
         except TimeoutError:
             await self.menu.timeout(chron.long_delta(timedelta(seconds=self.timeout)))
         else:
-            if (r := reaction.emoji_name) == "exit":
+            if r == "exit":
                 if self.auto_exit:
                     await self.menu.stop()
                 return
@@ -296,7 +296,7 @@ class PageControls(Selector):
             elif r == "stepnext":
                 self.page = self.max_page
 
-            await self.menu.switch(reaction.emoji_name, reaction.emoji_id)
+            await self.menu.turn()
             return await self.response()
 
     def __repr__(self):
@@ -0,0 +1,69 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+import asyncio
+import datetime as dt
+
+from apscheduler.triggers.interval import IntervalTrigger
+
+from solaris.utils import chron
+
+FLUSH_INTERVAL = 5
+# A burst bigger than this is written straight away instead of waiting for the next interval.
+MAX_PENDING_ACTIONS = 100
+
+
+class ActionLog:
+    # Actions are queued in memory and written behind, so a burst of moderation costs one transaction, not one per action.
+    def __init__(self, bot):
+        self.bot = bot
+        self._pending = []
+        self._flushing = None
+
+        self.bot.scheduler.add_job(self.flush, IntervalTrigger(seconds=FLUSH_INTERVAL))
+
+    def record(self, guild_id, mod_id, action, target_id=None, *, channel_id=None, reason=None, count=1):
+        # Matches the format of CURRENT_TIMESTAMP, so it sorts alongside the rest of the database.
+        now = dt.datetime.utcnow().replace(microsecond=0)
+        self._pending.append((guild_id, mod_id, target_id, channel_id, action, reason, count, chron.to_iso(now)))
+
+        if len(self._pending) >= MAX_PENDING_ACTIONS and (self._flushing is None or self._flushing.done()):
+            self._flushing = asyncio.create_task(self.flush())
+
+    async def flush(self):
+        if not self._pending:
+            return
+
+        # Swapped out before the first await, so actions recorded mid-write go into the next batch.
+        batch, self._pending = self._pending, []
+
+        try:
+            await self.bot.db.executemany(
+                "INSERT INTO modactions (GuildID, ModID, TargetID, ChannelID, Action, Reason, Count, ActionTime) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+            await self.bot.db.commit()
+        except Exception:
+            # Put back ahead of anything recorded since, so the next flush retries it in order.
+            self._pending[:0] = batch
+            raise
+
+    def __repr__(self):
+        return f"<ActionLog pending={len(self._pending)!r}>"
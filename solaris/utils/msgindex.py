@@ -0,0 +1,125 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+import datetime as dt
+from collections import OrderedDict, namedtuple
+
+import hikari
+
+MAX_INDEXED_MESSAGES = 5_000
+MAX_INDEXED_AGE = dt.timedelta(days=14)
+
+IndexedMessage = namedtuple("IndexedMessage", ("id", "author_id", "created_at", "flags"))
+
+
+class ChannelBuffer:
+    # Every message with an ID at or above the boundary is known to be in the buffer.
+    # Anything older has to come from REST.
+    def __init__(self, maxsize=MAX_INDEXED_MESSAGES, max_age=MAX_INDEXED_AGE):
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self.boundary = hikari.Snowflake.from_datetime(dt.datetime.now(dt.timezone.utc))
+        self._messages = OrderedDict()
+
+    def add(self, entry):
+        if entry.id < self.boundary:
+            return
+
+        self._messages[entry.id] = entry
+        self.trim()
+
+    def update(self, message_id, flags, *, replace):
+        if (entry := self._messages.get(message_id)) is not None:
+            self._messages[message_id] = entry._replace(flags=flags if replace else entry.flags | flags)
+
+    def discard(self, message_id):
+        self._messages.pop(message_id, None)
+
+    def trim(self):
+        cutoff = dt.datetime.now(dt.timezone.utc) - self.max_age
+
+        while self._messages:
+            oldest = next(iter(self._messages.values()))
+            if len(self._messages) <= self.maxsize and oldest.created_at >= cutoff:
+                break
+
+            self._messages.popitem(last=False)
+            self.boundary = hikari.Snowflake(oldest.id + 1)
+
+    def newest_first(self):
+        return list(reversed(self._messages.values()))
+
+    def __len__(self):
+        return len(self._messages)
+
+    def __repr__(self):
+        return f"<ChannelBuffer size={len(self._messages)!r} boundary={self.boundary!r}>"
+
+
+class MessageIndex:
+    # An opt-in, in-memory record of recent message metadata, fed from gateway events.
+    # `classifiers` maps a flag name to a message predicate, evaluated once when a message is indexed.
+    def __init__(self, classifiers, *, maxsize=MAX_INDEXED_MESSAGES, max_age=MAX_INDEXED_AGE):
+        self.classifiers = classifiers
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self._channels = {}
+
+    def enable(self, channel_id):
+        if channel_id not in self._channels:
+            self._channels[channel_id] = ChannelBuffer(self.maxsize, self.max_age)
+
+    def disable(self, channel_id):
+        self._channels.pop(channel_id, None)
+
+    def get(self, channel_id):
+        return self._channels.get(channel_id)
+
+    def flags(self, message):
+        return frozenset(name for name, check in self.classifiers.items() if check(message))
+
+    def add(self, message):
+        if (buffer := self._channels.get(message.channel_id)) is None:
+            return
+
+        if hikari.MessageFlag.LOADING & message.flags:
+            return
+
+        buffer.add(IndexedMessage(message.id, message.author.id, message.created_at, self.flags(message)))
+
+    def update(self, message):
+        # Link previews arrive as updates without content, so those only ever add flags.
+        if (buffer := self._channels.get(message.channel_id)) is not None:
+            buffer.update(message.id, self.flags(message), replace=message.content is not hikari.UNDEFINED)
+
+    def discard(self, channel_id, *message_ids):
+        if (buffer := self._channels.get(channel_id)) is not None:
+            for message_id in message_ids:
+                buffer.discard(message_id)
+
+    def reset(self):
+        # Events may have been missed, so nothing already indexed can be trusted to be complete.
+        for channel_id in self._channels:
+            self._channels[channel_id] = ChannelBuffer(self.maxsize, self.max_age)
+
+    def __contains__(self, channel_id):
+        return channel_id in self._channels
+
+    def __repr__(self):
+        return f"<MessageIndex channels={len(self._channels)!r}>"
@@ -0,0 +1,54 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+# Group qualname: (command tree version, rows)
+_tables = {}
+
+
+def subcommand_table(group, version, key=None):
+    # Sorting and deduping a group's subcommands only changes when extensions are (re)loaded, which bumps the version.
+    if (cached := _tables.get(group.qualname)) is None or cached[0] != version:
+        cmds = sorted(set(group.subcommands.values()), key=key or (lambda c: c.name))
+        cached = _tables[group.qualname] = (
+            version,
+            tuple(
+                (cmd.name.title(), f"{cmd.description} For more infomation, use `", f"help {group.qualname} {cmd.name}`")
+                for cmd in cmds
+            ),
+        )
+
+    return cached[1]
+
+
+async def group_overview(ctx, *, header, description, thumbnail=None, key=None, fields=()):
+    prefix = await ctx.bot.prefix(ctx.guild_id)
+    version = ctx.bot.command_tree_version
+
+    await ctx.respond(
+        embed=ctx.bot.embed.build(
+            ctx=ctx,
+            header=header,
+            thumbnail=thumbnail,
+            description=description,
+            fields=(
+                *((name, f"{head}{prefix}{tail}", False) for name, head, tail in subcommand_table(ctx.command, version, key)),
+                *fields,
+            ),
+        )
+    )
@@ -0,0 +1,191 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+import asyncio
+import functools
+import itertools
+import multiprocessing
+import re
+import threading
+import time
+
+from solaris.utils.cache import LRUCache
+
+MAX_CACHED_PATTERNS = 128
+MAX_WORKERS = 2
+# Starting a worker means importing the bot, which is slow but shouldn't take anywhere near this long.
+WORKER_START_TIMEOUT = 60
+
+# Each process, including the workers, keeps its own cache.
+_compiled = LRUCache(MAX_CACHED_PATTERNS)
+# Set in each worker, and used to tell the bot when a batch starts.
+_events = None
+
+
+class RegexTimeout(asyncio.TimeoutError):
+    pass
+
+
+def compile(pattern, flags=0):
+    if (regex := _compiled.get((pattern, flags))) is None:
+        regex = re.compile(pattern, flags)
+        _compiled.set((pattern, flags), regex)
+    return regex
+
+
+def announce(ready, events):
+    # Runs in each worker once it has imported this module, which is where almost all of its start-up time goes.
+    global _events
+    _events = events
+    ready.put(None)
+
+
+def match_batch(token, pattern, contents):
+    # Runs inside a worker. Returns the indices of the contents that match, and how long matching them took.
+    # This has to be a SimpleQueue, as a runaway pattern holds the GIL and a Queue's feeder thread would never send it.
+    _events.put(token)
+    started = time.perf_counter()
+    regex = compile(pattern)
+    return [i for i, content in enumerate(contents) if content and regex.match(content)], time.perf_counter() - started
+
+
+class _Restarted(Exception):
+    # Raised into batches that were still in the pool when another pattern's timeout brought it down.
+    pass
+
+
+class RegexPool:
+    # The re module holds the GIL while matching, so a runaway pattern can only be stopped from outside its process.
+    # That takes the whole pool down, so every other batch in it is quietly run again on the new one.
+    def __init__(self, processes=MAX_WORKERS):
+        self.processes = processes
+        self._pool = None
+        self._events = None
+        self._starting = None
+        self._tokens = itertools.count()
+        # Token: (started, finished) futures, for every batch submitted to the current pool.
+        self._batches = {}
+
+    async def warm(self):
+        # Workers are started ahead of time, so a pattern's time budget is only ever spent matching.
+        if (starting := self._starting) is None or starting.done() and (starting.cancelled() or starting.exception()):
+            self.start()
+        await asyncio.shield(self._starting)
+
+    def start(self):
+        self._starting = asyncio.ensure_future(self._start())
+        # A failed start is retried by the next call to warm, so its error is only reported there.
+        self._starting.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    async def _start(self):
+        loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context("spawn")
+        ready, events = context.Queue(), context.SimpleQueue()
+        pool = await loop.run_in_executor(
+            None, functools.partial(context.Pool, self.processes, initializer=announce, initargs=(ready, events))
+        )
+
+        try:
+            for _ in range(self.processes):
+                await loop.run_in_executor(None, functools.partial(ready.get, timeout=WORKER_START_TIMEOUT))
+        except BaseException:
+            pool.terminate()
+            raise
+
+        threading.Thread(target=self._listen, args=(loop, events), daemon=True).start()
+        self._pool, self._events = pool, events
+
+    def _listen(self, loop, events):
+        # Passes on when each batch starts, until its pool is replaced.
+        while (token := events.get()) is not None:
+            loop.call_soon_threadsafe(self._began, token)
+
+    def _began(self, token):
+        if (batch := self._batches.get(token)) is not None and not batch[0].done():
+            batch[0].set_result(None)
+
+    async def match(self, pattern, contents, *, timeout):
+        while True:
+            await self.warm()
+            token = next(self._tokens)
+            started, finished = self._submit(token, pattern, contents)
+
+            try:
+                # Time spent queued behind other batches isn't charged to this one.
+                await started
+                return await asyncio.wait_for(finished, timeout)
+            except _Restarted:
+                # Another pattern took the pool down with this batch still in it. It wasn't at fault, so it runs again.
+                continue
+            except asyncio.TimeoutError:
+                await self.reset()
+                raise RegexTimeout(f"Pattern {pattern!r} exceeded its time budget.") from None
+            finally:
+                self._batches.pop(token, None)
+
+    def _submit(self, token, pattern, contents):
+        loop = asyncio.get_running_loop()
+        started, finished = self._batches[token] = (loop.create_future(), loop.create_future())
+
+        def resolve(result):
+            if not finished.done():
+                finished.set_result(result)
+
+        def reject(error):
+            if not finished.done():
+                finished.set_exception(error)
+
+        self._pool.apply_async(
+            match_batch,
+            (token, pattern, contents),
+            callback=lambda r: loop.call_soon_threadsafe(resolve, r),
+            error_callback=lambda e: loop.call_soon_threadsafe(reject, e),
+        )
+        return started, finished
+
+    async def reset(self):
+        if (pool := self._pool) is None:
+            return
+
+        self._pool = None
+        for started, finished in self._batches.values():
+            # Whichever of the two the batch is waiting on.
+            if not started.done():
+                started.set_exception(_Restarted())
+            elif not finished.done():
+                finished.set_exception(_Restarted())
+        self._batches.clear()
+
+        self._events.put(None)
+        # The replacements start straight away, rather than on the next pattern's budget.
+        self.start()
+        await asyncio.get_running_loop().run_in_executor(None, pool.terminate)
+
+    def close(self):
+        if self._starting is not None:
+            self._starting.cancel()
+            self._starting = None
+
+        if self._pool is not None:
+            self._events.put(None)
+            self._pool.terminate()
+            self._pool = None
+
+    def __repr__(self):
+        return f"<RegexPool processes={self.processes!r} running={self._pool is not None!r}>"
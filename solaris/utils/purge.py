@@ -0,0 +1,242 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+import asyncio
+import datetime as dt
+import time
+
+import hikari
+
+from solaris.utils import patterns
+
+BULK_DELETE_LIMIT = 100
+# Discord refuses to bulk delete anything older than this.
+MAX_MESSAGE_AGE = dt.timedelta(days=14)
+# Keeps a couple of chunks in flight without buffering a whole channel in memory.
+MAX_PENDING_CHUNKS = 4
+# Total time a single user supplied pattern may spend matching during one purge.
+REGEX_BUDGET = 5.0
+
+
+class Predicate:
+    # A message check that can optionally also be answered from a MessageIndex entry.
+    def __init__(self, check, indexed=None):
+        self.check = check
+        self.indexed = indexed
+
+    def __call__(self, message):
+        return self.check(message)
+
+
+def flagged(name, check):
+    return Predicate(check, lambda entry: name in entry.flags)
+
+
+# Ignore deferred typing indicators so they don't get deleted. These are never indexed.
+not_loading = Predicate(lambda message: not (hikari.MessageFlag.LOADING & message.flags), lambda entry: True)
+has_embeds = flagged("embeds", lambda message: bool(message.embeds))
+has_attachments = flagged("attachments", lambda message: bool(message.attachments))
+
+
+def by_authors(*user_ids):
+    user_ids = frozenset(user_ids)
+    return Predicate(lambda message: message.author.id in user_ids, lambda entry: entry.author_id in user_ids)
+
+
+def content_matches(pattern):
+    return lambda message: bool(message.content and pattern.match(message.content))
+
+
+class RegexFilter:
+    # Matches whole pages of message contents in a worker pool, rather than on the event loop.
+    def __init__(self, pool, pattern, *, budget=REGEX_BUDGET):
+        self.pool = pool
+        self.pattern = pattern
+        self.budget = budget
+
+    async def __call__(self, messages):
+        if self.budget <= 0:
+            raise patterns.RegexTimeout(f"Pattern {self.pattern!r} exceeded its time budget.")
+
+        try:
+            matches, spent = await self.pool.match(self.pattern, [m.content for m in messages], timeout=self.budget)
+        except patterns.RegexTimeout:
+            self.budget = 0
+            raise
+
+        # Only time spent matching counts, not time spent queued behind other patterns.
+        self.budget -= spent
+        return [messages[i] for i in matches]
+
+
+class Purge:
+    def __init__(
+        self, bot, channel, predicates, *, filters=(), index=None, limit, on_progress=None, progress_interval=5.0
+    ):
+        self.bot = bot
+        self.channel = channel
+        self.index = index
+        self.predicates = (not_loading, *predicates)
+        # Filters are awaited with a page of messages at a time, after the predicates have run.
+        self.filters = filters
+        self.limit = limit
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+
+        self.ignore = set()
+        self.scanned = 0
+        self.matched = 0
+        self.deleted = 0
+        self.failed = 0
+        self._started = None
+        self._chunk = []
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self._started if self._started is not None else 0.0
+
+    @property
+    def throughput(self):
+        return self.deleted / elapsed if (elapsed := self.elapsed) else 0.0
+
+    def check(self, message):
+        return message.id not in self.ignore and all(p(message) for p in self.predicates)
+
+    async def run(self):
+        self._started = time.monotonic()
+        chunks = asyncio.Queue(MAX_PENDING_CHUNKS)
+        scanner = asyncio.create_task(self._scan(chunks))
+        deleter = asyncio.create_task(self._delete(chunks))
+
+        try:
+            # The deleter only finishes first by failing, and a scan waiting on a full queue would then wait forever.
+            await asyncio.wait((scanner, deleter), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not scanner.done():
+                scanner.cancel()
+
+            # Only a deleter that's still running will ever take the sentinel off the queue.
+            if not deleter.done():
+                await chunks.put(None)
+
+            await deleter
+            await scanner
+
+        return self
+
+    def _buffer(self):
+        # The index only holds metadata, so anything needing message content has to go through REST.
+        if self.index is None or self.filters or not all(getattr(p, "indexed", None) for p in self.predicates):
+            return None
+
+        return self.index.get(self.channel)
+
+    async def _scan(self, chunks):
+        cutoff = dt.datetime.now(dt.timezone.utc) - MAX_MESSAGE_AGE
+        before = hikari.UNDEFINED
+
+        if (buffer := self._buffer()) is not None:
+            if await self._scan_buffer(buffer, cutoff, chunks):
+                return await self._flush(chunks)
+
+            before = buffer.boundary
+
+        await self._scan_rest(cutoff, before, chunks)
+        await self._flush(chunks)
+
+    async def _scan_buffer(self, buffer, cutoff, chunks):
+        page = []
+
+        for entry in buffer.newest_first():
+            if entry.created_at < cutoff:
+                break
+
+            self.scanned += 1
+
+            if entry.id not in self.ignore and all(p.indexed(entry) for p in self.predicates):
+                page.append(entry)
+
+        # Nothing before the boundary needs fetching if the limit was reached or it is already too old to delete.
+        return await self._collect(page, chunks) or buffer.boundary <= hikari.Snowflake.from_datetime(cutoff)
+
+    async def _scan_rest(self, cutoff, before, chunks):
+        page = []
+        last_report = time.monotonic()
+
+        # fetch_messages pages lazily, so the next page is requested while earlier chunks are still being deleted.
+        async for message in self.bot.rest.fetch_messages(self.channel, before=before):
+            if message.created_at < cutoff:
+                break
+
+            self.scanned += 1
+
+            if self.check(message):
+                page.append(message)
+
+            if self.scanned % BULK_DELETE_LIMIT == 0:
+                done, page = await self._collect(page, chunks), []
+                if done:
+                    break
+
+            if self.on_progress is not None and time.monotonic() - last_report >= self.progress_interval:
+                await self.on_progress(self)
+                last_report = time.monotonic()
+
+        await self._collect(page, chunks)
+
+    async def _flush(self, chunks):
+        if self._chunk:
+            await chunks.put(self._chunk)
+            self._chunk = []
+
+    async def _collect(self, page, chunks):
+        for f in self.filters:
+            if page:
+                page = await f(page)
+
+        for message in page[: self.limit - self.matched]:
+            self._chunk.append(message.id)
+            self.matched += 1
+
+            if len(self._chunk) == BULK_DELETE_LIMIT:
+                await chunks.put(self._chunk)
+                self._chunk = []
+
+        return self.matched >= self.limit
+
+    async def _delete(self, chunks):
+        while (chunk := await chunks.get()) is not None:
+            try:
+                await self.bot.rest.delete_messages(self.channel, chunk)
+            except hikari.BulkDeleteError as error:
+                self.deleted += len(error.messages_deleted)
+                self.failed += len(chunk) - len(error.messages_deleted)
+            except hikari.HTTPError:
+                self.failed += len(chunk)
+            else:
+                self.deleted += len(chunk)
+
+    def __repr__(self):
+        return (
+            f"<Purge"
+            f" scanned={self.scanned!r}"
+            f" matched={self.matched!r}"
+            f" deleted={self.deleted!r}"
+            f" failed={self.failed!r}>"
+        )
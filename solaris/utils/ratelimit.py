@@ -0,0 +1,102 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+from array import array
+
+DEFAULT_SIZE = 1 << 17
+# Fibonacci hashing, so snowflakes - whose low bits barely change - still spread across the whole table.
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK = (1 << 64) - 1
+
+
+class SlotTable:
+    # A fixed-size, direct-mapped table of parallel arrays. A slot is taken over by whichever key hashes to it last, so
+    # memory never grows and nothing needs sweeping; a key that gets pushed out simply starts counting from zero again.
+    def __init__(self, size, *typecodes):
+        self.bits = max(size.bit_length() - 1, 1)
+        self.size = 1 << self.bits
+        self._tags = array("q", bytes(8 * self.size))
+        self.columns = tuple(array(code, bytes(array(code).itemsize * self.size)) for code in typecodes)
+
+    def lookup(self, key):
+        # Returns the key's slot, and whether it was the key that already held it. Zero marks an empty slot.
+        tag = hash(key) or 1
+        slot = ((tag * _MULTIPLIER) & _MASK) >> (64 - self.bits)
+
+        if self._tags[slot] == tag:
+            return slot, True
+
+        self._tags[slot] = tag
+        return slot, False
+
+    @property
+    def nbytes(self):
+        return sum(column.itemsize * len(column) for column in (self._tags, *self.columns))
+
+
+class SlidingWindow:
+    # Approximates a sliding window with two fixed ones, weighting the previous window's count by how much of it still
+    # overlaps the sliding one. Two counts and an epoch per slot, and no per-hit timestamps.
+    def __init__(self, window, *, size=DEFAULT_SIZE):
+        self.window = window
+        self._table = SlotTable(size, "q", "I", "I")
+        self._epochs, self._current, self._previous = self._table.columns
+
+    def hit(self, key, now, amount=1):
+        epoch, offset = divmod(now, self.window)
+        epoch = int(epoch)
+        slot, known = self._table.lookup(key)
+
+        if not known:
+            self._epochs[slot] = epoch
+            self._current[slot] = self._previous[slot] = 0
+
+        elif (last := self._epochs[slot]) != epoch:
+            self._previous[slot] = self._current[slot] if last == epoch - 1 else 0
+            self._current[slot] = 0
+            self._epochs[slot] = epoch
+
+        current = self._current[slot] = self._current[slot] + amount
+        return current + self._previous[slot] * (1 - offset / self.window)
+
+    def __repr__(self):
+        return f"<SlidingWindow window={self.window!r} size={self._table.size!r}>"
+
+
+class RepeatCounter:
+    # Counts how many times in a row a key has produced the same content hash, within `window` seconds of the last one.
+    def __init__(self, window, *, size=DEFAULT_SIZE):
+        self.window = window
+        self._table = SlotTable(size, "q", "I", "d")
+        self._digests, self._streaks, self._seen = self._table.columns
+
+    def hit(self, key, digest, now):
+        slot, known = self._table.lookup(key)
+
+        if known and self._digests[slot] == digest and now - self._seen[slot] <= self.window:
+            self._streaks[slot] += 1
+        else:
+            self._digests[slot] = digest
+            self._streaks[slot] = 1
+
+        self._seen[slot] = now
+        return self._streaks[slot]
+
+    def __repr__(self):
+        return f"<RepeatCounter window={self.window!r} size={self._table.size!r}>"
@@ -21,6 +21,11 @@
 # Aoi Yuito (Rewritten author)
 # aoi.yuito.ehou@gmail.com
 
+from collections import Counter, OrderedDict, defaultdict
+
+from rapidfuzz import fuzz, process
+
+
 class Match:
     def __init__(self, term, comparison, case_sensitive=False):
         self.term = term
@@ -113,4 +118,67 @@ class Search:
         return round(self.matches)
 
     def __float__(self, /):
-        return self.matches
\ No newline at end of file
+        return self.matches
+
+
+class NGramIndex:
+    def __init__(self, terms=(), n=3, max_terms=None):
+        self.n = n
+        self.max_terms = max_terms
+        # Kept in order of use, so once `max_terms` is reached the least recently used term makes room for the next.
+        self._terms = OrderedDict()
+        self._grams = defaultdict(set)
+
+        for term in terms:
+            self.add(term)
+
+    def _ngrams(self, term):
+        padded = f"{' ' * (self.n - 1)}{term} "
+        return {padded[i : i + self.n] for i in range(len(padded) - self.n + 1)}
+
+    def add(self, term):
+        # Adding a term that's already indexed counts as using it.
+        if term in self._terms:
+            self._terms.move_to_end(term)
+            return
+
+        if self.max_terms is not None and len(self._terms) >= self.max_terms:
+            self.remove(next(iter(self._terms)))
+
+        self._terms[term] = None
+        for gram in self._ngrams(term):
+            self._grams[gram].add(term)
+
+    def remove(self, term):
+        if term not in self._terms:
+            return
+
+        del self._terms[term]
+        for gram in self._ngrams(term):
+            if (terms := self._grams.get(gram)) is not None:
+                terms.discard(term)
+                if not terms:
+                    del self._grams[gram]
+
+    def candidates(self, term, limit=50):
+        shared = Counter()
+        for gram in self._ngrams(term):
+            shared.update(self._grams.get(gram, ()))
+        return [candidate for candidate, _ in shared.most_common(limit)]
+
+    def closest(self, term, limit=5, min_score=60):
+        return [
+            match
+            for match, score, _ in process.extract(
+                term, self.candidates(term, limit * 10), scorer=fuzz.ratio, limit=limit, score_cutoff=min_score
+            )
+        ]
+
+    def __contains__(self, term):
+        return term in self._terms
+
+    def __len__(self):
+        return len(self._terms)
+
+    def __repr__(self, /):
+        return f"<NGramIndex n={self.n!r} terms={len(self._terms)!r} grams={len(self._grams)!r} max_terms={self.max_terms!r}>"
@@ -0,0 +1,126 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+import json
+from collections import namedtuple
+
+import hikari
+
+ChannelSnapshot = namedtuple(
+    "ChannelSnapshot",
+    (
+        "id",
+        "type",
+        "name",
+        "position",
+        "parent_id",
+        "topic",
+        "nsfw",
+        "rate_limit",
+        "bitrate",
+        "user_limit",
+        "video_quality",
+        "region",
+        "overwrites",
+    ),
+)
+
+CREATE_METHODS = {
+    hikari.ChannelType.GUILD_CATEGORY: "create_guild_category",
+    hikari.ChannelType.GUILD_TEXT: "create_guild_text_channel",
+    hikari.ChannelType.GUILD_NEWS: "create_guild_news_channel",
+    hikari.ChannelType.GUILD_VOICE: "create_guild_voice_channel",
+    hikari.ChannelType.GUILD_STAGE: "create_guild_stage_channel",
+}
+
+# Which snapshot fields each create call accepts, and under what name.
+CREATE_FIELDS = {
+    hikari.ChannelType.GUILD_CATEGORY: {},
+    hikari.ChannelType.GUILD_TEXT: {"topic": "topic", "nsfw": "nsfw", "rate_limit": "rate_limit_per_user"},
+    hikari.ChannelType.GUILD_NEWS: {"topic": "topic", "nsfw": "nsfw"},
+    hikari.ChannelType.GUILD_VOICE: {
+        "bitrate": "bitrate",
+        "user_limit": "user_limit",
+        "video_quality": "video_quality_mode",
+        "region": "region",
+    },
+    hikari.ChannelType.GUILD_STAGE: {"bitrate": "bitrate", "user_limit": "user_limit", "region": "region"},
+}
+
+
+def supported(channel):
+    return channel.type in CREATE_METHODS
+
+
+def take(channel):
+    rate_limit = getattr(channel, "rate_limit_per_user", None)
+    video_quality = getattr(channel, "video_quality_mode", None)
+
+    return ChannelSnapshot(
+        int(channel.id),
+        int(channel.type),
+        channel.name,
+        channel.position,
+        int(channel.parent_id) if channel.parent_id is not None else None,
+        getattr(channel, "topic", None),
+        channel.is_nsfw,
+        int(rate_limit.total_seconds()) if rate_limit is not None else None,
+        getattr(channel, "bitrate", None),
+        getattr(channel, "user_limit", None),
+        int(video_quality) if video_quality is not None else None,
+        getattr(channel, "region", None),
+        tuple((int(o.id), int(o.type), int(o.allow), int(o.deny)) for o in channel.permission_overwrites.values()),
+    )
+
+
+def dumps(snapshot):
+    return json.dumps(snapshot, separators=(",", ":"))
+
+
+def loads(data):
+    return ChannelSnapshot(*json.loads(data))
+
+
+async def restore(rest, guild, snapshot, *, reason=hikari.UNDEFINED):
+    type_ = hikari.ChannelType(snapshot.type)
+    # Unset values are left out entirely, as hikari would otherwise send them as explicit nulls.
+    kwargs = {
+        name: value
+        for field, name in CREATE_FIELDS[type_].items()
+        if (value := getattr(snapshot, field)) is not None
+    }
+
+    if snapshot.parent_id is not None and type_ != hikari.ChannelType.GUILD_CATEGORY:
+        kwargs["category"] = snapshot.parent_id
+
+    channel = await getattr(rest, CREATE_METHODS[type_])(
+        guild,
+        snapshot.name,
+        position=snapshot.position,
+        permission_overwrites=[
+            hikari.PermissionOverwrite(id=target, type=kind, allow=allow, deny=deny)
+            for target, kind, allow, deny in snapshot.overwrites
+        ],
+        reason=reason,
+        **kwargs,
+    )
+
+    # Discord breaks position ties by ID, so the new channel has to be moved back into place explicitly.
+    await rest.reposition_channels(guild, {snapshot.position: channel})
+    return channel
@@ -0,0 +1,104 @@
+# Solaris - A Discord bot designed to make your server a safer and better place.
+# Copyright (C) 2021-present  Aoi Yuito
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Aoi Yuito
+# aoi.yuito.ehou@gmail.com
+
+from collections import Counter
+
+import hikari
+
+ONLINE_STATUSES = (hikari.Status.ONLINE, hikari.Status.IDLE, hikari.Status.DO_NOT_DISTURB)
+
+
+class GuildStats:
+    # Every count serverinfo shows, built in one pass over each collection and then kept up to date from gateway events,
+    # so reading them never walks the guild again.
+    def __init__(self):
+        self.members = 0
+        self.bots = 0
+        self.boosters = 0
+        self.channels = Counter()
+        self.statuses = Counter()
+        # Only members who aren't offline are kept, so a member leaving can take their status with them.
+        self._status_of = {}
+        self.newest = None
+        # Unknown until fetched once, then kept up to date from ban events.
+        self.bans = None
+
+    @classmethod
+    def build(cls, members, presences, channels):
+        stats = cls()
+
+        for member in members:
+            stats.add_member(member)
+
+        for presence in presences:
+            stats.set_status(presence.user_id, presence.visible_status)
+
+        for channel in channels:
+            stats.channels[channel.type] += 1
+
+        return stats
+
+    @property
+    def humans(self):
+        return self.members - self.bots
+
+    @property
+    def offline(self):
+        return self.members - sum(self.statuses.values())
+
+    def add_member(self, member):
+        self.members += 1
+        self.bots += member.is_bot
+        self.boosters += member.premium_since is not None
+
+        # Someone joining is always the newest member, even if who came before them is no longer known.
+        if self.newest is None or member.joined_at > self.newest[0]:
+            self.newest = (member.joined_at, member.id)
+
+    def remove_member(self, user, old_member=None):
+        self.members -= 1
+        self.bots -= user.is_bot
+        self.set_status(user.id, hikari.Status.OFFLINE)
+
+        if old_member is not None:
+            self.boosters -= old_member.premium_since is not None
+
+        if self.newest is not None and self.newest[1] == user.id:
+            # Finding the next newest needs the whole member list, so it's left until someone actually asks.
+            self.newest = None
+
+    def update_member(self, old_member, member):
+        self.boosters += (member.premium_since is not None) - (old_member.premium_since is not None)
+
+    def set_status(self, user_id, status):
+        if (old := self._status_of.pop(user_id, None)) is not None:
+            self.statuses[old] -= 1
+
+        if status in ONLINE_STATUSES:
+            self._status_of[user_id] = status
+            self.statuses[status] += 1
+
+    def find_newest(self, members):
+        if (newest := max(members, key=lambda m: m.joined_at, default=None)) is not None:
+            self.newest = (newest.joined_at, newest.id)
+
+        return self.newest
+
+    def __repr__(self):
+        return f"<GuildStats members={self.members!r} bots={self.bots!r} channels={sum(self.channels.values())!r}>"